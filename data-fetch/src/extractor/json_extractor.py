@@ -374,7 +374,7 @@ class JsonExtractor:
                     if "<" in val and ">" in val:
                         try:
                             # Parse and extract text
-                            soup = BeautifulSoup(val, "html.parser")
+                            soup = BeautifulSoup(val, "lxml")
                             cleaned = soup.get_text(separator=" ", strip=True)
                             # Also decode HTML entities
                             cleaned = html.unescape(cleaned)
@@ -4,14 +4,19 @@ Provides lifecycle methods and common error handling.
 """
 
 import time
+import json
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.logger import get_logger
 from ..utils.robots import check_robots_permission, RobotsDecision, RobotsStatus
-from ..utils.io_utils import save_raw_response, generate_run_id
+from ..utils.io_utils import save_raw_response, generate_run_id, get_output_path
 from ..utils.config_manager import SiteConfig
 from ..utils.auth_manager import AuthManager
 
@@ -55,6 +60,15 @@ class BaseScraper(ABC):
     Provides lifecycle methods and common functionality.
     """
     
+    # Connection pool sizing for the shared HTTP session
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 8
+    # Transport-level retries for the shared HTTP session (int or urllib3 Retry)
+    HTTP_MAX_RETRIES = 0
+    # Reuse the last parsed DataFrame when scrape() fetches a byte-identical
+    # str/bytes payload again (only safe when parse_raw depends on content alone)
+    MEMOIZE_PARSE = False
+    
     def __init__(
         self,
         config: Optional[SiteConfig] = None,
@@ -90,6 +104,8 @@ class BaseScraper(ABC):
         
         self._run_id: Optional[str] = None
         self._robots_decision: Optional[RobotsDecision] = None
+        self._session: Optional[requests.Session] = None
+        self._parse_cache: Optional[Tuple[bytes, pd.DataFrame]] = None  # (content digest, parsed frame)
     
     @property
     def site_id(self) -> str:
@@ -103,6 +119,174 @@ class BaseScraper(ABC):
             self._run_id = generate_run_id(self.site_id)
         return self._run_id
     
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the HTTP session for this scraper, creating it on first use.
+        
+        The session keeps connections alive and pooled, so repeated requests
+        to the same host (retries, multi-step APIs) skip the TCP/TLS handshake.
+        Retries are left to the scraper's own retry logic unless a subclass
+        sets HTTP_MAX_RETRIES.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=self.HTTP_POOL_MAXSIZE,
+                max_retries=self.HTTP_MAX_RETRIES,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+    
+    def _cache_ttl(self) -> int:
+        """Get the on-disk cache TTL in seconds (0 when caching is off or bypassed)."""
+        if not self.config or self.config.data_source.force_refresh:
+            return 0
+        return self.config.data_source.cache_ttl
+    
+    def _http_cache_paths(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Path, Path]:
+        """Get the on-disk (metadata, body) cache files for a URL and its query params."""
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        # Hash the URL so API keys in the query string never end up in file names
+        key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return (
+            get_output_path(f"{key}.json", "http_cache", self.site_id),
+            get_output_path(f"{key}.body", "http_cache", self.site_id),
+        )
+    
+    def _cached_get(self, url: str, cache_ttl: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        GET a URL through the session, reusing a cached response when possible.
+        
+        With data_source.cache_ttl set, a 200 response is stored on disk with its
+        ETag/Last-Modified validators. Within the TTL the stored response is
+        returned without a request; after it, the request is made conditional
+        and a 304 Not Modified returns the stored body. Without a TTL (or with
+        data_source.force_refresh) this is a plain session GET.
+        
+        Args:
+            url: URL to fetch
+            cache_ttl: Seconds to reuse a cached response (default: _cache_ttl())
+            **kwargs: Passed to requests.Session.get
+        
+        Returns:
+            The live response, or a 200 response rebuilt from the cache
+        """
+        if cache_ttl is None:
+            cache_ttl = self._cache_ttl()
+        if not cache_ttl:
+            return self.session.get(url, **kwargs)
+        
+        meta_path, body_path = self._http_cache_paths(url, kwargs.get("params"))
+        meta, body = self._read_http_cache(meta_path, body_path)
+        
+        if meta is not None and time.time() - meta.get("fetched_at", 0) <= cache_ttl:
+            return self._cached_response(url, meta, body)
+        
+        if meta is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            kwargs["headers"] = headers
+        
+        response = self.session.get(url, **kwargs)
+        
+        if response.status_code == 304 and meta is not None:
+            self.logger.info("Not modified upstream, using cached response")
+            meta["fetched_at"] = time.time()
+        elif response.status_code == 200:
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_type": response.headers.get("Content-Type"),
+                "encoding": response.encoding,
+                "fetched_at": time.time(),
+            }
+            body = None
+        else:
+            return response
+        
+        try:
+            if body is None:
+                body_path.write_bytes(response.content)
+            meta_path.write_text(json.dumps(meta))
+        except OSError as e:
+            self.logger.warning(f"Could not cache response: {e}")
+        
+        return response if body is None else self._cached_response(url, meta, body)
+    
+    @staticmethod
+    def _read_http_cache(meta_path: Path, body_path: Path) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Read a cached response's metadata and body ((None, None) if missing or corrupt)."""
+        try:
+            return json.loads(meta_path.read_text()), body_path.read_bytes()
+        except (OSError, ValueError):
+            return None, None
+    
+    def _fresh_cached_response(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[int] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Get a URL's cached response if it is still within the cache TTL.
+        
+        Lets callers skip rate limiting and other request setup when
+        _cached_get would not touch the network anyway.
+        
+        Args:
+            url: URL that would be fetched
+            params: Query parameters that would be sent
+            cache_ttl: Seconds to reuse a cached response (default: _cache_ttl())
+        
+        Returns:
+            200 response rebuilt from the cache, or None
+        """
+        if cache_ttl is None:
+            cache_ttl = self._cache_ttl()
+        if not cache_ttl:
+            return None
+        
+        meta, body = self._read_http_cache(*self._http_cache_paths(url, params))
+        if meta is None or time.time() - meta.get("fetched_at", 0) > cache_ttl:
+            return None
+        return self._cached_response(url, meta, body)
+    
+    @staticmethod
+    def _cached_response(url: str, meta: Dict[str, Any], body: bytes) -> requests.Response:
+        """Rebuild a 200 response from a cached body and its metadata."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.encoding = meta.get("encoding")
+        if meta.get("content_type"):
+            response.headers["Content-Type"] = meta["content_type"]
+        return response
+    
+    def _discard_cached_response(self, url: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Remove a URL's cached response, e.g. when its body turned out to be an API error."""
+        for path in self._http_cache_paths(url, params):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Could not remove cached response {path}: {e}")
+    
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
     def check_compliance(self, url: str, override: bool = False) -> RobotsDecision:
         """
         Check robots.txt compliance for a URL.
@@ -263,6 +447,69 @@ class BaseScraper(ABC):
             return self.auth_manager.get_cookies(self.site_id)
         return []
     
+    def _can_memoize_parse(self, raw_data: Dict[str, Any]) -> bool:
+        """
+        Check whether parse_raw's output for this payload depends on its content alone.
+        
+        Scrapers whose parse_raw stamps rows with the current time (or reads other
+        state) for some payloads override this to keep those out of the memo.
+        
+        Args:
+            raw_data: Raw data from fetch_raw
+        
+        Returns:
+            True if an identical payload may reuse the last parsed frame
+        """
+        return True
+    
+    def _parse_memoized(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Parse raw data, skipping parse_raw when the content is unchanged.
+        
+        The last parsed frame is kept with a blake2b digest of the payload's
+        type, endpoint and str/bytes content; an identical payload gets a copy
+        of that frame back.
+        
+        Args:
+            raw_data: Raw data from fetch_raw
+        
+        Returns:
+            Parsed DataFrame
+        """
+        content = raw_data.get("content")
+        if not isinstance(content, (str, bytes)) or not self._can_memoize_parse(raw_data):
+            return self.parse_raw(raw_data)
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        for key in ("type", "endpoint_url"):
+            hasher.update(str(raw_data.get(key)).encode())
+            hasher.update(b"\0")
+        hasher.update(content.encode() if isinstance(content, str) else content)
+        digest = hasher.digest()
+        if self._parse_cache is not None and self._parse_cache[0] == digest:
+            self.logger.info("Content unchanged since last parse, reusing parsed data")
+            return self._parse_cache[1].copy()
+        
+        df = self.parse_raw(raw_data)
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            self._parse_cache = (digest, df.copy())
+        return df
+    
+    def get_raw_content(self, raw_data: Dict[str, Any]) -> Any:
+        """
+        Get the part of a fetch_raw result that is saved as the raw response.
+        
+        Only called when the raw response is actually saved, so scrapers that
+        keep in-memory objects in raw_data can serialize them here.
+        
+        Args:
+            raw_data: Raw data from fetch_raw
+        
+        Returns:
+            Content to pass to save_raw_response
+        """
+        return raw_data.get("content", raw_data)
+    
     def _get_retry_delay(self, error_type: str, attempt: int) -> float:
         """
         Get retry delay based on error type and attempt number.
@@ -401,7 +648,7 @@ class BaseScraper(ABC):
             # Save raw response
             if save_raw and raw_data:
                 raw_path = save_raw_response(
-                    raw_data.get("content", raw_data),
+                    self.get_raw_content(raw_data),
                     "response",
                     self.site_id,
                     self.run_id,
@@ -411,7 +658,7 @@ class BaseScraper(ABC):
             
             # Step 3: Parse data
             self.logger.info("Parsing raw data...")
-            df = self.parse_raw(raw_data)
+            df = self._parse_memoized(raw_data) if self.MEMOIZE_PARSE else self.parse_raw(raw_data)
             
             # Fix: Use proper pandas checks to avoid ambiguous truth value error
             if df is None or (isinstance(df, pd.DataFrame) and df.empty):
@@ -6,11 +6,14 @@ Uses browser automation to extract data from CoinGlass pages.
 import json
 import re
 import asyncio
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from .base_scraper import BaseScraper, ScraperResult
 from ..utils.logger import get_logger
@@ -53,12 +56,289 @@ class CoinGlassMetrics:
     eth_liquidations_24h: Optional[float] = None
 
 
+# Numeric parsing lookup tables
+_NEG_SIGNS = frozenset(("-", "–", "−", "—"))  # Regular, en-dash, minus, em-dash
+_SUFFIX_MULT = {
+    "B": 1e9,
+    "b": 1e9,
+    "M": 1e6,
+    "m": 1e6,
+    "K": 1e3,
+    "k": 1e3,
+}
+
+
+@lru_cache(maxsize=4096)
+def _split_numeric(value: str) -> Tuple[str, bool, Optional[float]]:
+    """
+    Strip currency, sign and suffix from a raw numeric string and parse it.
+    
+    Pure and cached, since the same raw strings ("$1.23B", "456M") recur
+    across pages; policy checks and logging stay with the caller.
+    
+    Returns:
+        Tuple of (cleaned text without sign, had leading minus sign,
+        unsigned value or None if it does not parse)
+    """
+    # Remove whitespace and currency symbols
+    value = value.strip().replace("$", "").replace(",", "").replace(" ", "")
+    
+    # Handle negative values - check for various minus signs
+    is_negative = value[:1] in _NEG_SIGNS
+    if is_negative:
+        value = value[1:].strip()
+    
+    # Handle suffixes (B, M, K) - suffixes are single characters, so one lookup suffices
+    multiplier = _SUFFIX_MULT.get(value[-1:], 1)
+    number = value[:-1] if multiplier != 1 else value
+    
+    try:
+        return value, is_negative, float(number) * multiplier
+    except ValueError:
+        return value, is_negative, None
+
+
+def _compile_patterns(patterns, flags=re.IGNORECASE):
+    """Compile a list of regex strings with shared flags."""
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def _compile_anchored_patterns(patterns, flags=re.IGNORECASE):
+    """
+    Compile (anchor, regex) pairs with shared flags.
+    
+    The anchor is a lowercase literal the regex cannot match without, so
+    callers can skip the regex scan when it is absent from the lowered page.
+    """
+    return [(anchor, re.compile(pattern, flags)) for anchor, pattern in patterns]
+
+
+def _compile_scaled_patterns(patterns, flags=re.IGNORECASE):
+    """
+    Compile (anchor, regex, scale) triples with shared flags.
+    
+    Like _compile_anchored_patterns, with a multiplier for patterns whose
+    captured number is in a spelled-out unit (e.g. "million").
+    """
+    return [(anchor, re.compile(pattern, flags), scale) for anchor, pattern, scale in patterns]
+
+
+def _label_pattern(field_name: str) -> "re.Pattern":
+    """Build the generic '<Field Label>: $value' pattern for a metrics field."""
+    field_label = field_name.replace("_", " ").title()
+    return re.compile(rf'{field_label}[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE)
+
+
 class CoinGlassScraper(BaseScraper):
     """
     Browser-based scraper for CoinGlass.
     Extracts data from rendered pages using DOM extraction and JavaScript evaluation.
     """
     
+    # Regex patterns are compiled once at class load and shared by all instances
+    NUMBER_PATTERN = re.compile(r'[\d,]+\.?\d*[BMK]?')
+    
+    # BTC Overview text patterns (tried in order per field), each paired with
+    # the keyword it needs so pages without that keyword skip the regex scan
+    OVERVIEW_PATTERNS = {
+        "btc_price": _compile_anchored_patterns([
+            ("btc", r'\$?([\d,]+\.?\d*)\s*BTC'),
+            ("btc", r'BTC[:\s]*\$?([\d,]+\.?\d*)'),
+            ("price", r'Price[:\s]*\$?([\d,]+\.?\d*)'),
+        ]),
+        "futures_volume_24h": _compile_anchored_patterns([
+            ("futures", r'Futures\s+Volume[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+            ("futures", r'24h\s+Futures[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+        ]),
+        "spot_volume_24h": _compile_anchored_patterns([
+            ("spot", r'Spot\s+Volume[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+            ("spot", r'24h\s+Spot[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+        ]),
+        "open_interest": _compile_anchored_patterns([
+            ("interest", r'Open\s+Interest[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+            ("oi", r'OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+            ("interest", r'Open\s+Interest\s+\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+        ]),
+        "net_inflow_24h": _compile_anchored_patterns([
+            ("inflow", r'Net\s+Inflow[:\s]*\$?([\d,]+\.?\d*[BMK]?)'),
+        ]),
+    }
+    
+    # Open Interest patterns searched in the page text content
+    OI_TEXT_PATTERNS = _compile_patterns([
+        r'Open\s+Interest[:\s]*\$?\s*([\d,]+\.?\d*[BMK]?)',
+        r'OI[:\s]*\$?\s*([\d,]+\.?\d*[BMK]?)',
+    ])
+    
+    # Derivatives snapshot patterns
+    DERIVATIVES_PATTERNS = {
+        "futures_oi_all_exchanges": _compile_patterns([
+            r'Futures\s+OI[:\s]*\(All\s+Exchanges\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'Total\s+Futures\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'Futures\s+Open\s+Interest[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+        ]),
+        "cme_btc_oi": _compile_patterns([
+            r'CME\s+BTC\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'CME[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+        ]),
+        "binance_btc_oi": _compile_patterns([
+            r'Binance\s+BTC\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'Binance[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+        ]),
+        "btc_options_calls_oi": _compile_patterns([
+            r'BTC\s+Options\s+Calls\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'Calls\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+        ]),
+        "btc_options_puts_oi": _compile_patterns([
+            r'BTC\s+Options\s+Puts\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+            r'Puts\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
+        ]),
+    }
+    DERIVATIVES_LABEL_PATTERNS = {
+        field_name: _label_pattern(field_name)
+        for field_name in DERIVATIVES_PATTERNS
+    }
+    
+    # Liquidations patterns (fallback to HTML extraction), anchored like the
+    # overview patterns and tagged with the unit the captured number is in
+    LIQUIDATION_PATTERNS = {
+        "total_liquidations_24h": _compile_scaled_patterns([
+            ("comes", r'total\s+liquidations[:\s]*comes\s+in\s+at\s+\$?([\d,]+\.?\d*)\s*million', 1e6),  # Match "million" text FIRST (most specific)
+            ("rekt", r'24h\s+Rekt[^>]*Total[^>]*Rekt[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),  # Match from 24h Rekt card
+            ("liquidations", r'Total\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'Total\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'24h\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+        ]),
+        "long_liquidations": _compile_scaled_patterns([
+            ("rekt", r'24h\s+Rekt[^>]*Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),  # Match Long from 24h Rekt card
+            ("long", r'Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)[^<]*24h', 1),  # Match Long with 24h context
+            ("liquidations", r'Long\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'Long\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            # Removed generic "Long[:\s]*\$?" pattern - it matches "Long1" incorrectly
+        ]),
+        "short_liquidations": _compile_scaled_patterns([
+            ("rekt", r'24h\s+Rekt[^>]*Short[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),  # Match Short from 24h Rekt card
+            ("short", r'Short[:\s]*\$?([\d,]+\.?\d*[BMK]?)[^<]*24h', 1),  # Match Short with 24h context
+            ("liquidations", r'Short\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'Short\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            # Removed generic "Short[:\s]*\$?" pattern - it matches "Short1" incorrectly
+        ]),
+        "btc_liquidations_24h": _compile_scaled_patterns([
+            ("liquidations", r'BTC\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'BTC[:\s]*Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("long", r'BTC[:\s]*24h\s+Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+        ]),
+        "eth_liquidations_24h": _compile_scaled_patterns([
+            ("liquidations", r'ETH\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("liquidations", r'ETH[:\s]*Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+            ("long", r'ETH[:\s]*24h\s+Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)', 1),
+        ]),
+    }
+    LIQUIDATION_LABEL_PATTERNS = {
+        field_name: _label_pattern(field_name)
+        for field_name in ("btc_liquidations_24h", "eth_liquidations_24h")
+    }
+    
+    # 24h Rekt card detection - candidates are walked lazily in document order
+    # and matched with plain substring checks so the search stops at the first hit
+    REKT_CARD_TAGS = ("div", "section", "article", "card")
+    REKT_TEXT_TAGS = ("div", "section", "article")
+    REKT_CLASS_NEEDLES = ("24h", "rekt")
+    REKT_CARD_FIELDS = ("total_liquidations_24h", "long_liquidations", "short_liquidations")
+    WORD_24H_PATTERN = re.compile(r'\b24h\b', re.I)
+    WORD_SHORT_TIMEFRAME_PATTERN = re.compile(r'\b(1h|4h|12h)\b', re.I)
+    
+    # Pattern: "24h Rekt" followed by Total Rekt value, then Long, then Short.
+    # Gaps that may contain digits are bounded: chained unbounded [^$]* gaps
+    # backtrack polynomially on long digit-heavy text without a match.
+    REKT_24H_PATTERNS = _compile_patterns([
+        r'24h\s+rekt[^0-9]*total[^0-9]*rekt[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^0-9]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^0-9]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',
+        r'24h\s+rekt[^$]{0,200}\$?([\d,]+\.?\d*[bmk]?)[^$]{0,200}long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^$]{0,200}short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',
+    ])
+    
+    # Look for "Long: $X.XXM" / "Short: $X.XXM" specifically in 24h Rekt card context
+    LONG_FALLBACK_PATTERNS = _compile_patterns([
+        r'24h\s+rekt[^$]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # From 24h Rekt card
+        r'long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^<]*24h\s+rekt',  # Long with 24h Rekt after
+        r'24h[^$]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # Any 24h context with Long
+    ])
+    SHORT_FALLBACK_PATTERNS = _compile_patterns([
+        r'24h\s+rekt[^$]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # From 24h Rekt card
+        r'short[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^<]*24h\s+rekt',  # Short with 24h Rekt after
+        r'24h[^$]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # Any 24h context with Short
+    ])
+    
+    # Look for "comes in at $X.XX million" or from 24h Rekt card
+    RE_COMES_IN_AT = re.compile(r'comes\s+in\s+at\s+\$?([\d,]+\.?\d*)\s*million', re.IGNORECASE)
+    RE_TOTAL_COMES_IN_AT = re.compile(r'total\s+liquidations[:\s]*comes\s+in\s+at\s+\$?([\d,]+\.?\d*[bmk]?)', re.IGNORECASE)
+    RE_REKT_TOTAL = re.compile(r'24h\s+rekt[^$]{0,200}total[^$]{0,200}rekt[:\s]*\$?([\d,]+\.?\d*[bmk]?)', re.IGNORECASE)
+    RE_REKT_TOTAL_ALT = re.compile(r'24h\s+rekt[^$]{0,200}\$?([\d,]+\.?\d*[bmk]?)[^$]{0,200}total', re.IGNORECASE)
+    
+    # Liquidations in text/CSV API responses
+    LIQUIDATION_TEXT_PATTERNS = {
+        "total_liquidations_24h": re.compile(r'total[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "long_liquidations": re.compile(r'long[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "short_liquidations": re.compile(r'short[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+    }
+    
+    # Spot inflow/outflow timeframes
+    TIMEFRAME_PATTERNS = {
+        "net_inflow_5min": re.compile(r'5\s*min[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "net_inflow_1h": re.compile(r'1\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "net_inflow_4h": re.compile(r'4\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "net_inflow_12h": re.compile(r'12\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+        "net_inflow_24h": re.compile(r'24\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)', re.IGNORECASE),
+    }
+    
+    # Volatility per coin (ticker first, then full name), anchored on the coin name
+    VOLATILITY_PATTERNS = {
+        field_name: _compile_anchored_patterns([
+            (coin_name.lower(), rf'{coin_name}[:\s]*([\d,]+\.?\d*)\s*%?') for coin_name in coin_names
+        ])
+        for field_name, coin_names in {
+            "btc_volatility_1d": ["BTC", "Bitcoin"],
+            "eth_volatility_1d": ["ETH", "Ethereum"],
+            "sol_volatility_1d": ["SOL", "Solana"],
+            "xrp_volatility_1d": ["XRP", "Ripple"],
+            "doge_volatility_1d": ["DOGE", "Dogecoin"],
+        }.items()
+    }
+    
+    # Key fragments (lowercased) used to locate fields in nested JSON
+    JS_FIELD_KEYS = {
+        "btc_price": ("price", "btc", "bitcoin"),
+        "futures_volume_24h": ("futures", "volume", "24h"),
+        "spot_volume_24h": ("spot", "volume", "24h"),
+        "open_interest": ("open", "interest", "oi"),
+        "net_inflow_24h": ("inflow", "net", "24h"),
+    }
+    API_FIELD_KEYS = {
+        "open_interest": ("open", "interest", "oi", "openinterest", "total_oi"),
+        "btc_price": ("price", "btc", "bitcoin"),
+        "futures_volume_24h": ("futures", "volume", "24h"),
+        "spot_volume_24h": ("spot", "volume", "24h"),
+        "net_inflow_24h": ("inflow", "net", "24h"),
+        # Derivatives snapshot fields
+        "futures_oi_all_exchanges": ("futures", "oi", "all", "exchanges"),
+        "cme_btc_oi": ("cme", "btc", "oi"),
+        "binance_btc_oi": ("binance", "btc", "oi"),
+        "btc_options_calls_oi": ("btc", "options", "calls", "oi"),
+        "btc_options_puts_oi": ("btc", "options", "puts", "oi"),
+        # Liquidations fields
+        "total_liquidations_24h": ("total", "liquidations", "24h"),
+        "long_liquidations": ("long", "liquidations"),
+        "short_liquidations": ("short", "liquidations"),
+        "btc_liquidations_24h": ("btc", "liquidations", "24h"),
+        "eth_liquidations_24h": ("eth", "liquidations", "24h"),
+    }
+    API_LIQUIDATION_FIELD_KEYS = {
+        "total_liquidations_24h": ("total", "liquidations", "24h", "24", "totalliquidations"),
+        "long_liquidations": ("long", "liquidations", "longliquidations"),
+        "short_liquidations": ("short", "liquidations", "shortliquidations"),
+        "btc_liquidations_24h": ("btc", "liquidations", "24h", "bitcoin"),
+        "eth_liquidations_24h": ("eth", "liquidations", "24h", "ethereum"),
+    }
+    
     def __init__(
         self,
         config: Optional[SiteConfig] = None,
@@ -293,25 +573,30 @@ class CoinGlassScraper(BaseScraper):
         soup = BeautifulSoup(html, "lxml")
         metrics = CoinGlassMetrics()
         
+        # Derive page text once and share it between extractors
+        text_content = soup.get_text()
+        html_lower = html.lower()
+        url_lower = url.lower()
+        
         # Extract based on page type
-        if "/currencies/BTC" in url or "/currencies/bitcoin" in url.lower():
+        if "/currencies/BTC" in url or "/currencies/bitcoin" in url_lower:
             # BTC Overview page - check if it's derivatives snapshot or overview
-            if "derivatives" in url.lower() or "snapshot" in url.lower():
-                metrics = self._extract_derivatives_snapshot(soup, html, js_data)
+            if "derivatives" in url_lower or "snapshot" in url_lower:
+                metrics = self._extract_derivatives_snapshot(soup, html, js_data, text_content)
             else:
-                metrics = self._extract_btc_overview(soup, html, js_data)
-        elif "liquidations" in url.lower() or "liquidationdata" in url.lower():
+                metrics = self._extract_btc_overview(soup, html, js_data, text_content, html_lower)
+        elif "liquidations" in url_lower or "liquidationdata" in url_lower:
             # Liquidations page
-            metrics = self._extract_liquidations(soup, html, js_data)
-        elif "inflow" in url.lower() or "outflow" in url.lower():
+            metrics = self._extract_liquidations(soup, html, js_data, text_content, html_lower)
+        elif "inflow" in url_lower or "outflow" in url_lower:
             # Spot Inflow/Outflow page
             metrics = self._extract_spot_flows(soup, html, js_data)
-        elif "volatility" in url.lower():
+        elif "volatility" in url_lower:
             # Volatility page
-            metrics = self._extract_volatility(soup, html, js_data)
+            metrics = self._extract_volatility(soup, html, js_data, html_lower)
         else:
             # Try to extract all metrics from any page
-            metrics = self._extract_all_metrics(soup, html, js_data)
+            metrics = self._extract_all_metrics(soup, html, js_data, text_content, html_lower)
         
         # Convert to DataFrame
         data_dict = {
@@ -339,42 +624,21 @@ class CoinGlassScraper(BaseScraper):
         soup: BeautifulSoup,
         html: str,
         js_data: Optional[Dict],
+        text_content: Optional[str] = None,
+        html_lower: Optional[str] = None,
     ) -> CoinGlassMetrics:
         """Extract metrics from BTC Overview page."""
         metrics = CoinGlassMetrics()
+        if html_lower is None:
+            html_lower = html.lower()
         
         # Try multiple extraction methods
         # Method 1: Extract from text patterns
-        patterns = {
-            "btc_price": [
-                r'\$?([\d,]+\.?\d*)\s*BTC',
-                r'BTC[:\s]*\$?([\d,]+\.?\d*)',
-                r'Price[:\s]*\$?([\d,]+\.?\d*)',
-            ],
-            "futures_volume_24h": [
-                r'Futures\s+Volume[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'24h\s+Futures[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "spot_volume_24h": [
-                r'Spot\s+Volume[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'24h\s+Spot[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "open_interest": [
-                r'Open\s+Interest[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Open\s+Interest[:\s]*([\d,]+\.?\d*[BMK]?)\s*USD',
-                r'Total\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Open\s+Interest\s+\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "net_inflow_24h": [
-                r'Net\s+Inflow[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'24h\s+Net\s+Inflow[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-        }
-        
-        for field_name, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, html, re.IGNORECASE)
+        for field_name, pattern_list in self.OVERVIEW_PATTERNS.items():
+            for anchor, pattern in pattern_list:
+                if anchor not in html_lower:
+                    continue
+                match = pattern.search(html)
                 if match:
                     # Net inflow can be negative, so allow it
                     value = self._parse_numeric_value(match.group(1), allow_negative=True)
@@ -420,46 +684,45 @@ class CoinGlassScraper(BaseScraper):
             'div:contains("Open Interest")',
         ]
         
-        for selector in oi_selectors:
-            try:
-                elements = soup.select(selector)
-                for elem in elements:
-                    text = elem.get_text()
-                    # Look for numbers in the element or its children
-                    numbers = re.findall(r'[\d,]+\.?\d*[BMK]?', text)
-                    for num_str in numbers:
-                        value = self._parse_numeric_value(num_str)
-                        if value is not None and value > 0:
-                            if metrics.open_interest is None:
-                                metrics.open_interest = value
-                                self.logger.debug(f"Found Open Interest via selector {selector}: {value}")
-                                break
-                    if metrics.open_interest is not None:
-                        break
-            except Exception as e:
-                self.logger.debug(f"Selector {selector} failed: {e}")
-            
-            if metrics.open_interest is not None:
-                break
+        # The selector and text sweeps below only ever fill Open Interest
+        if metrics.open_interest is None:
+            for selector in oi_selectors:
+                try:
+                    elements = soup.select(selector)
+                    for elem in elements:
+                        text = elem.get_text()
+                        # Look for numbers in the element or its children
+                        numbers = self.NUMBER_PATTERN.findall(text)
+                        for num_str in numbers:
+                            value = self._parse_numeric_value(num_str)
+                            if value is not None and value > 0:
+                                if metrics.open_interest is None:
+                                    metrics.open_interest = value
+                                    self.logger.debug(f"Found Open Interest via selector {selector}: {value}")
+                                    break
+                        if metrics.open_interest is not None:
+                            break
+                except Exception as e:
+                    self.logger.debug(f"Selector {selector} failed: {e}")
+                
+                if metrics.open_interest is not None:
+                    break
         
         # Method 2c: Search in text content for OI patterns near numbers
-        text_content = soup.get_text()
-        oi_patterns = [
-            r'Open\s+Interest[:\s]*\$?\s*([\d,]+\.?\d*[BMK]?)',
-            r'OI[:\s]*\$?\s*([\d,]+\.?\d*[BMK]?)',
-            r'Total\s+Open\s+Interest[:\s]*\$?\s*([\d,]+\.?\d*[BMK]?)',
-        ]
-        for pattern in oi_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                value = self._parse_numeric_value(match.group(1))
-                if value is not None and value > 0:
-                    if metrics.open_interest is None:
-                        metrics.open_interest = value
-                        self.logger.debug(f"Found Open Interest via text pattern: {value}")
-                        break
-            if metrics.open_interest is not None:
-                break
+        if text_content is None:
+            text_content = soup.get_text()
+        if metrics.open_interest is None:
+            for pattern in self.OI_TEXT_PATTERNS:
+                matches = pattern.finditer(text_content)
+                for match in matches:
+                    value = self._parse_numeric_value(match.group(1))
+                    if value is not None and value > 0:
+                        if metrics.open_interest is None:
+                            metrics.open_interest = value
+                            self.logger.debug(f"Found Open Interest via text pattern: {value}")
+                            break
+                if metrics.open_interest is not None:
+                    break
         
         # Method 3: Extract from JavaScript data
         if js_data:
@@ -479,57 +742,11 @@ class CoinGlassScraper(BaseScraper):
         metrics: CoinGlassMetrics,
     ) -> CoinGlassMetrics:
         """Extract metrics from API response data."""
-        def find_value(data, keys):
-            """Recursively search for value by key names."""
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    key_lower = key.lower()
-                    # Check if key matches any search term
-                    if any(k.lower() in key_lower for k in keys):
-                        if isinstance(value, (int, float)):
-                            return value
-                        elif isinstance(value, str):
-                            parsed = self._parse_numeric_value(value)
-                            if parsed is not None:
-                                return parsed
-                    elif isinstance(value, (dict, list)):
-                        result = find_value(value, keys)
-                        if result is not None:
-                            return result
-            elif isinstance(data, list):
-                for item in data:
-                    result = find_value(item, keys)
-                    if result is not None:
-                        return result
-            return None
-        
-        # Map field names to search keys
-        field_mappings = {
-            "open_interest": ["open", "interest", "oi", "openinterest", "total_oi"],
-            "btc_price": ["price", "btc", "bitcoin"],
-            "futures_volume_24h": ["futures", "volume", "24h"],
-            "spot_volume_24h": ["spot", "volume", "24h"],
-            "net_inflow_24h": ["inflow", "net", "24h"],
-            # Derivatives snapshot fields
-            "futures_oi_all_exchanges": ["futures", "oi", "all", "exchanges"],
-            "cme_btc_oi": ["cme", "btc", "oi"],
-            "binance_btc_oi": ["binance", "btc", "oi"],
-            "btc_options_calls_oi": ["btc", "options", "calls", "oi"],
-            "btc_options_puts_oi": ["btc", "options", "puts", "oi"],
-            # Liquidations fields
-            "total_liquidations_24h": ["total", "liquidations", "24h"],
-            "long_liquidations": ["long", "liquidations"],
-            "short_liquidations": ["short", "liquidations"],
-            "btc_liquidations_24h": ["btc", "liquidations", "24h"],
-            "eth_liquidations_24h": ["eth", "liquidations", "24h"],
-        }
-        
-        for field_name, search_keys in field_mappings.items():
-            if getattr(metrics, field_name) is None:
-                value = find_value(api_data, search_keys)
-                if value is not None:
-                    setattr(metrics, field_name, value)
-                    self.logger.debug(f"Extracted {field_name} from API response: {value}")
+        for field_name, value in self._find_values_by_key(
+            api_data, self._missing_field_keys(metrics, self.API_FIELD_KEYS)
+        ).items():
+            setattr(metrics, field_name, value)
+            self.logger.debug(f"Extracted {field_name} from API response: {value}")
         
         return metrics
     
@@ -538,39 +755,15 @@ class CoinGlassScraper(BaseScraper):
         soup: BeautifulSoup,
         html: str,
         js_data: Optional[Dict],
+        text_content: Optional[str] = None,
     ) -> CoinGlassMetrics:
         """Extract derivatives snapshot metrics (Futures OI, Options OI, etc.)."""
         metrics = CoinGlassMetrics()
         
-        # Patterns for derivatives metrics
-        patterns = {
-            "futures_oi_all_exchanges": [
-                r'Futures\s+OI[:\s]*\(All\s+Exchanges\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Total\s+Futures\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Futures\s+Open\s+Interest[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "cme_btc_oi": [
-                r'CME\s+BTC\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'CME[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "binance_btc_oi": [
-                r'Binance\s+BTC\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Binance[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "btc_options_calls_oi": [
-                r'BTC\s+Options\s+Calls\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Calls\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "btc_options_puts_oi": [
-                r'BTC\s+Options\s+Puts\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Puts\s+OI[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-        }
-        
         # Extract using patterns (don't allow negative for OI)
-        for field_name, pattern_list in patterns.items():
+        for field_name, pattern_list in self.DERIVATIVES_PATTERNS.items():
             for pattern in pattern_list:
-                match = re.search(pattern, html, re.IGNORECASE)
+                match = pattern.search(html)
                 if match:
                     value = self._parse_numeric_value(match.group(1), allow_negative=False)
                     if value is not None and value > 0:
@@ -579,14 +772,12 @@ class CoinGlassScraper(BaseScraper):
                         break
         
         # Extract from DOM elements
-        text_content = soup.get_text()
-        for field_name in ["futures_oi_all_exchanges", "cme_btc_oi", "binance_btc_oi", 
-                          "btc_options_calls_oi", "btc_options_puts_oi"]:
+        if text_content is None:
+            text_content = soup.get_text()
+        for field_name, pattern in self.DERIVATIVES_LABEL_PATTERNS.items():
             if getattr(metrics, field_name) is None:
                 # Try to find in text with context
-                field_label = field_name.replace("_", " ").title()
-                pattern = rf'{field_label}[:\s]*\$?([\d,]+\.?\d*[BMK]?)'
-                match = re.search(pattern, text_content, re.IGNORECASE)
+                match = pattern.search(text_content)
                 if match:
                     value = self._parse_numeric_value(match.group(1), allow_negative=False)
                     if value is not None and value > 0:
@@ -619,6 +810,8 @@ class CoinGlassScraper(BaseScraper):
         soup: BeautifulSoup,
         html: str,
         js_data: Optional[Dict],
+        text_content: Optional[str] = None,
+        html_lower: Optional[str] = None,
     ) -> CoinGlassMetrics:
         """Extract liquidations metrics from CoinGlass liquidations page."""
         metrics = CoinGlassMetrics()
@@ -646,85 +839,87 @@ class CoinGlassScraper(BaseScraper):
                             # Try to extract from text patterns
                             metrics = self._extract_liquidations_from_text(api_data, metrics)
         
-        # Patterns for liquidations metrics (fallback to HTML extraction)
-        patterns = {
-            "total_liquidations_24h": [
-                r'total\s+liquidations[:\s]*comes\s+in\s+at\s+\$?([\d,]+\.?\d*)\s*million',  # Match "million" text FIRST (most specific)
-                r'24h\s+Rekt[^>]*Total[^>]*Rekt[:\s]*\$?([\d,]+\.?\d*[BMK]?)',  # Match from 24h Rekt card
-                r'Total\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Total\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'24h\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "long_liquidations": [
-                r'24h\s+Rekt[^>]*Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)',  # Match Long from 24h Rekt card
-                r'Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)[^<]*24h',  # Match Long with 24h context
-                r'Long\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Long\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                # Removed generic "Long[:\s]*\$?" pattern - it matches "Long1" incorrectly
-            ],
-            "short_liquidations": [
-                r'24h\s+Rekt[^>]*Short[:\s]*\$?([\d,]+\.?\d*[BMK]?)',  # Match Short from 24h Rekt card
-                r'Short[:\s]*\$?([\d,]+\.?\d*[BMK]?)[^<]*24h',  # Match Short with 24h context
-                r'Short\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'Short\s+Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                # Removed generic "Short[:\s]*\$?" pattern - it matches "Short1" incorrectly
-            ],
-            "btc_liquidations_24h": [
-                r'BTC\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'BTC[:\s]*Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'BTC[:\s]*24h\s+Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-            "eth_liquidations_24h": [
-                r'ETH\s+Liquidations[:\s]*\(24h\)[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'ETH[:\s]*Liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-                r'ETH[:\s]*24h\s+Long[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            ],
-        }
-        
         # Extract from DOM elements FIRST - look for 24h Rekt card specifically
         # This should be done before HTML patterns to avoid matching wrong values
-        text_content = soup.get_text()
-        html_lower = html.lower()
+        if text_content is None:
+            text_content = soup.get_text()
+        if html_lower is None:
+            html_lower = html.lower()
+        text_lower = text_content.lower()
         
         # First, try to find the 24h Rekt card element in the HTML structure
         rekt_24h_section = None
         rekt_24h_text = None
         
-        # Look for elements containing "24h" and "Rekt" or "24h Rekt"
-        for elem in soup.find_all(['div', 'section', 'article', 'card'], class_=re.compile(r'24h|rekt', re.I)):
-            elem_text = elem.get_text()
-            if '24h' in elem_text.lower() and 'rekt' in elem_text.lower():
-                rekt_24h_section = elem
-                rekt_24h_text = elem_text
-                break
-        
-        # If not found by class, search by text content
-        if not rekt_24h_section:
-            for elem in soup.find_all(['div', 'section', 'article']):
-                elem_text = elem.get_text()
-                # Check if this element contains "24h Rekt" and has numeric values
-                if '24h' in elem_text.lower() and 'rekt' in elem_text.lower() and '$' in elem_text:
-                    # Make sure it's the 24h one, not 1h, 4h, or 12h
-                    if re.search(r'\b24h\b', elem_text, re.I) and not re.search(r'\b(1h|4h|12h)\b', elem_text, re.I):
-                        rekt_24h_section = elem
-                        rekt_24h_text = elem_text
-                        break
+        # Literal substring checks are far cheaper than a regex or DOM scan,
+        # so only look for the card when the page text mentions "24h" and "Rekt"
+        tree = None
+        if "24h" in text_lower and "rekt" in text_lower:
+            try:
+                tree = lxml_html.document_fromstring(html)
+            except (etree.ParserError, ValueError) as e:
+                self.logger.debug(f"Could not build lxml tree for 24h Rekt search: {e}")
         
+        if tree is not None:
+            # Match BeautifulSoup's get_text(), which skips script/style contents
+            etree.strip_elements(tree, "script", "style", with_tail=False)
+            
+            # Element text is memoized across both searches. An element's text
+            # contains all of its descendants' text, so once an element lacks
+            # a needle its whole subtree can be skipped.
+            text_cache = {}
+            
+            def cached_text(elem):
+                elem_text = text_cache.get(elem)
+                if elem_text is None:
+                    elem_text = text_cache[elem] = elem.text_content()
+                return elem_text
+            
+            # Look for elements containing "24h" and "Rekt" or "24h Rekt"
+            stack = [tree]
+            while stack:
+                elem = stack.pop()
+                if elem.tag in self.REKT_CARD_TAGS:
+                    elem_class = (elem.get("class") or "").lower()
+                    if any(needle in elem_class for needle in self.REKT_CLASS_NEEDLES):
+                        elem_text = cached_text(elem)
+                        elem_lower = elem_text.lower()
+                        if "24h" in elem_lower and "rekt" in elem_lower:
+                            rekt_24h_section = elem
+                            rekt_24h_text = elem_text
+                            break
+                        continue
+                # Push children reversed so they pop in document order
+                stack.extend(reversed(elem))
+            
+            # If not found by class, search by text content
+            if rekt_24h_section is None:
+                stack = [tree]
+                while stack:
+                    elem = stack.pop()
+                    if elem.tag in self.REKT_TEXT_TAGS:
+                        elem_text = cached_text(elem)
+                        elem_lower = elem_text.lower()
+                        if "24h" not in elem_lower or "rekt" not in elem_lower or "$" not in elem_text:
+                            continue
+                        # Make sure it's the 24h one, not 1h, 4h, or 12h
+                        if self.WORD_24H_PATTERN.search(elem_text) and not self.WORD_SHORT_TIMEFRAME_PATTERN.search(elem_text):
+                            rekt_24h_section = elem
+                            rekt_24h_text = elem_text
+                            break
+                    stack.extend(reversed(elem))
         
         # Use the 24h section text if found, otherwise use full text
         search_text = rekt_24h_text if rekt_24h_text else text_content
+        search_lower = rekt_24h_text.lower() if rekt_24h_text else text_lower
         
-        # Try to find 24h Rekt card specifically - look for the card structure
-        # Pattern: "24h Rekt" followed by Total Rekt value, then Long, then Short
-        rekt_24h_patterns = [
-            r'24h\s+rekt[^0-9]*total[^0-9]*rekt[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^0-9]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^0-9]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',
-            r'24h\s+rekt[^$]*\$?([\d,]+\.?\d*[bmk]?)[^$]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^$]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',
-        ]
         rekt_match = None
-        for pattern in rekt_24h_patterns:
-            rekt_match = re.search(pattern, search_text, re.IGNORECASE | re.DOTALL)
-            if rekt_match:
-                break
+        # Try to find 24h Rekt card specifically - look for the card structure
+        if "24h" in search_lower and "rekt" in search_lower:
+            for pattern in self.REKT_24H_PATTERNS:
+                rekt_match = pattern.search(search_text)
+                if rekt_match:
+                    break
         if rekt_match:
             # Always extract from rekt_match - it's the most reliable source
             # Overwrite any existing values (they might be wrong from earlier patterns)
@@ -740,11 +935,27 @@ class CoinGlassScraper(BaseScraper):
                 metrics.short_liquidations = short_val
         
         # Extract using patterns from HTML (if not already extracted from API or rekt_match)
+        pending = {
+            field_name for field_name in self.LIQUIDATION_PATTERNS
+            if getattr(metrics, field_name) is None
+        }
         
-        for field_name, pattern_list in patterns.items():
-            if getattr(metrics, field_name) is None:
-                for pattern_idx, pattern in enumerate(pattern_list):
-                    match = re.search(pattern, html, re.IGNORECASE)
+        # Once the 24h card is located, the fields it carries only scan the card's markup
+        card_html = card_lower = None
+        if rekt_24h_section is not None and not pending.isdisjoint(self.REKT_CARD_FIELDS):
+            card_html = lxml_html.tostring(rekt_24h_section, encoding="unicode", with_tail=False)
+            card_lower = card_html.lower()
+        
+        for field_name, pattern_list in self.LIQUIDATION_PATTERNS.items():
+            if field_name in pending:
+                if card_html is not None and field_name in self.REKT_CARD_FIELDS:
+                    field_html, field_lower = card_html, card_lower
+                else:
+                    field_html, field_lower = html, html_lower
+                for anchor, pattern, scale in pattern_list:
+                    if anchor not in field_lower:
+                        continue
+                    match = pattern.search(field_html)
                     if match:
                         value = self._parse_numeric_value(match.group(1), allow_negative=False)
                         if value is not None:
@@ -752,27 +963,24 @@ class CoinGlassScraper(BaseScraper):
                             if field_name in ["long_liquidations", "short_liquidations"]:
                                 if value < 10:  # Reject values less than 10 (likely wrong matches like "Long1")
                                     continue
-                            # For total_liquidations_24h, check if pattern matched "million" and multiply
-                            if field_name == "total_liquidations_24h" and "million" in pattern.lower():
-                                value = value * 1e6
+                            # Scale spelled-out units (e.g. "comes in at $X million")
+                            value = value * scale
                             setattr(metrics, field_name, value)
+                            pending.discard(field_name)
                             self.logger.debug(f"Extracted {field_name} from HTML: {value}")
                             break
         
         # Also try individual patterns for each field - prioritize 24h context
         for field_name in ["total_liquidations_24h", "long_liquidations", "short_liquidations",
                           "btc_liquidations_24h", "eth_liquidations_24h"]:
-            if getattr(metrics, field_name) is None:
+            if field_name in pending:
                 # Try specific patterns for 24h liquidations
                 if field_name == "long_liquidations":
                     # Look for "Long: $X.XXM" specifically in 24h Rekt card context
-                    long_patterns = [
-                        r'24h\s+rekt[^$]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # From 24h Rekt card
-                        r'long[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^<]*24h\s+rekt',  # Long with 24h Rekt after
-                        r'24h[^$]*long[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # Any 24h context with Long
-                    ]
-                    for pattern in long_patterns:
-                        match = re.search(pattern, search_text, re.IGNORECASE | re.DOTALL)
+                    if "long" not in search_lower:
+                        continue
+                    for pattern in self.LONG_FALLBACK_PATTERNS:
+                        match = pattern.search(search_text)
                         if match:
                             value = self._parse_numeric_value(match.group(1), allow_negative=False)
                             if value is not None and value > 0:
@@ -780,13 +988,10 @@ class CoinGlassScraper(BaseScraper):
                                 break
                 elif field_name == "short_liquidations":
                     # Look for "Short: $X.XXM" specifically in 24h Rekt card context
-                    short_patterns = [
-                        r'24h\s+rekt[^$]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # From 24h Rekt card
-                        r'short[:\s]*\$?([\d,]+\.?\d*[bmk]?)[^<]*24h\s+rekt',  # Short with 24h Rekt after
-                        r'24h[^$]*short[:\s]*\$?([\d,]+\.?\d*[bmk]?)',  # Any 24h context with Short
-                    ]
-                    for pattern in short_patterns:
-                        match = re.search(pattern, search_text, re.IGNORECASE | re.DOTALL)
+                    if "short" not in search_lower:
+                        continue
+                    for pattern in self.SHORT_FALLBACK_PATTERNS:
+                        match = pattern.search(search_text)
                         if match:
                             value = self._parse_numeric_value(match.group(1), allow_negative=False)
                             if value is not None and value > 0:
@@ -795,27 +1000,29 @@ class CoinGlassScraper(BaseScraper):
                 elif field_name == "total_liquidations_24h":
                     # Look for "comes in at $X.XX million" or from 24h Rekt card
                     # Try full text first for "comes in at" pattern, then 24h section
-                    total_patterns = [
-                        (r'comes\s+in\s+at\s+\$?([\d,]+\.?\d*)\s*million', text_content),  # "comes in at $X.XX million" - check full text
-                        (r'total\s+liquidations[:\s]*comes\s+in\s+at\s+\$?([\d,]+\.?\d*[bmk]?)', text_content),  # Alternative format
-                        (r'24h\s+rekt[^$]*total[^$]*rekt[:\s]*\$?([\d,]+\.?\d*[bmk]?)', search_text),  # From 24h Rekt card
-                        (r'24h\s+rekt[^$]*\$?([\d,]+\.?\d*[bmk]?)[^$]*total', search_text),  # Total value in 24h Rekt
-                    ]
-                    for pattern, search_in in total_patterns:
-                        match = re.search(pattern, search_in, re.IGNORECASE | re.DOTALL)
+                    total_patterns = []
+                    if "comes" in text_lower:
+                        total_patterns += [
+                            (self.RE_COMES_IN_AT, text_content, 1e6),  # "comes in at $X.XX million" - check full text
+                            (self.RE_TOTAL_COMES_IN_AT, text_content, 1),  # Alternative format
+                        ]
+                    if "rekt" in search_lower:
+                        total_patterns += [
+                            (self.RE_REKT_TOTAL, search_text, 1),  # From 24h Rekt card
+                            (self.RE_REKT_TOTAL_ALT, search_text, 1),  # Total value in 24h Rekt
+                        ]
+                    for pattern, search_in, scale in total_patterns:
+                        match = pattern.search(search_in)
                         if match:
                             value = self._parse_numeric_value(match.group(1), allow_negative=False)
                             if value is not None:
-                                # If pattern matched "million" text, multiply by 1e6
-                                if "million" in pattern.lower():
-                                    value = value * 1e6
+                                # Scale spelled-out units (e.g. "million")
+                                value = value * scale
                                 setattr(metrics, field_name, value)
                                 break
-                else:
+                elif "liquidations" in text_lower:
                     # Fallback to generic pattern
-                    field_label = field_name.replace("_", " ").title()
-                    pattern = rf'{field_label}[:\s]*\$?([\d,]+\.?\d*[BMK]?)'
-                    match = re.search(pattern, text_content, re.IGNORECASE)
+                    match = self.LIQUIDATION_LABEL_PATTERNS[field_name].search(text_content)
                     if match:
                         value = self._parse_numeric_value(match.group(1), allow_negative=False)
                         if value is not None:
@@ -833,44 +1040,11 @@ class CoinGlassScraper(BaseScraper):
         metrics: CoinGlassMetrics,
     ) -> CoinGlassMetrics:
         """Extract liquidations from API response data."""
-        def find_value(data, keys):
-            """Recursively search for value by key names."""
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    key_lower = key.lower()
-                    if any(k.lower() in key_lower for k in keys):
-                        if isinstance(value, (int, float)):
-                            return value
-                        elif isinstance(value, str):
-                            parsed = self._parse_numeric_value(value, allow_negative=False)
-                            if parsed is not None:
-                                return parsed
-                    elif isinstance(value, (dict, list)):
-                        result = find_value(value, keys)
-                        if result is not None:
-                            return result
-            elif isinstance(data, list):
-                for item in data:
-                    result = find_value(item, keys)
-                    if result is not None:
-                        return result
-            return None
-        
-        # Map field names to search keys
-        field_mappings = {
-            "total_liquidations_24h": ["total", "liquidations", "24h", "24", "totalLiquidations"],
-            "long_liquidations": ["long", "liquidations", "longLiquidations"],
-            "short_liquidations": ["short", "liquidations", "shortLiquidations"],
-            "btc_liquidations_24h": ["btc", "liquidations", "24h", "bitcoin"],
-            "eth_liquidations_24h": ["eth", "liquidations", "24h", "ethereum"],
-        }
-        
-        for field_name, search_keys in field_mappings.items():
-            if getattr(metrics, field_name) is None:
-                value = find_value(api_data, search_keys)
-                if value is not None:
-                    setattr(metrics, field_name, value)
-                    self.logger.debug(f"Extracted {field_name} from API: {value}")
+        for field_name, value in self._find_values_by_key(
+            api_data, self._missing_field_keys(metrics, self.API_LIQUIDATION_FIELD_KEYS)
+        ).items():
+            setattr(metrics, field_name, value)
+            self.logger.debug(f"Extracted {field_name} from API: {value}")
         
         return metrics
     
@@ -881,15 +1055,9 @@ class CoinGlassScraper(BaseScraper):
     ) -> CoinGlassMetrics:
         """Extract liquidations from text/CSV data."""
         # Try to find liquidation values in text
-        patterns = {
-            "total_liquidations_24h": r'total[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "long_liquidations": r'long[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "short_liquidations": r'short[:\s]*liquidations[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-        }
-        
-        for field_name, pattern in patterns.items():
+        for field_name, pattern in self.LIQUIDATION_TEXT_PATTERNS.items():
             if getattr(metrics, field_name) is None:
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = pattern.search(text)
                 if match:
                     value = self._parse_numeric_value(match.group(1), allow_negative=False)
                     if value is not None:
@@ -907,16 +1075,8 @@ class CoinGlassScraper(BaseScraper):
         metrics = CoinGlassMetrics()
         
         # Extract different timeframes
-        timeframes = {
-            "net_inflow_5min": r'5\s*min[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "net_inflow_1h": r'1\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "net_inflow_4h": r'4\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "net_inflow_12h": r'12\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-            "net_inflow_24h": r'24\s*h[:\s]*\$?([\d,]+\.?\d*[BMK]?)',
-        }
-        
-        for field_name, pattern in timeframes.items():
-            match = re.search(pattern, html, re.IGNORECASE)
+        for field_name, pattern in self.TIMEFRAME_PATTERNS.items():
+            match = pattern.search(html)
             if match:
                 # Net inflow can be negative
                 value = self._parse_numeric_value(match.group(1), allow_negative=True)
@@ -934,23 +1094,19 @@ class CoinGlassScraper(BaseScraper):
         soup: BeautifulSoup,
         html: str,
         js_data: Optional[Dict],
+        html_lower: Optional[str] = None,
     ) -> CoinGlassMetrics:
         """Extract volatility metrics for different coins."""
         metrics = CoinGlassMetrics()
-        
-        # Extract volatility for each coin
-        coins = {
-            "btc_volatility_1d": ["BTC", "Bitcoin"],
-            "eth_volatility_1d": ["ETH", "Ethereum"],
-            "sol_volatility_1d": ["SOL", "Solana"],
-            "xrp_volatility_1d": ["XRP", "Ripple"],
-            "doge_volatility_1d": ["DOGE", "Dogecoin"],
-        }
-        
-        for field_name, coin_names in coins.items():
-            for coin_name in coin_names:
-                pattern = rf'{coin_name}[:\s]*([\d,]+\.?\d*)\s*%?'
-                match = re.search(pattern, html, re.IGNORECASE)
+        if html_lower is None:
+            html_lower = html.lower()
+        
+        # Extract volatility for each coin, skipping coins the page never names
+        for field_name, pattern_list in self.VOLATILITY_PATTERNS.items():
+            for anchor, pattern in pattern_list:
+                if anchor not in html_lower:
+                    continue
+                match = pattern.search(html)
                 if match:
                     value = self._parse_numeric_value(match.group(1))
                     if value is not None:
@@ -968,18 +1124,36 @@ class CoinGlassScraper(BaseScraper):
         soup: BeautifulSoup,
         html: str,
         js_data: Optional[Dict],
+        text_content: Optional[str] = None,
+        html_lower: Optional[str] = None,
     ) -> CoinGlassMetrics:
         """Try to extract all metrics from any page."""
+        if html_lower is None:
+            html_lower = html.lower()
+        
         # Combine all extraction methods
-        metrics = self._extract_btc_overview(soup, html, js_data)
-        flow_metrics = self._extract_spot_flows(soup, html, js_data)
-        vol_metrics = self._extract_volatility(soup, html, js_data)
+        metrics = self._extract_btc_overview(soup, html, js_data, text_content, html_lower)
         
-        # Merge metrics (prefer non-None values)
+        # Only run the section extractors whose section is mentioned on the page;
+        # a substring check is much cheaper than their pattern sweeps
+        empty = CoinGlassMetrics()
+        if "inflow" in html_lower or "outflow" in html_lower:
+            flow_metrics = self._extract_spot_flows(soup, html, js_data)
+        else:
+            flow_metrics = empty
+        if "volatil" in html_lower:
+            vol_metrics = self._extract_volatility(soup, html, js_data, html_lower)
+        else:
+            vol_metrics = empty
+        
+        # Merge metrics (prefer non-None values) - plain dict access on the
+        # instance dicts avoids three getattr calls per field
+        merged, flow_values, vol_values = metrics.__dict__, flow_metrics.__dict__, vol_metrics.__dict__
         for field_name in CoinGlassMetrics.__dataclass_fields__:
-            value = getattr(flow_metrics, field_name) or getattr(vol_metrics, field_name)
-            if value is not None and getattr(metrics, field_name) is None:
-                setattr(metrics, field_name, value)
+            if merged[field_name] is None:
+                value = flow_values[field_name] or vol_values[field_name]
+                if value is not None:
+                    merged[field_name] = value
         
         return metrics
     
@@ -990,42 +1164,99 @@ class CoinGlassScraper(BaseScraper):
     ) -> CoinGlassMetrics:
         """Extract metrics from JavaScript data objects."""
         # Try to find metrics in nested JS data structures
-        def find_value(data, keys):
-            """Recursively search for value by key names."""
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    if any(k.lower() in key.lower() for k in keys):
-                        if isinstance(value, (int, float)):
-                            return value
-                        elif isinstance(value, str):
-                            return self._parse_numeric_value(value)
-                    elif isinstance(value, (dict, list)):
-                        result = find_value(value, keys)
-                        if result is not None:
-                            return result
-            elif isinstance(data, list):
-                for item in data:
-                    result = find_value(item, keys)
-                    if result is not None:
-                        return result
-            return None
+        for field_name, value in self._find_values_by_key(
+            js_data,
+            self._missing_field_keys(metrics, self.JS_FIELD_KEYS),
+            stop_on_unparsed=True,
+        ).items():
+            setattr(metrics, field_name, value)
         
-        # Map field names to search keys
-        field_mappings = {
-            "btc_price": ["price", "btc", "bitcoin"],
-            "futures_volume_24h": ["futures", "volume", "24h"],
-            "spot_volume_24h": ["spot", "volume", "24h"],
-            "open_interest": ["open", "interest", "oi"],
-            "net_inflow_24h": ["inflow", "net", "24h"],
+        return metrics
+    
+    @staticmethod
+    def _missing_field_keys(
+        metrics: CoinGlassMetrics,
+        field_keys: Dict[str, tuple],
+    ) -> Dict[str, tuple]:
+        """Restrict a field->key-fragments mapping to fields not yet set."""
+        return {
+            field_name: keys
+            for field_name, keys in field_keys.items()
+            if getattr(metrics, field_name) is None
         }
+    
+    def _find_values_by_key(
+        self,
+        data: Any,
+        field_keys: Dict[str, tuple],
+        stop_on_unparsed: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Find values for several fields in one depth-first walk over nested data.
         
-        for field_name, search_keys in field_mappings.items():
-            if getattr(metrics, field_name) is None:
-                value = find_value(js_data, search_keys)
-                if value is not None:
-                    setattr(metrics, field_name, value)
+        Gives the same result as searching the tree once per field: the first
+        numeric value (in document order) under a key containing one of the
+        field's fragments wins, and a matching key is never descended into
+        for that field.
         
-        return metrics
+        Args:
+            data: Nested dicts/lists (e.g. parsed JSON)
+            field_keys: Field name -> tuple of lowercased key fragments
+            stop_on_unparsed: Stop scanning the rest of a dict for a field once
+                a matching key holds a string that does not parse
+        
+        Returns:
+            Dict of field name -> value, ordered like ``field_keys``
+        """
+        found = {}
+        pending = set(field_keys)
+        if not pending or not isinstance(data, (dict, list)):
+            return found
+        
+        def frame(node, excluded):
+            # (item iterator, is_dict, fields excluded in this subtree)
+            if isinstance(node, dict):
+                return iter(node.items()), True, excluded
+            return iter(node), False, excluded
+        
+        stack = [frame(data, set())]
+        while stack and pending:
+            items, is_dict, excluded = stack[-1]
+            for item in items:
+                if not is_dict:
+                    if isinstance(item, (dict, list)):
+                        stack.append(frame(item, set(excluded)))
+                        break
+                    continue
+                
+                key, value = item
+                key_lower = key.lower()
+                matched = [
+                    field_name for field_name in pending
+                    if field_name not in excluded
+                    and any(k in key_lower for k in field_keys[field_name])
+                ]
+                if matched:
+                    if isinstance(value, (int, float)):
+                        for field_name in matched:
+                            found[field_name] = value
+                            pending.discard(field_name)
+                    elif isinstance(value, str):
+                        parsed = self._parse_numeric_value(value)
+                        for field_name in matched:
+                            if parsed is not None:
+                                found[field_name] = parsed
+                                pending.discard(field_name)
+                            elif stop_on_unparsed:
+                                excluded.add(field_name)
+                
+                if isinstance(value, (dict, list)):
+                    stack.append(frame(value, excluded.union(matched)))
+                    break
+            else:
+                stack.pop()
+        
+        return {field_name: found[field_name] for field_name in field_keys if field_name in found}
     
     def _parse_numeric_value(
         self, 
@@ -1045,17 +1276,7 @@ class CoinGlassScraper(BaseScraper):
         if not value:
             return None
         
-        # Remove whitespace and currency symbols
-        value = str(value).strip().replace("$", "").replace(",", "").replace(" ", "")
-        
-        # Handle negative values - check for various minus signs
-        is_negative = False
-        negative_signs = ["-", "–", "−", "—"]  # Regular, en-dash, minus, em-dash
-        for sign in negative_signs:
-            if value.startswith(sign):
-                is_negative = True
-                value = value[1:].strip()
-                break
+        value, is_negative, num = _split_numeric(value if isinstance(value, str) else str(value))
         
         # If negative not allowed, log warning and reject
         if is_negative and not allow_negative:
@@ -1065,40 +1286,22 @@ class CoinGlassScraper(BaseScraper):
             )
             return None
         
-        # Handle suffixes (B, M, K)
-        multipliers = {
-            "B": 1e9,
-            "b": 1e9,
-            "M": 1e6,
-            "m": 1e6,
-            "K": 1e3,
-            "k": 1e3,
-        }
+        if num is None:
+            self.logger.debug(f"Failed to parse numeric value: {value}")
+            return None
         
-        multiplier = 1
-        for suffix, mult in multipliers.items():
-            if value.endswith(suffix):
-                multiplier = mult
-                value = value[:-1]
-                break
+        result = -num if is_negative else num
         
-        try:
-            num = float(value) * multiplier
-            result = -num if is_negative else num
-            
-            # Validate: reject negative values if not allowed (double-check)
-            if result < 0 and not allow_negative:
-                self.logger.warning(
-                    f"Rejecting negative value: {result} (allow_negative={allow_negative})"
-                )
-                return None
-            
-            # Validate: reject suspiciously small or large values
-            if result < 0.01 and result > 0:  # Very small positive values might be errors
-                self.logger.debug(f"Very small value detected: {result}")
-            
-            return result
-        except ValueError:
-            self.logger.debug(f"Failed to parse numeric value: {value}")
+        # Validate: reject negative values if not allowed (double-check)
+        if result < 0 and not allow_negative:
+            self.logger.warning(
+                f"Rejecting negative value: {result} (allow_negative={allow_negative})"
+            )
             return None
+        
+        # Validate: reject suspiciously small or large values
+        if result < 0.01 and result > 0:  # Very small positive values might be errors
+            self.logger.debug(f"Very small value detected: {result}")
+        
+        return result
 
@@ -17,24 +17,105 @@ Author: Bhavya Jain
 Date: December 10, 2025
 """
 
+import io
 import requests
 import zipfile
 import os
+import shutil
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import tempfile
 import time
 
+# Try to use the Rust-backed calamine Excel engine, fallback to openpyxl if not available
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 from .base_scraper import BaseScraper
 from ..utils.config_manager import SiteConfig
 
 
+class _HTTPRangeFile(io.RawIOBase):
+    """
+    Read-only, seekable file over HTTP range requests (for zipfile).
+
+    The last tail_size bytes are fetched once and served from memory, since
+    zipfile makes several small reads there for the end record and the
+    central directory.
+    """
+
+    def __init__(self, session: requests.Session, url: str, size: int, headers: Dict[str, str],
+                 timeout: int, tail_size: int):
+        self._session = session
+        self._url = url
+        self._size = size
+        self._headers = headers
+        self._timeout = timeout
+        self._pos = 0
+        self._tail_start = max(0, size - tail_size)
+        self._tail: Optional[bytes] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def _get_range(self, start: int, end: int) -> bytes:
+        with self._session.get(
+            self._url,
+            headers={**self._headers, 'Range': f'bytes={start}-{end - 1}'},
+            timeout=self._timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            # Bail out before reading the body if the whole file is coming back
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request (HTTP {response.status_code})")
+            return response.content
+
+    def readinto(self, buffer) -> int:
+        end = min(self._pos + len(buffer), self._size)
+        if end <= self._pos:
+            return 0
+        if self._pos >= self._tail_start:
+            if self._tail is None:
+                self._tail = self._get_range(self._tail_start, self._size)
+            data = self._tail[self._pos - self._tail_start:end - self._tail_start]
+        else:
+            data = self._get_range(self._pos, end)
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
 class DGECFINScraper(BaseScraper):
     """Scraper for DG ECFIN Business and Consumer Surveys"""
 
     # Data source URL
     ZIP_URL = "https://ec.europa.eu/economy_finance/db_indicators/surveys/documents/series/nace2_ecfin_2511/main_indicators_sa_nace2.zip"
 
+    # Buffer size for streaming the ZIP download to disk
+    DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+    # Read buffer and cached tail size for range requests (ZIP end record,
+    # central directory, member local header)
+    RANGE_BUFFER_SIZE = 64 * 1024
+
     # Fields to extract
     FIELDS = {
         'esi_eu': {
@@ -64,6 +145,10 @@ class DGECFINScraper(BaseScraper):
         }
     }
 
+    # Lookup tables derived from FIELDS
+    FIELD_COLUMNS = frozenset(field_info['column'] for field_info in FIELDS.values())
+    FIELD_NAMES = tuple(field_info['field_name'] for field_info in FIELDS.values())
+
     def __init__(self, config: Optional[SiteConfig] = None, **kwargs):
         """
         Initialize the DG ECFIN scraper.
@@ -74,55 +159,102 @@ class DGECFINScraper(BaseScraper):
         """
         super().__init__(config=config, **kwargs)
 
-    def _download_and_extract_zip(self) -> Optional[str]:
+    def _find_excel_member(self, files: List[str]) -> Optional[str]:
+        """
+        Find the first Excel file among ZIP member names.
+
+        Args:
+            files: Member names from the ZIP
+
+        Returns:
+            Name of the Excel member or None if there is none
+        """
+        for file in files:
+            if file.endswith('.xlsx') or file.endswith('.xls'):
+                self.logger.info(f"✓ Found Excel file: {file}")
+                return file
+        return None
+
+    def _read_remote_excel_member(self) -> Optional[Tuple[str, bytes]]:
+        """
+        Read only the Excel member of the remote ZIP using HTTP range requests.
+
+        zipfile reads the central directory from the end of the archive, then
+        the member's local header and compressed data, so only those byte
+        ranges are transferred instead of the whole archive.
+
+        Returns:
+            Tuple of (Excel member name, workbook bytes) or None if the server
+            does not support range requests or the read failed
+        """
+        headers = {'User-Agent': self.user_agent}
+        try:
+            head = self.session.head(self.ZIP_URL, timeout=self.timeout, headers=headers, allow_redirects=True)
+            head.raise_for_status()
+            size = int(head.headers.get('Content-Length', 0))
+            if head.headers.get('Accept-Ranges', '').lower() != 'bytes' or not size:
+                self.logger.info("Server does not advertise range support, downloading whole ZIP")
+                return None
+
+            remote = io.BufferedReader(
+                _HTTPRangeFile(self.session, self.ZIP_URL, size, headers, self.timeout, self.RANGE_BUFFER_SIZE),
+                buffer_size=self.RANGE_BUFFER_SIZE,
+            )
+            with zipfile.ZipFile(remote, 'r') as zip_ref:
+                excel_member = self._find_excel_member(zip_ref.namelist())
+                if not excel_member:
+                    raise ValueError("No Excel file found in ZIP")
+                data = zip_ref.read(excel_member)
+
+            self.logger.info(f"✓ Read {len(data):,} byte Excel member from {size:,} byte ZIP via range requests")
+            return excel_member, data
+
+        except Exception as e:
+            self.logger.warning(f"Range read of ZIP failed, downloading whole ZIP: {e}")
+            return None
+
+    def _download_excel_member(self) -> Optional[Tuple[str, bytes]]:
         """
-        Download ZIP file and extract Excel file.
+        Download the whole ZIP file and read the Excel member from it.
+
+        The ZIP is staged in a temporary directory that is removed as soon as
+        the member has been read, including on failed attempts.
 
         Returns:
-            Path to extracted Excel file or None if failed
+            Tuple of (Excel member name, workbook bytes) or None if failed
         """
         for attempt in range(self.max_retries):
             try:
                 self.logger.info(f"Downloading DG ECFIN data (attempt {attempt + 1}/{self.max_retries})...")
                 self.logger.info(f"URL: {self.ZIP_URL}")
 
-                response = requests.get(
-                    self.ZIP_URL,
-                    timeout=60,  # Larger file, needs more time
-                    headers={'User-Agent': self.user_agent}
-                )
-                response.raise_for_status()
-
-                self.logger.info(f"✓ Downloaded {len(response.content):,} bytes")
-
-                # Create temp directory
-                temp_dir = tempfile.mkdtemp()
-
-                # Save ZIP file
-                zip_path = os.path.join(temp_dir, 'dg_ecfin.zip')
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
-
-                # Extract ZIP
-                self.logger.info("Extracting ZIP file...")
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                    files = zip_ref.namelist()
-
-                self.logger.info(f"✓ Extracted {len(files)} files")
-
-                # Find Excel file
-                excel_file = None
-                for file in files:
-                    if file.endswith('.xlsx') or file.endswith('.xls'):
-                        excel_file = os.path.join(temp_dir, file)
-                        self.logger.info(f"✓ Found Excel file: {file}")
-                        break
-
-                if excel_file:
-                    return excel_file
-                else:
-                    raise ValueError("No Excel file found in ZIP")
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    # Stream the ZIP straight to disk instead of buffering it in memory
+                    zip_path = os.path.join(temp_dir, 'dg_ecfin.zip')
+                    with self.session.get(
+                        self.ZIP_URL,
+                        timeout=60,  # Larger file, needs more time
+                        headers={'User-Agent': self.user_agent},
+                        stream=True,
+                    ) as response:
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        with open(zip_path, 'wb') as f:
+                            shutil.copyfileobj(response.raw, f, length=self.DOWNLOAD_CHUNK_SIZE)
+
+                    self.logger.info(f"✓ Downloaded {os.path.getsize(zip_path):,} bytes")
+
+                    # Read the Excel file straight out of the archive
+                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                        files = zip_ref.namelist()
+                        self.logger.info(f"✓ ZIP contains {len(files)} files")
+
+                        excel_member = self._find_excel_member(files)
+
+                        if excel_member:
+                            return excel_member, zip_ref.read(excel_member)
+                        else:
+                            raise ValueError("No Excel file found in ZIP")
 
             except requests.exceptions.RequestException as e:
                 self.logger.warning(f"Download attempt {attempt + 1} failed: {e}")
@@ -133,14 +265,14 @@ class DGECFINScraper(BaseScraper):
                     return None
 
             except Exception as e:
-                self.logger.error(f"Error downloading/extracting ZIP: {e}")
+                self.logger.error(f"Error downloading ZIP: {e}")
                 return None
 
         return None
 
     def fetch_raw(self, url: str) -> Dict[str, Any]:
         """
-        Download ZIP file, extract Excel, and read data.
+        Download ZIP file and read the Excel data from it.
 
         Args:
             url: URL to fetch (uses self.ZIP_URL instead)
@@ -152,25 +284,26 @@ class DGECFINScraper(BaseScraper):
         self.logger.info("Starting DG ECFIN data download")
         self.logger.info("=" * 80)
 
-        # Download and extract
-        excel_path = self._download_and_extract_zip()
+        # Fetch only the Excel member if the server supports range requests,
+        # otherwise download the whole ZIP
+        member = self._read_remote_excel_member() or self._download_excel_member()
+
+        if not member:
+            raise ValueError("Failed to download ZIP file")
 
-        if not excel_path:
-            raise ValueError("Failed to download and extract ZIP file")
+        excel_member, workbook_bytes = member
 
-        # Read Excel file
         try:
-            self.logger.info("Reading Excel MONTHLY sheet...")
-            df = pd.read_excel(excel_path, sheet_name='MONTHLY', header=None)
-            self.logger.info(f"✓ Loaded sheet with shape: {df.shape}")
+            df = self._read_monthly_sheet(workbook_bytes)
 
-            # Convert DataFrame to JSON-serializable format for raw data saving
-            # We'll recreate the DataFrame in parse_raw from this dict representation
+            # Pass the DataFrame through as-is; the workbook bytes are kept
+            # as the raw artifact in case the raw response is saved
             return {
                 "type": "excel_from_zip",
-                "content": df.to_dict('split'),  # Convert to dict for JSON serialization
+                "content": df,
+                "workbook": workbook_bytes,
                 "shape": df.shape,
-                "excel_path": excel_path,
+                "excel_member": excel_member,
                 "zip_url": self.ZIP_URL
             }
 
@@ -178,6 +311,43 @@ class DGECFINScraper(BaseScraper):
             self.logger.error(f"Error reading Excel file: {e}")
             raise
 
+    def _read_monthly_sheet(self, workbook_bytes: bytes) -> pd.DataFrame:
+        """
+        Read the date column and required fields from the MONTHLY sheet.
+
+        Args:
+            workbook_bytes: Contents of the Excel workbook
+
+        Returns:
+            DataFrame named by the sheet's header row
+        """
+        self.logger.info("Reading Excel MONTHLY sheet...")
+        # The workbook is parsed from memory rather than a ZipExtFile because
+        # xlsx parsing seeks backwards, which a ZipExtFile can only do by
+        # decompressing the member again from the start
+        with pd.ExcelFile(io.BytesIO(workbook_bytes), engine=EXCEL_ENGINE) as xls:
+            # Row 0 holds the column names; only the date column
+            # (column 0) and the required fields are materialized
+            headers = xls.parse('MONTHLY', header=0, nrows=0).columns.tolist()
+            usecols = [0] + [idx for idx, col in enumerate(headers) if idx and col in self.FIELD_COLUMNS]
+            df = xls.parse('MONTHLY', header=0, usecols=usecols)
+        self.logger.info(f"✓ Loaded {df.shape[1]} of {len(headers)} columns, {df.shape[0]} rows")
+        return df
+
+    def get_raw_content(self, raw_data: Dict[str, Any]) -> Any:
+        """
+        Save the original workbook bytes as the raw response.
+
+        Args:
+            raw_data: Raw data from fetch_raw
+
+        Returns:
+            Excel workbook bytes (re-read in parse_raw)
+        """
+        if raw_data.get("workbook") is not None:
+            return raw_data["workbook"]
+        return super().get_raw_content(raw_data)
+
     def parse_raw(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
         """
         Parse Excel data and extract 5 EU indicators.
@@ -197,43 +367,46 @@ class DGECFINScraper(BaseScraper):
         if content is None:
             raise ValueError("No Excel data to parse")
 
-        # Recreate DataFrame from dict representation (if coming from saved JSON)
-        if isinstance(content, dict):
+        # Re-read a saved workbook, or recreate the DataFrame from an older
+        # saved JSON dict representation
+        if isinstance(content, bytes):
+            df = self._read_monthly_sheet(content)
+        elif isinstance(content, dict):
             df = pd.DataFrame(**content)
+            # Older artifacts were read with header=None: integer column labels,
+            # with the sheet's header names in row 0
+            if all(isinstance(col, int) for col in df.columns):
+                df.columns = df.iloc[0].tolist()
+                df = df.iloc[1:].reset_index(drop=True)
         else:
             df = content
 
-        # First row contains column names
-        # Column 0 is date, then each country's indicators
-        headers = df.iloc[0].tolist()
+        # Columns are named from the sheet's header row
+        # Column 0 is date, then the required indicators
+        headers = df.columns.tolist()
 
         # Find indices of our required columns
+        header_index = {h: i for i, h in enumerate(headers) if isinstance(h, str)}
         column_indices = {}
-        for key, field_info in self.FIELDS.items():
+        for field_info in self.FIELDS.values():
             col_name = field_info['column']
-            try:
-                idx = headers.index(col_name)
-                column_indices[key] = idx
-                self.logger.info(f"  ✓ Found {col_name} at column {idx}")
-            except ValueError:
+            idx = header_index.get(col_name)
+            if idx is None:
                 self.logger.warning(f"  ✗ Could not find column: {col_name}")
+                continue
+            column_indices[field_info['field_name']] = idx
+            self.logger.info(f"  ✓ Found {col_name} at column {idx}")
 
         if not column_indices:
             raise ValueError("No required columns found in Excel!")
 
-        # Extract data starting from row 1 (row 0 is headers)
-        data_df = df.iloc[1:].copy()
-
-        # Build result dataframe
-        result = pd.DataFrame()
-
-        # Get date column (column 0)
-        result['date'] = pd.to_datetime(data_df.iloc[:, 0], errors='coerce')
-
-        # Extract each field
-        for key, col_idx in column_indices.items():
-            field_name = self.FIELDS[key]['field_name']
-            result[field_name] = pd.to_numeric(data_df.iloc[:, col_idx], errors='coerce')
+        # Build result dataframe in one shot: date column (column 0), then each field
+        columns = {'date': pd.to_datetime(df.iloc[:, 0], errors='coerce')}
+        columns.update({
+            field_name: pd.to_numeric(df.iloc[:, col_idx], errors='coerce')
+            for field_name, col_idx in column_indices.items()
+        })
+        result = pd.DataFrame(columns)
 
         # Remove rows with invalid dates
         result = result.dropna(subset=['date'])
@@ -263,29 +436,30 @@ class DGECFINScraper(BaseScraper):
         warnings = super().validate(df)
 
         # Check for required columns
-        required_cols = ['date', 'year', 'month'] + [
-            self.FIELDS[key]['field_name'] for key in self.FIELDS
-        ]
+        required_cols = ['date', 'year', 'month', *self.FIELD_NAMES]
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             warnings.append(f"Missing required columns: {missing_cols}")
 
-        # Check data coverage for each field
-        for key, field_info in self.FIELDS.items():
-            field_name = field_info['field_name']
-            if field_name in df.columns:
-                series = df[field_name]
-                coverage = (series.notna().sum() / len(series)) * 100
+        # Check data coverage for all fields in one pass
+        present = [field_info for field_info in self.FIELDS.values() if field_info['field_name'] in df.columns]
+        if present and len(df):
+            notna = df[[field_info['field_name'] for field_info in present]].notna().to_numpy()
+            counts = notna.sum(axis=0)
+            coverages = counts / len(df) * 100
+            # Row position of each field's last non-null value
+            last_positions = len(df) - 1 - notna[::-1].argmax(axis=0)
 
+            for field_info, count, coverage, last_pos in zip(present, counts, coverages, last_positions):
                 if coverage < 80:
                     warnings.append(
                         f"{field_info['name']} has low coverage: {coverage:.1f}%"
                     )
 
                 # Log field statistics
-                if series.notna().any():
-                    latest = series.dropna().iloc[-1]
-                    latest_date = df.loc[series.notna(), 'date'].iloc[-1]
+                if count:
+                    latest = df[field_info['field_name']].iat[last_pos]
+                    latest_date = df['date'].iat[last_pos]
                     self.logger.info(
                         f"{field_info['name']}: Latest value = {latest} ({latest_date.date()}), "
                         f"Coverage = {coverage:.1f}%"
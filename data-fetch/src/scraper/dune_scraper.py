@@ -5,10 +5,20 @@ Uses Dune Python SDK (dune-client) when available, falls back to manual API call
 """
 
 import os
+import re
 import time
 import io
+import json
+import hashlib
+import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import requests
-from typing import Dict, Any, Optional, List
+from urllib3.util.retry import Retry
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 
 import pandas as pd
 
@@ -22,9 +32,43 @@ except ImportError:
     DuneClient = None
     QueryBase = None
 
+# Try to use pyarrow for building result DataFrames and parsing CSV results, fallback to pandas if not available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pa_csv = None
+
+# Try to use orjson for decoding API responses, fallback to stdlib json if not available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Try to use rapidfuzz to rank partial field mapping matches, fallback to the first substring match if not available
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    fuzz = None
+
+# Try to import aiohttp for concurrent multi-query fetches
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
 from .base_scraper import BaseScraper, ScraperResult
 from ..utils.logger import get_logger
 from ..utils.config_manager import SiteConfig
+from ..utils.io_utils import get_output_path
 from ..extractor.json_extractor import JsonExtractor
 
 
@@ -36,6 +80,49 @@ class DuneScraper(BaseScraper):
     
     API_BASE = "https://api.dune.com/api/v1"
     
+    # Status polling backoff: first wait, growth factor per attempt and
+    # maximum random jitter added to each wait (seconds)
+    POLL_BASE_INTERVAL = 0.1
+    POLL_BACKOFF = 1.5
+    POLL_JITTER = 0.1
+    
+    # Retry idempotent API calls (status polls, result fetches) on rate limits
+    # and transient server errors, honouring Retry-After, instead of failing
+    # the whole execute → poll → fetch run
+    HTTP_MAX_RETRIES = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    
+    # Column name terms for the combined ETH staking metrics
+    ETH_DEPOSITED_TERMS = ["eth", "deposited", "staked", "total"]
+    VALIDATOR_TERMS = ["validator", "validators", "active_validators"]
+    DEPOSITOR_TERMS = ["depositor", "address", "unique", "distinct", "depositors"]
+    
+    # Empty result template; copying it is cheaper than building a new DataFrame
+    _EMPTY_DF = pd.DataFrame()
+    
+    # Concurrent query executions in fetch_many (Dune's free tier allows 3)
+    MAX_PARALLEL_EXECUTIONS = 3
+    
+    # Query ID patterns for _extract_query_id_from_url, compiled once
+    QUERY_URL_PATTERN = re.compile(r'/queries/(\d+)')
+    QUERY_ID_PATTERNS = [
+        re.compile(r'"query_id":\s*(\d+)'),
+        QUERY_URL_PATTERN,
+        re.compile(r'queryId["\']?\s*[:=]\s*["\']?(\d+)'),
+        re.compile(r'query["\']?\s*[:=]\s*["\']?(\d+)'),
+        re.compile(r'query_id["\']?\s*[:=]\s*["\']?(\d+)'),
+        re.compile(r'"id":\s*(\d+).*?"type":\s*"query"'),
+    ]
+    # Seconds before a page that yielded no query ID is fetched again
+    QUERY_ID_MISS_TTL = 300
+    # Bytes of a Dune page searched for a query ID before reading the rest
+    PAGE_PROBE_BYTES = 128 * 1024
+    
     def __init__(
         self,
         config: Optional[SiteConfig] = None,
@@ -55,9 +142,23 @@ class DuneScraper(BaseScraper):
         self.api_key = api_key or os.getenv("DUNE_API_KEY")
         if not self.api_key:
             self.logger.warning("DUNE_API_KEY not found in environment variables")
+        # Auth headers are static per instance; build them once
+        self._auth_headers: Optional[Dict[str, str]] = {
+            "x-dune-api-key": self.api_key,
+            "Content-Type": "application/json",
+        } if self.api_key else None
+        # field_mappings are static per config; invert them once for parse_raw
+        self._rename_map: Dict[str, str] = {
+            v: k for k, v in (self.config.field_mappings or {}).items()
+        } if self.config else {}
         self.json_extractor = JsonExtractor()
-        self._execution_cache: Dict[str, str] = {}  # Cache execution IDs
+        self._execution_cache: Dict[str, str] = {}  # Cache execution IDs (persisted when cache_ttl is set)
+        self._execution_times: Dict[str, float] = {}  # Last execution time per query (seconds)
+        self._page_query_ids: Dict[str, Tuple[Optional[str], float]] = {}  # Page URL -> (query ID, lookup time)
         self.use_sdk = use_sdk and DUNE_SDK_AVAILABLE
+        self._dune_client = None  # Created on first SDK fetch, then reused
+        self._dune_client_lock = threading.Lock()
+        self._live_query_id: Optional[str] = None  # Query fetched from the API in the current scrape()
         if use_sdk and not DUNE_SDK_AVAILABLE:
             self.logger.warning(
                 "Dune SDK (dune-client) not available. Install with: pip install dune-client. "
@@ -65,15 +166,15 @@ class DuneScraper(BaseScraper):
             )
         elif self.use_sdk:
             self.logger.info("Using Dune Python SDK for query execution")
+        if self.api_key:
+            # Send the API key on every request made through the pooled session
+            self.session.headers.update(self.get_auth_headers())
     
     def get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for Dune API."""
-        if not self.api_key:
+        if not self._auth_headers:
             raise ValueError("DUNE_API_KEY is required for Dune API access")
-        return {
-            "x-dune-api-key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        return self._auth_headers
     
     def execute_query(
         self,
@@ -100,15 +201,14 @@ class DuneScraper(BaseScraper):
             payload["query_parameters"] = parameters
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                headers=self.get_auth_headers(),
                 json=payload,
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             execution_id = data.get("execution_id")
             
             if not execution_id:
@@ -121,66 +221,160 @@ class DuneScraper(BaseScraper):
             self.logger.error(f"Failed to execute query {query_id}: {e}")
             raise
     
+    def _data_source_setting(self, name: str, default: Any) -> Any:
+        """Get a Dune setting from data_source, falling back to the scraper default."""
+        value = getattr(self.config.data_source, name, None) if self.config else None
+        return default if value is None else value
+    
+    def _initial_poll_delay(self, query_id: str, poll_interval: float) -> float:
+        """
+        Get the first status poll delay for a query.
+        
+        If a previous run reported how long the query takes to execute, the
+        first poll waits a third of that (up to poll_interval) instead of
+        polling a long-running query at a high rate from the start.
+        
+        Args:
+            query_id: Dune query ID
+            poll_interval: Maximum seconds between polls
+        
+        Returns:
+            Seconds to wait before the first poll
+        """
+        initial_delay = self._data_source_setting("poll_initial_delay", self.POLL_BASE_INTERVAL)
+        estimate = self._execution_times.get(query_id)
+        if estimate:
+            initial_delay = max(initial_delay, min(poll_interval, estimate / 3))
+        return initial_delay
+    
+    def _record_execution_time(self, query_id: str, results_data: Dict[str, Any]) -> None:
+        """Remember a query's execution time from its results metadata."""
+        metadata = (results_data.get("result") or {}).get("metadata") or {}
+        execution_time_millis = metadata.get("execution_time_millis")
+        if execution_time_millis:
+            self._execution_times[query_id] = execution_time_millis / 1000
+    
+    def _poll_delay(
+        self,
+        attempt: int,
+        poll_interval: float,
+        headers: Optional[Mapping[str, str]] = None,
+        initial_delay: Optional[float] = None,
+    ) -> float:
+        """
+        Get the delay before the next status poll.
+        
+        Starts at initial_delay and grows by data_source.poll_backoff (default
+        POLL_BACKOFF) per attempt up to poll_interval, so short queries are picked
+        up quickly while long ones are not polled at a high rate. Up to
+        POLL_JITTER seconds of random jitter keep concurrent pollers apart.
+        A Retry-After header from the server wins.
+        
+        Args:
+            attempt: Zero-based poll attempt number
+            poll_interval: Maximum seconds between polls
+            headers: Headers of the last status response, if any
+            initial_delay: First delay (default data_source.poll_initial_delay
+                or POLL_BASE_INTERVAL)
+        
+        Returns:
+            Seconds to sleep
+        """
+        if headers is not None:
+            retry_after = headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+        if initial_delay is None:
+            initial_delay = self._data_source_setting("poll_initial_delay", self.POLL_BASE_INTERVAL)
+        backoff = self._data_source_setting("poll_backoff", self.POLL_BACKOFF)
+        return min(poll_interval, initial_delay * (backoff ** attempt)) + random.uniform(0, self.POLL_JITTER)
+    
     def poll_query_status(
         self,
         query_id: str,
         execution_id: str,
         max_attempts: int = 30,
         poll_interval: int = 2,
+        include_results: bool = False,
     ) -> Dict[str, Any]:
         """
         Poll query execution status until complete.
         
+        Polls back off exponentially (see _poll_delay) up to poll_interval; the
+        total wait is bounded by max_attempts * poll_interval seconds.
+        
         Args:
             query_id: Dune query ID
             execution_id: Execution ID from execute_query
-            max_attempts: Maximum number of polling attempts
-            poll_interval: Seconds between polls
+            max_attempts: Maximum number of poll_interval-sized waits
+            poll_interval: Maximum seconds between polls
+            include_results: Poll the results endpoint instead of the status
+                endpoint, so the completed response already holds the rows
         
         Returns:
-            Status response dict
+            Status response dict, or results response dict if include_results
         """
-        # Use execution endpoint for status
-        url = f"{self.API_BASE}/execution/{execution_id}/status"
+        # Use execution endpoint for status (or results, which also reports the state)
+        if include_results:
+            url = f"{self.API_BASE}/execution/{execution_id}/results"
+            params = None
+        else:
+            url = f"{self.API_BASE}/execution/{execution_id}/status"
+            params = {"execution_id": execution_id}
+        
+        budget = max_attempts * poll_interval
+        deadline = time.monotonic() + budget
+        initial_delay = self._initial_poll_delay(query_id, poll_interval)
+        attempt = 0
         
-        for attempt in range(max_attempts):
+        while True:
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
-                    headers=self.get_auth_headers(),
-                    params={"execution_id": execution_id},
+                    params=params,
                     timeout=self.timeout,
                 )
                 response.raise_for_status()
                 
-                data = response.json()
-                state = data.get("state", "").lower()
+                data = _json_loads(response.content)
+                state = data.get("state", "").lower().removeprefix("query_state_")
                 
                 self.logger.debug(f"Query status (attempt {attempt + 1}): {state}")
                 
                 if state == "completed":
                     self.logger.info(f"Query {query_id} completed successfully")
+                    if include_results:
+                        self._record_execution_time(query_id, data)
                     return data
                 elif state in ["failed", "cancelled"]:
                     error = data.get("error", "Unknown error")
                     raise ValueError(f"Query execution {state}: {error}")
-                elif state == "pending" or state == "executing":
-                    # Continue polling
-                    time.sleep(poll_interval)
-                else:
+                elif state != "pending" and state != "executing":
                     # Unknown state, continue polling
                     self.logger.warning(f"Unknown query state: {state}")
-                    time.sleep(poll_interval)
+                
+                delay = self._poll_delay(attempt, poll_interval, response.headers, initial_delay)
                     
             except requests.RequestException as e:
-                if attempt < max_attempts - 1:
-                    self.logger.warning(f"Poll attempt {attempt + 1} failed: {e}, retrying...")
-                    time.sleep(poll_interval)
-                else:
+                if time.monotonic() >= deadline:
                     raise
+                self.logger.warning(f"Poll attempt {attempt + 1} failed: {e}, retrying...")
+                delay = self._poll_delay(
+                    attempt, poll_interval, e.response.headers if e.response is not None else None, initial_delay
+                )
+            
+            # Never sleep past the deadline; poll once more when it is reached
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            attempt += 1
         
         raise TimeoutError(
-            f"Query {query_id} did not complete within {max_attempts * poll_interval} seconds"
+            f"Query {query_id} did not complete within {budget} seconds"
         )
     
     def fetch_query_results(
@@ -202,14 +396,14 @@ class DuneScraper(BaseScraper):
         url = f"{self.API_BASE}/execution/{execution_id}/results"
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                headers=self.get_auth_headers(),
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
+            self._record_execution_time(query_id, data)
             self.logger.info(f"Fetched results for query {query_id}")
             return data
             
@@ -224,36 +418,63 @@ class DuneScraper(BaseScraper):
         - https://dune.com/queries/{query_id}
         - https://dune.com/{username}/{query_name} (requires page inspection)
         """
-        import re
         # Try standard query URL format
-        query_match = re.search(r'/queries/(\d+)', url)
+        query_match = self.QUERY_URL_PATTERN.search(url)
         if query_match:
             return query_match.group(1)
         
+        # Reuse an earlier page lookup; misses are retried after QUERY_ID_MISS_TTL
+        cached = self._page_query_ids.get(url)
+        if cached and (cached[0] or time.monotonic() - cached[1] < self.QUERY_ID_MISS_TTL):
+            return cached[0]
+        
         # For named queries like /underfire/eth-staking-statistics, try to fetch the page
         # and extract query ID from the HTML/JavaScript
+        query_id = None
         try:
-            response = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-            if response.status_code == 200:
-                html = response.text
-                # Look for query ID in various formats in the page
-                patterns = [
-                    r'"query_id":\s*(\d+)',
-                    r'/queries/(\d+)',
-                    r'queryId["\']?\s*[:=]\s*["\']?(\d+)',
-                    r'query["\']?\s*[:=]\s*["\']?(\d+)',
-                    r'query_id["\']?\s*[:=]\s*["\']?(\d+)',
-                    r'"id":\s*(\d+).*"type":\s*"query"',
-                ]
-                for pattern in patterns:
-                    matches = re.findall(pattern, html)
-                    if matches:
-                        query_id = matches[0]  # Take first match
-                        self.logger.info(f"Extracted query ID {query_id} from page HTML using pattern: {pattern}")
-                        return query_id
+            # Page fetch, so leave the API key out of the session headers.
+            # The query ID sits in the server-rendered state near the top of the
+            # page, so look there first and only read the rest (mostly bundled
+            # JS) if it isn't found
+            with self.session.get(
+                url,
+                timeout=10,
+                headers={"User-Agent": "Mozilla/5.0", "x-dune-api-key": None},
+                stream=True,
+            ) as response:
+                if response.status_code == 200:
+                    encoding = response.encoding or "utf-8"
+                    chunks = response.iter_content(chunk_size=self.PAGE_PROBE_BYTES)
+                    body = next(chunks, b"")
+                    query_id = self._find_query_id(body.decode(encoding, errors="replace"), partial=True)
+                    if query_id is None:
+                        body += b"".join(chunks)
+                        query_id = self._find_query_id(body.decode(encoding, errors="replace"))
         except Exception as e:
             self.logger.debug(f"Could not extract query ID from page: {e}")
         
+        self._page_query_ids[url] = (query_id, time.monotonic())
+        return query_id
+    
+    def _find_query_id(self, html: str, partial: bool = False) -> Optional[str]:
+        """
+        Find a query ID in page HTML.
+        
+        Args:
+            html: Page HTML
+            partial: html is only the start of the page, so ignore matches that
+                run up to its end (the ID may continue past the cut)
+        
+        Returns:
+            First query ID found, trying QUERY_ID_PATTERNS in order, or None
+        """
+        # Look for query ID in various formats in the page
+        for pattern in self.QUERY_ID_PATTERNS:
+            match = pattern.search(html)
+            if match and not (partial and match.end() >= len(html)):
+                query_id = match.group(1)  # Take first match
+                self.logger.info(f"Extracted query ID {query_id} from page HTML using pattern: {pattern.pattern}")
+                return query_id
         return None
     
     def fetch_raw(self, url: str) -> Dict[str, Any]:
@@ -290,18 +511,13 @@ class DuneScraper(BaseScraper):
                 query_id = extracted_id
                 self.logger.info(f"Extracted query ID {query_id} from URL: {self.config.page_url}")
         
-        if not query_id or query_id == "null":
-            # Try to extract from page_url one more time
-            if self.config.page_url:
-                extracted_id = self._extract_query_id_from_url(self.config.page_url)
-                if extracted_id:
-                    query_id = extracted_id
-                    self.logger.info(f"Extracted query ID {query_id} from page URL")
-        
         # Check if this is the combined ETH staking config that needs multiple queries
         if self.config and self.config.id == "dune_eth_staking" and self.config.name == "Dune - ETH Staking Statistics (Combined)":
+            cached = self._load_cached_result("2361448,2361452")
+            if cached:
+                return cached
             # Fetch from both queries and combine
-            return self._fetch_combined_eth_staking()
+            return self._mark_live_fetch(self._fetch_combined_eth_staking())
         
         if not query_id or query_id == "null":
             raise ValueError(
@@ -315,6 +531,23 @@ class DuneScraper(BaseScraper):
                 "4. Or inspect the page source and search for 'query_id'"
             )
         
+        # Reuse recently parsed results from the on-disk cache (no API calls at all)
+        cached = self._load_cached_result(query_id)
+        if cached:
+            return cached
+        
+        return self._mark_live_fetch(self._fetch_query_results(query_id))
+    
+    def _fetch_query_results(self, query_id: str) -> Dict[str, Any]:
+        """
+        Fetch a query's results from the API, trying the cheapest source first.
+        
+        Args:
+            query_id: Dune query ID
+        
+        Returns:
+            Dict with query results
+        """
         # Try to fetch latest results first (fastest, no execution needed)
         try:
             return self._fetch_latest_results_csv(query_id)
@@ -338,80 +571,79 @@ class DuneScraper(BaseScraper):
         Fetch ETH staking data from multiple queries and combine results.
         Query 2361452: Total ETH Deposited
         Query 2361448: Total Validators and Distinct Depositor Addresses
+        
+        Both queries are fetched concurrently, so the combined fetch takes about
+        as long as the slower query instead of the sum of the two.
         """
         combined_data = {}
         
+        # Start both queries at once; the time is spent waiting on Dune, not the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pending = {
+                query_id: executor.submit(self._fetch_single_query, query_id)
+                for query_id in ("2361452", "2361448")
+            }
+        
         # Fetch from query 2361452 (Total ETH Deposited)
         try:
-            result_2361452 = self._fetch_single_query("2361452")
+            result_2361452 = pending["2361452"].result()
             if result_2361452 and result_2361452.get("content"):
-                rows = result_2361452["content"].get("rows", [])
-                if rows:
+                df, rows = self._result_frame(result_2361452["content"])
+                if not df.empty:
                     # Extract total ETH deposited value
                     # The query might return a single row with the total, or multiple rows
-                    for row in rows:
-                        # Look for columns that might contain the total ETH value
-                        for key, value in row.items():
-                            key_lower = key.lower()
-                            # Check for ETH-related columns
-                            if any(term in key_lower for term in ["eth", "deposited", "staked", "total"]) and isinstance(value, (int, float)):
-                                if value > 0:  # Only accept positive values
-                                    combined_data["total_eth_deposited"] = value
-                                    self.logger.info(f"Found total_eth_deposited: {value} from column '{key}'")
-                                    break
-                        if "total_eth_deposited" in combined_data:
-                            break
-                    # If no specific column found, try to sum numeric values or take largest numeric value
-                    if "total_eth_deposited" not in combined_data and rows:
-                        first_row = rows[0]
-                        numeric_values = []
-                        for key, value in first_row.items():
-                            if isinstance(value, (int, float)) and value > 0:
-                                numeric_values.append((key, value))
-                        if numeric_values:
-                            # Take the largest value (likely the total)
-                            largest = max(numeric_values, key=lambda x: x[1])
-                            combined_data["total_eth_deposited"] = largest[1]
-                            self.logger.info(f"Using largest numeric value for total_eth_deposited: {largest[1]} from column '{largest[0]}'")
+                    # Look for columns that might contain the total ETH value
+                    match = self._first_positive_value(df, self.ETH_DEPOSITED_TERMS, rows=rows)
+                    if match:
+                        key, value = match
+                        combined_data["total_eth_deposited"] = value
+                        self.logger.info(f"Found total_eth_deposited: {value} from column '{key}'")
+                    else:
+                        # If no specific column found, take largest numeric value in the first row (likely the total)
+                        match = self._largest_positive_value(df, rows=rows)
+                        if match:
+                            key, value = match
+                            combined_data["total_eth_deposited"] = value
+                            self.logger.info(f"Using largest numeric value for total_eth_deposited: {value} from column '{key}'")
         except Exception as e:
             self.logger.warning(f"Failed to fetch from query 2361452: {e}")
         
         # Fetch from query 2361448 (Validators and Depositors)
         try:
-            result_2361448 = self._fetch_single_query("2361448")
+            result_2361448 = pending["2361448"].result()
             if result_2361448 and result_2361448.get("content"):
-                rows = result_2361448["content"].get("rows", [])
-                if rows:
+                df, rows = self._result_frame(result_2361448["content"])
+                if not df.empty:
                     # Extract validators and depositors
-                    for row in rows:
-                        for key, value in row.items():
-                            key_lower = key.lower()
-                            # Check for validator-related columns
-                            if any(term in key_lower for term in ["validator", "validators", "active_validators"]) and isinstance(value, (int, float)):
-                                if value > 0 and "total_validators" not in combined_data:
-                                    combined_data["total_validators"] = value
-                                    self.logger.info(f"Found total_validators: {value} from column '{key}'")
-                            # Check for depositor-related columns
-                            elif any(term in key_lower for term in ["depositor", "address", "unique", "distinct", "depositors"]) and isinstance(value, (int, float)):
-                                if value > 0 and "distinct_depositor_addresses" not in combined_data:
-                                    combined_data["distinct_depositor_addresses"] = value
-                                    self.logger.info(f"Found distinct_depositor_addresses: {value} from column '{key}'")
-                        if "total_validators" in combined_data and "distinct_depositor_addresses" in combined_data:
-                            break
+                    # Check for validator-related columns
+                    match = self._first_positive_value(df, self.VALIDATOR_TERMS, rows=rows)
+                    if match:
+                        key, value = match
+                        combined_data["total_validators"] = value
+                        self.logger.info(f"Found total_validators: {value} from column '{key}'")
+                    # Check for depositor-related columns (validator columns take precedence)
+                    match = self._first_positive_value(
+                        df, self.DEPOSITOR_TERMS, exclude_terms=self.VALIDATOR_TERMS, rows=rows
+                    )
+                    if match:
+                        key, value = match
+                        combined_data["distinct_depositor_addresses"] = value
+                        self.logger.info(f"Found distinct_depositor_addresses: {value} from column '{key}'")
         except Exception as e:
             self.logger.warning(f"Failed to fetch from query 2361448: {e}")
         
         # Convert combined data to the format expected by parse_raw
         # Create a single row with all the combined metrics
         combined_row = {
-            "timestamp": pd.Timestamp.now().isoformat(),
+            "timestamp": datetime.now().isoformat(),
             **combined_data
         }
         
+        # The one-row frame is built directly, so parse_raw uses it as-is
         return {
-            "type": "api_json",
+            "type": "api_dataframe",
             "content": {
-                "rows": [combined_row],
+                "df": pd.DataFrame({key: [value] for key, value in combined_row.items()}),
                 "metadata": {
                     "row_count": 1,
                     "column_count": len(combined_row),
@@ -421,6 +653,107 @@ class DuneScraper(BaseScraper):
             "execution_id": "combined",
         }
     
+    def _result_frame(
+        self,
+        results_data: Dict[str, Any],
+    ) -> Tuple[pd.DataFrame, Optional[List[Dict[str, Any]]]]:
+        """Get results as a DataFrame (from either an SDK DataFrame or API rows) and the API rows, if any."""
+        if "df" in results_data:
+            return results_data["df"], None
+        rows = results_data.get("rows", [])
+        return (self._rows_to_dataframe(rows) if rows else self._EMPTY_DF), rows
+    
+    @staticmethod
+    def _positive_cells(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Mark the cells holding a positive number, as the old per-row loops accepted.
+        
+        Numeric columns are compared in one vectorized pass. Object columns are
+        checked cell by cell, since they carry integers wider than 64 bits (e.g.
+        wei amounts) alongside None or strings.
+        """
+        return pd.DataFrame({
+            name: (
+                (column > 0).fillna(False).astype(bool)
+                if pd.api.types.is_numeric_dtype(column)
+                else column.map(lambda value: isinstance(value, (int, float)) and value > 0).astype(bool)
+            )
+            for name, column in df.items()
+        }, index=df.index)
+    
+    @staticmethod
+    def _cell_value(
+        df: pd.DataFrame,
+        rows: Optional[List[Dict[str, Any]]],
+        row: int,
+        column: str,
+    ) -> Any:
+        """Get a result cell's original value (from the API rows when available, so a
+        column upcast to float by a null elsewhere still yields the row's int)."""
+        if rows is not None:
+            return rows[row][column]
+        value = df[column].iat[row]
+        return value.item() if hasattr(value, "item") else value
+    
+    def _first_positive_value(
+        self,
+        df: pd.DataFrame,
+        terms: List[str],
+        exclude_terms: Optional[List[str]] = None,
+        rows: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Find the first positive numeric value in columns whose names match.
+        
+        Column names are matched with one vectorized string test, and the
+        matching columns are then searched row by row, in column order.
+        
+        Args:
+            df: Query results
+            terms: Substrings to look for in lowercased column names
+            exclude_terms: Substrings that disqualify a column name
+            rows: API rows df was built from, to return their original values
+        
+        Returns:
+            Tuple of (column, value), or None if no matching column has a
+            positive value
+        """
+        names = df.columns.astype(str).str.lower()
+        mask = names.str.contains("|".join(map(re.escape, terms)))
+        if exclude_terms:
+            mask &= ~names.str.contains("|".join(map(re.escape, exclude_terms)))
+        candidates = df.loc[:, mask]
+        positive = self._positive_cells(candidates).to_numpy()
+        if not positive.any():
+            return None
+        row, col = divmod(int(positive.argmax()), positive.shape[1])
+        column = candidates.columns[col]
+        return column, self._cell_value(df, rows, row, column)
+    
+    def _largest_positive_value(
+        self,
+        df: pd.DataFrame,
+        rows: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Find the largest positive numeric value in the first result row.
+        
+        Args:
+            df: Query results
+            rows: API rows df was built from, to return their original values
+        
+        Returns:
+            Tuple of (column, value), or None if the first row has no positive value
+        """
+        first_row = df.iloc[:1]
+        positive = self._positive_cells(first_row).iloc[0]
+        values = [
+            (column, self._cell_value(df, rows, 0, column))
+            for column in first_row.columns[positive.to_numpy()]
+        ]
+        # max() keeps the first of equal values, like the old loop
+        return max(values, key=lambda item: item[1]) if values else None
+    
     def _fetch_single_query(self, query_id: str) -> Optional[Dict[str, Any]]:
         """Helper method to fetch from a single query ID."""
         # Try to fetch latest results first (fastest, no execution needed)
@@ -443,10 +776,24 @@ class DuneScraper(BaseScraper):
             self.logger.error(f"All methods failed for query {query_id}: {e}")
             return None
     
+    @property
+    def dune_client(self) -> "DuneClient":
+        """
+        Get the Dune SDK client for this scraper, creating it on first use.
+        
+        The client holds its own pooled HTTP session, so reusing it lets SDK
+        fetches share connections. Creation is locked because the combined
+        ETH staking fetch runs queries on worker threads.
+        """
+        with self._dune_client_lock:
+            if self._dune_client is None:
+                self._dune_client = DuneClient(api_key=self.api_key, request_timeout=self.timeout)
+            return self._dune_client
+    
     def _fetch_with_sdk(self, query_id: str) -> Dict[str, Any]:
         """Fetch data using Dune Python SDK."""
         try:
-            dune = DuneClient(api_key=self.api_key)
+            dune = self.dune_client
             query = QueryBase(query_id=int(query_id))
             
             # Get parameters from config
@@ -461,18 +808,21 @@ class DuneScraper(BaseScraper):
             # Try to get latest results first (faster, no execution needed)
             try:
                 self.logger.info(f"Fetching latest results for Dune query {query_id} using SDK...")
-                results_df = dune.run_query_dataframe(query)
+                latest = dune.get_latest_result(query)
+                if latest.result is None:
+                    raise ValueError(f"No completed results for query {query_id} (state: {latest.state})")
                 
-                # Convert DataFrame to dict format expected by parse_raw
+                # The SDK already returns rows as dicts; pass them through as-is
+                rows = latest.result.rows
                 results_data = {
-                    "rows": results_df.to_dict("records"),
+                    "rows": rows,
                     "metadata": {
-                        "row_count": len(results_df),
-                        "column_count": len(results_df.columns),
+                        "row_count": len(rows),
+                        "column_count": len(latest.result.metadata.column_names),
                     }
                 }
                 
-                self.logger.info(f"Successfully fetched {len(results_df)} rows using SDK (latest results)")
+                self.logger.info(f"Successfully fetched {len(rows)} rows using SDK (latest results)")
                 
                 return {
                     "type": "api_json",
@@ -486,7 +836,7 @@ class DuneScraper(BaseScraper):
                 results_df = dune.run_query_dataframe(query)
                 
                 results_data = {
-                    "rows": results_df.to_dict("records"),
+                    "df": results_df,
                     "metadata": {
                         "row_count": len(results_df),
                         "column_count": len(results_df.columns),
@@ -496,7 +846,7 @@ class DuneScraper(BaseScraper):
                 self.logger.info(f"Successfully fetched {len(results_df)} rows using SDK (executed)")
                 
                 return {
-                    "type": "api_json",
+                    "type": "api_dataframe",
                     "content": results_data,
                     "query_id": query_id,
                     "execution_id": "sdk_execution",
@@ -515,24 +865,22 @@ class DuneScraper(BaseScraper):
         url = f"{self.API_BASE}/query/{query_id}/results/csv"
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                headers=self.get_auth_headers(),
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
             # Parse CSV response
-            csv_data = response.text
-            df = pd.read_csv(io.StringIO(csv_data))
+            rows, column_count = self._parse_results_csv(response.content)
             
-            self.logger.info(f"Fetched {len(df)} rows from latest query results (CSV)")
+            self.logger.info(f"Fetched {len(rows)} rows from latest query results (CSV)")
             
             results_data = {
-                "rows": df.to_dict("records"),
+                "rows": rows,
                 "metadata": {
-                    "row_count": len(df),
-                    "column_count": len(df.columns),
+                    "row_count": len(rows),
+                    "column_count": column_count,
                 }
             }
             
@@ -547,26 +895,188 @@ class DuneScraper(BaseScraper):
             self.logger.warning(f"Failed to fetch latest CSV results: {e}")
             raise
     
+    def _parse_results_csv(self, content: bytes) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Parse a Dune results CSV body into row dicts.
+        
+        Arrow's multithreaded CSV reader parses the raw bytes directly, without
+        decoding the body to a str first. Dates and timestamps are kept as
+        strings and empty fields become None, as with pd.read_csv.
+        
+        Args:
+            content: CSV response body
+        
+        Returns:
+            Tuple of (rows, column_count)
+        """
+        if PYARROW_AVAILABLE:
+            try:
+                table = pa_csv.read_csv(
+                    pa.BufferReader(content),
+                    convert_options=pa_csv.ConvertOptions(
+                        timestamp_parsers=[],
+                        strings_can_be_null=True,
+                    ),
+                )
+                for i, field in enumerate(table.schema):
+                    if pa.types.is_temporal(field.type):
+                        table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+                return table.to_pylist(), table.num_columns
+            except pa.ArrowException as e:
+                self.logger.debug(f"Arrow could not parse CSV results, using pandas: {e}")
+        
+        df = pd.read_csv(io.BytesIO(content))
+        return df.to_dict("records"), len(df.columns)
+    
     def _fetch_with_manual_api(self, query_id: str) -> Dict[str, Any]:
         """Fetch data using manual API calls (3-step process)."""
         # Check cache for recent execution
         parameters = self.config.data_source.parameters or {}
-        cache_key = f"{query_id}_{parameters}"
-        if cache_key in self._execution_cache:
-            execution_id = self._execution_cache[cache_key]
+        cache_key = self._cache_key(query_id, parameters)
+        execution_id = self._get_cached_execution_id(cache_key)
+        if execution_id:
             self.logger.info(f"Using cached execution_id: {execution_id}")
         else:
             # Step 1: Execute query
             execution_id = self.execute_query(query_id, parameters)
-            self._execution_cache[cache_key] = execution_id
+            self._set_cached_execution_id(cache_key, execution_id)
         
-        # Step 2: Poll status
+        # Steps 2 and 3: Poll the results endpoint, which returns the rows once
+        # the execution completes (no separate status probe)
         max_attempts = self.config.data_source.max_poll_attempts
         poll_interval = self.config.data_source.poll_interval
-        status_data = self.poll_query_status(query_id, execution_id, max_attempts, poll_interval)
+        results_data = self.poll_query_status(
+            query_id, execution_id, max_attempts, poll_interval, include_results=True
+        )
+        
+        return {
+            "type": "api_json",
+            "content": results_data,
+            "query_id": query_id,
+            "execution_id": execution_id,
+        }
+    
+    async def _execute_query_async(
+        self,
+        session: "aiohttp.ClientSession",
+        query_id: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Async variant of execute_query on a shared aiohttp session."""
+        url = f"{self.API_BASE}/query/{query_id}/execute"
         
-        # Step 3: Fetch results
-        results_data = self.fetch_query_results(query_id, execution_id)
+        payload = {}
+        if parameters:
+            payload["query_parameters"] = parameters
+        
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            data = _json_loads(await response.read())
+        
+        execution_id = data.get("execution_id")
+        if not execution_id:
+            raise ValueError(f"No execution_id in response: {data}")
+        
+        self.logger.info(f"Query {query_id} executed, execution_id: {execution_id}")
+        return execution_id
+    
+    async def _poll_query_status_async(
+        self,
+        session: "aiohttp.ClientSession",
+        query_id: str,
+        execution_id: str,
+        max_attempts: int = 30,
+        poll_interval: int = 2,
+        include_results: bool = False,
+    ) -> Dict[str, Any]:
+        """Async variant of poll_query_status; waits yield to other queries."""
+        if include_results:
+            url = f"{self.API_BASE}/execution/{execution_id}/results"
+            params = None
+        else:
+            url = f"{self.API_BASE}/execution/{execution_id}/status"
+            params = {"execution_id": execution_id}
+        
+        loop = asyncio.get_running_loop()
+        budget = max_attempts * poll_interval
+        deadline = loop.time() + budget
+        initial_delay = self._initial_poll_delay(query_id, poll_interval)
+        attempt = 0
+        
+        while True:
+            try:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+                    headers = response.headers
+                
+                state = data.get("state", "").lower().removeprefix("query_state_")
+                self.logger.debug(f"Query {query_id} status (attempt {attempt + 1}): {state}")
+                
+                if state == "completed":
+                    self.logger.info(f"Query {query_id} completed successfully")
+                    if include_results:
+                        self._record_execution_time(query_id, data)
+                    return data
+                elif state in ["failed", "cancelled"]:
+                    error = data.get("error", "Unknown error")
+                    raise ValueError(f"Query execution {state}: {error}")
+                elif state != "pending" and state != "executing":
+                    self.logger.warning(f"Unknown query state: {state}")
+                
+                delay = self._poll_delay(attempt, poll_interval, headers, initial_delay)
+            
+            except aiohttp.ClientError as e:
+                if loop.time() >= deadline:
+                    raise
+                self.logger.warning(f"Poll attempt {attempt + 1} for query {query_id} failed: {e}, retrying...")
+                delay = self._poll_delay(
+                    attempt, poll_interval, e.headers if isinstance(e, aiohttp.ClientResponseError) else None,
+                    initial_delay,
+                )
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            attempt += 1
+        
+        raise TimeoutError(
+            f"Query {query_id} did not complete within {budget} seconds"
+        )
+    
+    async def fetch_raw_async(
+        self,
+        session: "aiohttp.ClientSession",
+        query_id: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the execute → poll → fetch process for one query without blocking.
+        
+        Args:
+            session: Shared aiohttp session carrying the auth headers
+            query_id: Dune query ID
+            parameters: Optional query parameters
+        
+        Returns:
+            Dict with query results, in the same format as fetch_raw
+        """
+        parameters = parameters or {}
+        cache_key = self._cache_key(query_id, parameters)
+        execution_id = self._get_cached_execution_id(cache_key)
+        if execution_id:
+            self.logger.info(f"Using cached execution_id: {execution_id}")
+        else:
+            execution_id = await self._execute_query_async(session, query_id, parameters)
+            self._set_cached_execution_id(cache_key, execution_id)
+        
+        data_source = self.config.data_source if self.config else None
+        max_attempts = data_source.max_poll_attempts if data_source else 30
+        poll_interval = data_source.poll_interval if data_source else 2
+        results_data = await self._poll_query_status_async(
+            session, query_id, execution_id, max_attempts, poll_interval, include_results=True
+        )
         
         return {
             "type": "api_json",
@@ -575,6 +1085,254 @@ class DuneScraper(BaseScraper):
             "execution_id": execution_id,
         }
     
+    def fetch_many(
+        self,
+        query_ids: List[str],
+        parameters: Optional[Dict[str, Any]] = None,
+        max_parallel: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several Dune queries concurrently.
+        
+        All queries run their execute → poll → fetch steps on one event loop and
+        one aiohttp session, so total time approaches the slowest query rather
+        than the sum of all of them. A semaphore keeps the number of queries in
+        flight within Dune's parallel execution limit for the plan.
+        
+        Args:
+            query_ids: Dune query IDs
+            parameters: Optional query parameters, applied to every query
+            max_parallel: Maximum queries in flight (default
+                data_source.max_parallel or MAX_PARALLEL_EXECUTIONS)
+        
+        Returns:
+            Dict mapping query ID to its fetch_raw-style result; queries that
+            failed are logged and left out
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError(
+                "aiohttp is not installed. Concurrent Dune fetches require it. "
+                "Install with: pip install aiohttp"
+            )
+        if not self.api_key:
+            raise ValueError("DUNE_API_KEY is required for Dune API access")
+        
+        if max_parallel is None:
+            max_parallel = self._data_source_setting("max_parallel", self.MAX_PARALLEL_EXECUTIONS)
+        
+        async def _fetch_all():
+            semaphore = asyncio.Semaphore(max_parallel)
+            connector = aiohttp.TCPConnector(limit=self.HTTP_POOL_MAXSIZE)
+            async with aiohttp.ClientSession(
+                headers=self.get_auth_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=connector,
+            ) as session:
+                async def _fetch_one(query_id: str) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await self.fetch_raw_async(session, query_id, parameters)
+                
+                return await asyncio.gather(
+                    *(_fetch_one(query_id) for query_id in query_ids),
+                    return_exceptions=True,
+                )
+        
+        results = {}
+        for query_id, result in zip(query_ids, asyncio.run(_fetch_all())):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to fetch query {query_id}: {result}")
+            else:
+                results[query_id] = result
+        return results
+    
+    def _get_cached_execution_id(self, cache_key: str) -> Optional[str]:
+        """
+        Get a previous execution ID for a query and its parameters.
+        
+        Checks this instance's execution cache first, then the execution IDs
+        persisted by earlier runs, which are reused for up to data_source.cache_ttl
+        seconds.
+        
+        Args:
+            cache_key: Execution cache key for the query and its parameters
+        
+        Returns:
+            Execution ID, or None if the query needs to be executed
+        """
+        if self.config and self.config.data_source.force_refresh:
+            return None
+        if cache_key in self._execution_cache:
+            return self._execution_cache[cache_key]
+        
+        cache_ttl = self._cache_ttl()
+        if not cache_ttl:
+            return None
+        entry = self._load_execution_index().get(cache_key)
+        if not entry or time.time() - entry.get("executed_at", 0) > cache_ttl:
+            return None
+        self._execution_cache[cache_key] = entry["execution_id"]
+        return entry["execution_id"]
+    
+    def _set_cached_execution_id(self, cache_key: str, execution_id: str) -> None:
+        """Remember an execution ID in memory and, if caching is enabled, on disk."""
+        self._execution_cache[cache_key] = execution_id
+        if not self._cache_ttl():
+            return
+        index = self._load_execution_index()
+        index[cache_key] = {"execution_id": execution_id, "executed_at": time.time()}
+        try:
+            get_output_path("executions.json", "cache", self.site_id).write_text(json.dumps(index))
+        except OSError as e:
+            self.logger.warning(f"Could not persist execution_id {execution_id}: {e}")
+    
+    def _load_execution_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the execution IDs persisted by earlier runs."""
+        try:
+            return _json_loads(get_output_path("executions.json", "cache", self.site_id).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read persisted execution IDs: {e}")
+            return {}
+    
+    def _cache_key(self, query_id: str, parameters: Optional[Dict[str, Any]]) -> str:
+        """
+        Get a stable cache key for a query and its parameters.
+        
+        Parameters are serialized with sorted keys, so the key doesn't depend on
+        dict ordering, and hashed to a short fixed-size string.
+        
+        Args:
+            query_id: Dune query ID
+            parameters: Query parameters
+        
+        Returns:
+            Hex digest identifying the query and parameters
+        """
+        canonical = json.dumps(parameters or {}, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(f"{query_id}|{canonical}".encode(), digest_size=16).hexdigest()
+    
+    def _result_cache_path(self, query_id: str) -> Path:
+        """Get the on-disk cache file for a query and its configured parameters."""
+        key = self._cache_key(query_id, self.config.data_source.parameters)
+        return get_output_path(f"{key}.parquet", "cache", self.site_id)
+    
+    def _load_cached_result(self, query_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load parsed results for a query from the on-disk cache.
+        
+        Args:
+            query_id: Dune query ID
+        
+        Returns:
+            Raw data dict holding the cached DataFrame, or None if caching is
+            disabled, data_source.force_refresh is set, or there is no entry
+            younger than data_source.cache_ttl
+        """
+        cache_ttl = self._cache_ttl()
+        if not cache_ttl:
+            return None
+        
+        cache_path = self._result_cache_path(query_id)
+        try:
+            if time.time() - cache_path.stat().st_mtime > cache_ttl:
+                return None
+            df = pd.read_parquet(cache_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not read cached results for query {query_id}: {e}")
+            return None
+        
+        self.logger.info(f"Using cached results for query {query_id} ({len(df)} rows)")
+        return {
+            "type": "cached_parquet",
+            "content": df,
+            "cache_path": str(cache_path),
+            "query_id": query_id,
+        }
+    
+    def _mark_live_fetch(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Remember that fetch_raw hit the API, so scrape() caches the parsed results."""
+        self._live_query_id = raw_data.get("query_id")
+        return raw_data
+    
+    def scrape(
+        self,
+        url: Optional[str] = None,
+        override_robots: bool = False,
+        save_raw: bool = True,
+    ) -> ScraperResult:
+        """
+        Execute the full scraping workflow, caching freshly fetched results.
+        
+        Results are written to the on-disk cache only after a live API fetch,
+        so re-parsing an old saved response never refreshes the cache.
+        
+        Args:
+            url: URL to scrape (uses config.page_url if not provided)
+            override_robots: If True, proceed even if robots.txt is UNKNOWN
+            save_raw: If True, save raw response to disk
+        
+        Returns:
+            ScraperResult with extracted data and metadata
+        """
+        self._live_query_id = None
+        result = super().scrape(url=url, override_robots=override_robots, save_raw=save_raw)
+        if result.success and self._live_query_id:
+            self._store_cached_result(self._live_query_id, result.data)
+        return result
+    
+    def _store_cached_result(self, query_id: Optional[str], df: pd.DataFrame) -> None:
+        """Write parsed results to the on-disk cache if caching is enabled."""
+        if not query_id or not self._cache_ttl():
+            return
+        try:
+            df.to_parquet(self._result_cache_path(query_id), index=False)
+        except Exception as e:
+            self.logger.warning(f"Could not cache results for query {query_id}: {e}")
+    
+    def get_raw_content(self, raw_data: Dict[str, Any]) -> Any:
+        """
+        Get the raw response to save for a fetch_raw result.
+        
+        Cached results save a pointer to the cache file. DataFrame results (SDK
+        executions, combined queries) save as JSON rows, in the same shape as
+        API results.
+        """
+        if raw_data.get("type") == "cached_parquet":
+            return {k: v for k, v in raw_data.items() if k != "content"}
+        if raw_data.get("type") == "api_dataframe":
+            content = raw_data["content"]
+            rows_json = content["df"].to_json(orient="records", date_format="iso")
+            return f'{{"rows": {rows_json}, "metadata": {json.dumps(content["metadata"])}}}'
+        return super().get_raw_content(raw_data)
+    
+    def _rows_to_dataframe(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build a DataFrame from Dune result rows.
+        
+        Arrow infers each column's type in one typed pass instead of pandas'
+        row-by-row dict constructor. The struct array takes the union of keys
+        across all rows, like pd.DataFrame(rows) does.
+        
+        Args:
+            rows: Result rows as dicts
+        
+        Returns:
+            DataFrame with one column per key
+        """
+        if PYARROW_AVAILABLE:
+            try:
+                table = pa.Table.from_struct_array(pa.array(rows))
+            except (pa.ArrowException, TypeError, ValueError, OverflowError) as e:
+                # Mixed-type columns, non-dict rows and integers wider than 64 bits
+                # (e.g. wei amounts) need pandas' object inference
+                self.logger.debug(f"Arrow conversion failed, using pandas: {e}")
+            else:
+                return table.to_pandas()
+        return pd.DataFrame(rows)
+    
     def parse_raw(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
         """
         Parse Dune query results into DataFrame.
@@ -585,34 +1343,46 @@ class DuneScraper(BaseScraper):
         Returns:
             Parsed DataFrame
         """
+        # Results from the on-disk cache were parsed when they were stored
+        if raw_data.get("type") == "cached_parquet":
+            return raw_data["content"]
+        
         results_data = raw_data.get("content", {})
         
         if not results_data:
             self.logger.error("No results data to parse")
-            return pd.DataFrame()
+            return self._EMPTY_DF.copy()
         
-        # Dune API returns results in different formats
-        # Format 1: { "result": { "rows": [...], "metadata": {...} } }
-        # Format 2: { "rows": [...], "metadata": {...} }
-        
-        rows = None
-        if "result" in results_data and "rows" in results_data["result"]:
-            rows = results_data["result"]["rows"]
-        elif "rows" in results_data:
-            rows = results_data["rows"]
-        elif isinstance(results_data, list):
-            rows = results_data
-        
-        if not rows:
-            self.logger.error("No rows found in results")
-            return pd.DataFrame()
+        # SDK results already arrive as a DataFrame
+        if isinstance(results_data, dict) and "df" in results_data:
+            df = results_data["df"]
+        else:
+            # Dune API returns results in different formats
+            # Format 1: { "result": { "rows": [...], "metadata": {...} } }
+            # Format 2: { "rows": [...], "metadata": {...} }
+            
+            rows = None
+            if "result" in results_data and "rows" in results_data["result"]:
+                rows = results_data["result"]["rows"]
+            elif "rows" in results_data:
+                rows = results_data["rows"]
+            elif isinstance(results_data, list):
+                rows = results_data
+            
+            if not rows:
+                self.logger.error("No rows found in results")
+                return self._EMPTY_DF.copy()
+            
+            # Convert to DataFrame
+            df = self._rows_to_dataframe(rows)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(rows)
+        if df.empty:
+            self.logger.error("No data found in result rows")
+            return df
         
         # Apply field mappings if available
-        if self.config and self.config.field_mappings:
-            rename_map = {v: k for k, v in self.config.field_mappings.items()}
+        if self._rename_map:
+            rename_map = self._rename_map
             
             # Only rename columns that exist in the DataFrame
             existing_rename_map = {k: v for k, v in rename_map.items() if k in df.columns}
@@ -621,21 +1391,45 @@ class DuneScraper(BaseScraper):
                 self.logger.debug(f"Renamed columns: {existing_rename_map}")
             else:
                 # If no exact matches, try fuzzy matching (case-insensitive, partial matches)
+                # Column names are lowercased once and all renames are applied together
+                columns = list(df.columns)
+                lower_columns = [col.lower() for col in columns]
+                lower_index = {}
+                for i, col_lower in enumerate(lower_columns):
+                    lower_index.setdefault(col_lower, i)
+                
                 for target_col, source_col in rename_map.items():
-                    if source_col not in df.columns:
-                        # Try case-insensitive match
-                        for col in df.columns:
-                            if col.lower() == source_col.lower():
-                                df = df.rename(columns={col: target_col})
-                                self.logger.debug(f"Fuzzy matched: {col} -> {target_col}")
-                                break
+                    if source_col in columns:
+                        continue
+                    source_lower = source_col.lower()
+                    # Try case-insensitive match
+                    i = lower_index.get(source_lower)
+                    if i is not None:
+                        self.logger.debug(f"Fuzzy matched: {columns[i]} -> {target_col}")
+                    else:
+                        # Try partial match: only substring matches qualify; rapidfuzz
+                        # picks the most similar of them, else the first one wins
+                        candidates = [
+                            j for j, col_lower in enumerate(lower_columns)
+                            if source_lower in col_lower or col_lower in source_lower
+                        ]
+                        if not candidates:
+                            continue
+                        if RAPIDFUZZ_AVAILABLE and len(candidates) > 1:
+                            i = max(candidates, key=lambda j: fuzz.ratio(source_lower, lower_columns[j]))
                         else:
-                            # Try partial match
-                            for col in df.columns:
-                                if source_col.lower() in col.lower() or col.lower() in source_col.lower():
-                                    df = df.rename(columns={col: target_col})
-                                    self.logger.debug(f"Partial matched: {col} -> {target_col}")
-                                    break
+                            i = candidates[0]
+                        self.logger.debug(f"Partial matched: {columns[i]} -> {target_col}")
+                    
+                    matched_col = columns[i]
+                    columns = [target_col if col == matched_col else col for col in columns]
+                    lower_columns = [col.lower() for col in columns]
+                    lower_index = {}
+                    for j, col_lower in enumerate(lower_columns):
+                        lower_index.setdefault(col_lower, j)
+                
+                if columns != list(df.columns):
+                    df = df.set_axis(columns, axis=1)
         
         self.logger.info(f"Parsed {len(df)} rows from Dune query")
         return df
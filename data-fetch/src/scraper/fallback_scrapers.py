@@ -4,15 +4,37 @@ CoinGecko, CoinDesk (formerly CryptoCompare), and other public APIs.
 """
 
 import os
+import re
 import json
-import requests
-from typing import Dict, Any, Optional, List
+import time
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Dict, Any, Optional, List, Deque, Tuple
+from collections import deque
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
+from urllib3.util.retry import Retry
+
+# Try to use orjson for decoding API responses, fallback to stdlib json if not available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Try to import aiohttp for concurrent Alpha Vantage fetches, fallback to sequential requests if not available
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
 
 from .base_scraper import BaseScraper, ScraperResult
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
 from ..utils.config_manager import ConfigManager, SiteConfig
 from ..utils.io_utils import generate_run_id
 
@@ -25,8 +47,16 @@ class CoinGeckoScraper(BaseScraper):
     """
     
     # CoinGecko API endpoints
-    API_BASE_FREE = "https://api.coingecko.com/api/v3"
-    API_BASE_PRO = "https://pro-api.coingecko.com/api/v3"
+    API_HOST_FREE = "https://api.coingecko.com"
+    API_HOST_PRO = "https://pro-api.coingecko.com"
+    API_BASE_FREE = f"{API_HOST_FREE}/api/v3"
+    API_BASE_PRO = f"{API_HOST_PRO}/api/v3"
+    
+    # Repeated identical market_chart payloads skip re-parsing
+    MEMOIZE_PARSE = True
+    
+    # Requests allowed back-to-back before the per-interval spacing applies
+    RATE_LIMIT_BURST = 5
     
     def __init__(
         self,
@@ -61,109 +91,108 @@ class CoinGeckoScraper(BaseScraper):
         self.use_pro_api = use_pro_api
         self.api_base = self.API_BASE_PRO if self.use_pro_api else self.API_BASE_FREE
         
-        # Rate limiting (Pro API has higher limits)
-        self._last_request_time: Optional[datetime] = None
-        self._min_request_interval = 0.5 if self.use_pro_api else 1.0  # seconds
-    
-    def _get_headers(self) -> dict:
-        """Get request headers."""
-        headers = {
+        # API host for this tier, and the other tier's host to rewrite in configured endpoints
+        self._host, self._other_host = (
+            (self.API_HOST_PRO, self.API_HOST_FREE) if self.use_pro_api
+            else (self.API_HOST_FREE, self.API_HOST_PRO)
+        )
+        
+        # CoinGecko uses different key names based on plan type; the query param uses underscores
+        self._header_name = "x-cg-pro-api-key" if self.use_pro_api else "x-cg-demo-api-key"
+        self._query_name = "x_cg_pro_api_key" if self.use_pro_api else "x_cg_demo_api_key"
+        self._headers = {
             "User-Agent": self.user_agent,
             "Accept": "application/json",
         }
         if self.api_key:
-            # CoinGecko uses different header names based on plan type
-            if self.use_pro_api:
-                headers["x-cg-pro-api-key"] = self.api_key
-            else:
-                headers["x-cg-demo-api-key"] = self.api_key
-        return headers
+            self._headers[self._header_name] = self.api_key
+        
+        # Rate limiting (Pro API has higher limits)
+        self._min_request_interval = 0.5 if self.use_pro_api else 1.0  # seconds
+        # Token bucket: steady one request per interval, short bursts up to capacity
+        self._bucket = TokenBucket(
+            capacity=self.RATE_LIMIT_BURST,
+            tokens=self.RATE_LIMIT_BURST,
+            refill_rate=1.0 / self._min_request_interval,
+            last_refill=time.monotonic(),
+        )
+    
+    def _get_headers(self) -> dict:
+        """Get request headers (built once in __init__)."""
+        return self._headers
     
     def _rate_limit(self):
         """Apply rate limiting."""
-        import time
-        if self._last_request_time:
-            elapsed = (datetime.now() - self._last_request_time).total_seconds()
-            if elapsed < self._min_request_interval:
-                time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = datetime.now()
+        if not self._bucket.consume():
+            time.sleep(self._bucket.wait_time())
+            self._bucket.consume()
     
     def fetch_raw(self, url: str) -> Dict[str, Any]:
         """Fetch data from CoinGecko API."""
-        self._rate_limit()
-        
         # Determine endpoint
         if "market_chart" in url or "simple/price" in url:
             endpoint = url
-            # Ensure required parameters are present for market_chart
-            if "market_chart" in endpoint and "vs_currency" not in endpoint:
-                separator = "&" if "?" in endpoint else "?"
-                endpoint = f"{endpoint}{separator}vs_currency=usd&days=30"
         elif self.config and self.config.data_source.endpoint:
             endpoint = self.config.data_source.endpoint
-            # Ensure required parameters for market_chart
-            if "market_chart" in endpoint and "vs_currency" not in endpoint:
-                separator = "&" if "?" in endpoint else "?"
-                endpoint = f"{endpoint}{separator}vs_currency=usd&days=30"
         else:
             # Default to BTC market chart
             endpoint = f"{self.api_base}/coins/bitcoin/market_chart?vs_currency=usd&days=30"
         
-        # Ensure we're using the correct API base URL
-        if endpoint.startswith("https://api.coingecko.com") and self.use_pro_api:
-            endpoint = endpoint.replace("https://api.coingecko.com", self.API_BASE_PRO)
-        elif endpoint.startswith("https://pro-api.coingecko.com") and not self.use_pro_api:
-            endpoint = endpoint.replace("https://pro-api.coingecko.com", self.API_BASE_FREE)
+        # Ensure required parameters are present for market_chart
+        if "market_chart" in endpoint and "vs_currency" not in endpoint:
+            separator = "&" if "?" in endpoint else "?"
+            endpoint = f"{endpoint}{separator}vs_currency=usd&days=30"
+        
+        # Ensure we're using the correct API host for the plan tier
+        if endpoint.startswith(self._other_host):
+            endpoint = self._host + endpoint[len(self._other_host):]
         
         # Add API key as query parameter (CoinGecko supports both header and query param)
-        # Query param uses underscores: x_cg_demo_api_key or x_cg_pro_api_key
-        if self.api_key:
-            from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-            parsed = urlparse(endpoint)
-            query_params = parse_qs(parsed.query)
-            
-            # Add API key as query parameter (CoinGecko's preferred method for demo keys)
-            if self.use_pro_api:
-                query_params["x_cg_pro_api_key"] = [self.api_key]
-            else:
-                query_params["x_cg_demo_api_key"] = [self.api_key]
-            
-            # Rebuild URL with query params
-            new_query = urlencode(query_params, doseq=True)
-            endpoint = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                new_query,
-                parsed.fragment
-            ))
+        # Query param uses underscores: x_cg_demo_api_key or x_cg_pro_api_key; requests
+        # appends it to any query string already in the endpoint
+        params = None
+        if self.api_key and f"{self._query_name}=" not in endpoint:
+            params = {self._query_name: self.api_key}
         
         api_tier = "Pro" if self.use_pro_api else "Free/Demo"
         self.logger.info(f"Fetching from CoinGecko ({api_tier}): {endpoint[:100]}...")
         
-        # Use headers as well (CoinGecko accepts both methods)
-        response = requests.get(
-            endpoint,
-            headers=self._get_headers(),
-            timeout=self.timeout,
-        )
+        # A fresh disk-cache hit needs no request, so it doesn't spend a rate-limit token
+        response = self._fresh_cached_response(endpoint, params)
+        if response is None:
+            self._rate_limit()
+            # Use headers as well (CoinGecko accepts both methods)
+            response = self._cached_get(
+                endpoint,
+                params=params,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+            )
         
         response.raise_for_status()
         
         return {
             "type": "api_json",
-            "content": response.text,
-            "endpoint_url": endpoint.split("?")[0] if "?" in endpoint else endpoint,  # Don't log full URL with key
+            "content": response.content,
+            "endpoint_url": response.url.split("?")[0],  # Don't log full URL with key
             "status_code": response.status_code,
         }
     
+    def _can_memoize_parse(self, raw_data: Dict[str, Any]) -> bool:
+        """Only market_chart payloads are memoized; simple/price rows are stamped with the parse time."""
+        return "market_chart" in (raw_data.get("endpoint_url") or "")
+    
+    @staticmethod
+    def _chart_array(points: Optional[List[List[float]]]) -> np.ndarray:
+        """Convert a market_chart series of [timestamp, value] pairs to an (N, 2) float array."""
+        return np.asarray(points or [], dtype=np.float64).reshape(-1, 2)
+    
     def parse_raw(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
         """Parse CoinGecko API response."""
         content = raw_data.get("content")
         
         try:
-            json_data = json.loads(content) if isinstance(content, str) else content
+            json_data = _json_loads(content) if isinstance(content, (str, bytes, bytearray)) else content
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON: {e}")
             return pd.DataFrame()
@@ -195,23 +224,23 @@ class CoinGeckoScraper(BaseScraper):
         # CoinGecko market_chart format:
         # { "prices": [[timestamp, price], ...], "total_volumes": [[timestamp, volume], ...] }
         elif "prices" in json_data:
-            prices = json_data.get("prices", [])
-            volumes = json_data.get("total_volumes", [])
-            market_caps = json_data.get("market_caps", [])
-            
-            data = []
-            for i, (ts, price) in enumerate(prices):
-                row = {
-                    "date": pd.to_datetime(ts, unit="ms"),
-                    "price": price,
-                }
-                if i < len(volumes):
-                    row["volume"] = volumes[i][1]
-                if i < len(market_caps):
-                    row["market_cap"] = market_caps[i][1]
-                data.append(row)
+            prices = self._chart_array(json_data.get("prices"))
             
-            df = pd.DataFrame(data)
+            if len(prices):
+                df = pd.DataFrame({
+                    "date": pd.to_datetime(prices[:, 0].astype(np.int64), unit="ms"),
+                    "price": prices[:, 1],
+                })
+                # Shorter series are padded with NaN, longer ones truncated to the price index
+                for column, key in (("volume", "total_volumes"), ("market_cap", "market_caps")):
+                    series = self._chart_array(json_data.get(key))
+                    if len(series):
+                        values = np.full(len(prices), np.nan)
+                        n = min(len(prices), len(series))
+                        values[:n] = series[:n, 1]
+                        df[column] = values
+            else:
+                df = pd.DataFrame()
         
         elif isinstance(json_data, list):
             # Exchange list format
@@ -220,9 +249,9 @@ class CoinGeckoScraper(BaseScraper):
         else:
             df = pd.DataFrame([json_data])
         
-        # Sort by date if present
-        if "date" in df.columns:
-            df = df.sort_values("date").reset_index(drop=True)
+        # Sort by date if present (the API usually returns it sorted already)
+        if "date" in df.columns and not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date", kind="mergesort").reset_index(drop=True)
         
         self.logger.info(f"Parsed {len(df)} rows from CoinGecko")
         return df
@@ -240,6 +269,13 @@ class CryptoCompareScraper(BaseScraper):
     # Legacy CryptoCompare endpoint (still works but deprecated)
     LEGACY_API_BASE = "https://min-api.cryptocompare.com/data"
     
+    # Historical data often comes back unchanged between scheduled runs
+    MEMOIZE_PARSE = True
+    
+    # Date parameters rewritten in configured CoinDesk endpoints, compiled once
+    START_DATE_PATTERN = re.compile(r"start=[^&]+")
+    END_DATE_PATTERN = re.compile(r"end=[^&]+")
+    
     def __init__(
         self,
         config: Optional[SiteConfig] = None,
@@ -284,20 +320,17 @@ class CryptoCompareScraper(BaseScraper):
             endpoint = self.config.data_source.endpoint
             # Update date parameters if they're in the endpoint and outdated
             if self.use_coindesk and "start=" in endpoint and "end=" in endpoint:
-                from datetime import datetime, timedelta
                 today = datetime.now()
                 # Update to last 30 days if dates are old
                 if "2024-01" in endpoint or "2023" in endpoint:
                     end_date = today.strftime("%Y-%m-%d")
                     start_date = (today - timedelta(days=30)).strftime("%Y-%m-%d")
                     # Replace date parameters
-                    import re
-                    endpoint = re.sub(r"start=[^&]+", f"start={start_date}", endpoint)
-                    endpoint = re.sub(r"end=[^&]+", f"end={end_date}", endpoint)
+                    endpoint = self.START_DATE_PATTERN.sub(f"start={start_date}", endpoint)
+                    endpoint = self.END_DATE_PATTERN.sub(f"end={end_date}", endpoint)
         else:
             if self.use_coindesk:
                 # CoinDesk API endpoint for BTC price history - use current dates
-                from datetime import datetime, timedelta
                 today = datetime.now()
                 end_date = today.strftime("%Y-%m-%d")
                 start_date = (today - timedelta(days=30)).strftime("%Y-%m-%d")
@@ -309,7 +342,7 @@ class CryptoCompareScraper(BaseScraper):
         api_name = "CoinDesk" if self.use_coindesk else "CryptoCompare"
         self.logger.info(f"Fetching from {api_name}: {endpoint}")
         
-        response = requests.get(
+        response = self._cached_get(
             endpoint,
             headers=self._get_headers(),
             timeout=self.timeout,
@@ -319,17 +352,26 @@ class CryptoCompareScraper(BaseScraper):
         
         return {
             "type": "api_json",
-            "content": response.text,
+            "content": response.content,
             "endpoint_url": endpoint,
             "status_code": response.status_code,
         }
     
+    @staticmethod
+    def _flatten_list_value(value: Any) -> Any:
+        """Reduce a list cell to its single numeric element, or its string representation."""
+        if not isinstance(value, list):
+            return value
+        if len(value) == 1 and isinstance(value[0], (int, float)):
+            return value[0]
+        return str(value)
+    
     def parse_raw(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
         """Parse CoinDesk or CryptoCompare API response."""
         content = raw_data.get("content")
         
         try:
-            json_data = json.loads(content) if isinstance(content, str) else content
+            json_data = _json_loads(content) if isinstance(content, (str, bytes, bytearray)) else content
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON: {e}")
             return pd.DataFrame()
@@ -339,9 +381,11 @@ class CryptoCompareScraper(BaseScraper):
             # { "bpi": { "2024-01-01": 42000.5, "2024-01-02": 43000.2, ... }, "disclaimer": "...", "time": {...} }
             if "bpi" in json_data:
                 bpi_data = json_data["bpi"]
-                data = [{"date": date, "price": price} for date, price in bpi_data.items()]
-                df = pd.DataFrame(data)
-                df["date"] = pd.to_datetime(df["date"])
+                # Build both columns directly instead of one dict per date
+                df = pd.DataFrame({
+                    "date": pd.to_datetime(list(bpi_data.keys())),
+                    "price": list(bpi_data.values()),
+                })
             else:
                 # Try other CoinDesk formats
                 df = pd.DataFrame([json_data])
@@ -354,30 +398,12 @@ class CryptoCompareScraper(BaseScraper):
             if "Response" in json_data and "Data" in json_data:
                 # Exchange volume format - Data is a list of objects
                 data = json_data["Data"]
-                if isinstance(data, list) and len(data) > 0:
-                    # Flatten nested objects in the data
-                    flattened_data = []
-                    for item in data:
-                        if isinstance(item, dict):
-                            flat_item = {}
-                            for key, value in item.items():
-                                # Handle nested objects/dicts
-                                if isinstance(value, dict):
-                                    # Flatten nested dict by prefixing keys
-                                    for nested_key, nested_value in value.items():
-                                        flat_item[f"{key}_{nested_key}"] = nested_value
-                                elif isinstance(value, list):
-                                    # Convert lists to string representation or first element
-                                    if len(value) > 0 and isinstance(value[0], (int, float)):
-                                        flat_item[key] = value[0] if len(value) == 1 else str(value)
-                                    else:
-                                        flat_item[key] = str(value)
-                                else:
-                                    flat_item[key] = value
-                            flattened_data.append(flat_item)
-                        else:
-                            flattened_data.append(item)
-                    df = pd.DataFrame(flattened_data)
+                if isinstance(data, list) and len(data) > 0 and all(isinstance(item, dict) for item in data):
+                    # Flatten nested objects in the data by prefixing keys
+                    df = pd.json_normalize(data, sep="_", max_level=1)
+                    # Convert lists to their single numeric element or string representation
+                    for col in df.columns[df.dtypes == object]:
+                        df[col] = df[col].map(self._flatten_list_value)
                 else:
                     df = pd.DataFrame([data] if not isinstance(data, list) else data)
             else:
@@ -411,18 +437,21 @@ class CryptoCompareScraper(BaseScraper):
             df = df.rename(columns=column_map)
             
             # Clean up object columns that might contain [object Object]
-            for col in df.columns:
-                if df[col].dtype == object:
-                    # Check if column contains string representations of objects
-                    sample = df[col].dropna().iloc[0] if len(df[col].dropna()) > 0 else None
-                    if sample and isinstance(sample, str) and "[object" in sample.lower():
-                        # Try to extract meaningful data or remove the column
-                        self.logger.warning(f"Column '{col}' contains object representations, removing")
-                        df = df.drop(columns=[col])
-        
-        # Sort by date
-        if "date" in df.columns:
-            df = df.sort_values("date").reset_index(drop=True)
+            object_df = df.loc[:, df.dtypes == object]
+            if not object_df.empty:
+                # First non-null value of every object column in one pass
+                samples = object_df.bfill().iloc[0]
+                object_cols = [
+                    col for col, sample in samples.items()
+                    if isinstance(sample, str) and "[object" in sample.lower()
+                ]
+                if object_cols:
+                    self.logger.warning(f"Columns {object_cols} contain object representations, removing")
+                    df = df.drop(columns=object_cols)
+        
+        # Sort by date (skipped when already in order, as BPI and histoday data usually are)
+        if "date" in df.columns and not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date", kind="mergesort").reset_index(drop=True)
         
         api_name = "CoinDesk" if self.use_coindesk else "CryptoCompare"
         self.logger.info(f"Parsed {len(df)} rows from {api_name}")
@@ -439,6 +468,8 @@ class AlphaVantageScraper(BaseScraper):
     # Alpha Vantage API base URL
     API_BASE = "https://www.alphavantage.co/query"
     
+    MEMOIZE_PARSE = True
+    
     # Top 20 stocks by market cap (predefined list)
     TOP_20_STOCKS = [
         "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "BRK.B", 
@@ -446,6 +477,27 @@ class AlphaVantageScraper(BaseScraper):
         "ABBV", "AVGO"
     ]
     
+    # Retry transient server errors and HTTP 429s with exponential backoff,
+    # honouring Retry-After (quota "Note" responses arrive as 200 and are
+    # handled separately)
+    HTTP_MAX_RETRIES = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    
+    # Concurrent OVERVIEW requests in fetch_top_stocks_by_market_cap
+    MAX_CONCURRENT_REQUESTS = 5
+    
+    # OVERVIEW fields converted from strings to numbers when parsing
+    NUMERIC_FIELDS = [
+        "MarketCapitalization", "EBITDA", "PERatio", "PEGRatio", "BookValue",
+        "DividendYield", "EPS", "RevenuePerShareTTM", "ProfitMargin", "OperatingMarginTTM",
+    ]
+    
     def __init__(
         self,
         config: Optional[SiteConfig] = None,
@@ -480,39 +532,62 @@ class AlphaVantageScraper(BaseScraper):
             self.logger.warning("ALPHA_VANTAGE_API_KEY not found in environment or Streamlit secrets")
         
         # Rate limiting (free tier: 5 calls/minute)
-        self._last_request_time: Optional[datetime] = None
         self._min_request_interval = 12.0  # seconds (60/5 = 12 seconds between calls)
-        self._request_times: List[datetime] = []  # Track last 5 requests
+        self._request_times: Deque[float] = deque()  # time.monotonic() of requests in the last minute
     
-    def _rate_limit(self):
-        """Apply rate limiting (5 calls per minute for free tier)."""
-        import time
-        now = datetime.now()
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve the next request slot within the 5 calls per minute quota.
         
-        # Remove requests older than 1 minute
-        self._request_times = [
-            req_time for req_time in self._request_times
-            if (now - req_time).total_seconds() < 60
-        ]
+        The request is recorded at the time it may be sent, so callers that
+        reserve several slots up front (concurrent fetches) are spaced out
+        correctly instead of all waiting for the same slot.
         
-        # If we have 5 requests in the last minute, wait
-        if len(self._request_times) >= 5:
-            # Wait until the oldest request is more than 1 minute old
-            oldest_request = min(self._request_times)
-            wait_time = 60 - (now - oldest_request).total_seconds() + 1
-            if wait_time > 0:
-                self.logger.info(f"Rate limit: waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                # Clean up again after waiting
-                now = datetime.now()
-                self._request_times = [
-                    req_time for req_time in self._request_times
-                    if (now - req_time).total_seconds() < 60
-                ]
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = time.monotonic()
+        request_times = self._request_times
+        
+        # Remove requests older than 1 minute (times are booked in order)
+        while request_times and now - request_times[0] >= 60:
+            request_times.popleft()
+        
+        # If 5 requests are already booked in the last minute, wait until the
+        # 5th most recent one is more than 1 minute old
+        wait_time = 0.0
+        if len(request_times) >= 5:
+            wait_time = max(0.0, 60 - (now - request_times[-5]) + 1)
         
         # Record this request
-        self._request_times.append(datetime.now())
-        self._last_request_time = now
+        request_times.append(now + wait_time)
+        return wait_time
+    
+    def _quota_retry_delay(self) -> float:
+        """
+        Get how long to wait after a rate-limit "Note" before retrying.
+        
+        The note means the quota is used up, so wait until the oldest request
+        in the last minute leaves the window rather than a fixed minute. With no
+        recent requests of our own (quota spent elsewhere) a full minute is used.
+        
+        Returns:
+            Seconds to wait
+        """
+        now = time.monotonic()
+        request_times = self._request_times
+        while request_times and now - request_times[0] >= 60:
+            request_times.popleft()
+        if not request_times:
+            return 60.0
+        return max(0.0, 60 - (now - request_times[0]) + 1)
+    
+    def _rate_limit(self):
+        """Apply rate limiting (5 calls per minute for free tier)."""
+        wait_time = self._reserve_request_slot()
+        if wait_time > 0:
+            self.logger.info(f"Rate limit: waiting {wait_time:.1f} seconds...")
+            time.sleep(wait_time)
     
     def _get_headers(self) -> dict:
         """Get request headers."""
@@ -541,8 +616,6 @@ class AlphaVantageScraper(BaseScraper):
                     "Get a free API key from https://www.alphavantage.co/support/#api-key"
                 )
         
-        self._rate_limit()
-        
         # Determine endpoint
         if self.config and self.config.data_source.endpoint:
             endpoint = self.config.data_source.endpoint
@@ -566,35 +639,62 @@ class AlphaVantageScraper(BaseScraper):
         
         self.logger.info(f"Fetching from Alpha Vantage: {endpoint.split('apikey=')[0]}...")
         
-        response = requests.get(
-            endpoint,
-            headers=self._get_headers(),
-            timeout=self.timeout,
-        )
+        # A fresh disk-cache hit needs no request, so it doesn't book a rate-limit slot
+        response = self._fresh_cached_response(endpoint)
+        if response is None:
+            self._rate_limit()
+            response = self._cached_get(
+                endpoint,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+            )
         
         response.raise_for_status()
-        json_data = response.json()
+        json_data = _json_loads(response.content)
         
-        # Check for API errors
+        # Check for API errors (sent with status 200, so drop them from the response cache)
         if "Error Message" in json_data:
             error_msg = json_data["Error Message"]
             self.logger.error(f"Alpha Vantage API error: {error_msg}")
+            self._discard_cached_response(endpoint)
             raise ValueError(f"Alpha Vantage API error: {error_msg}")
         
         if "Note" in json_data:
             # Rate limit message
             note = json_data["Note"]
+            self._discard_cached_response(endpoint)
             self.logger.warning(f"Alpha Vantage rate limit: {note}")
             raise ValueError(f"Rate limit exceeded: {note}")
         
         return {
             "type": "api_json",
-            "content": response.text,
+            "content": response.content,
             "endpoint_url": endpoint.split("apikey=")[0] if "apikey=" in endpoint else endpoint,
             "status_code": response.status_code,
             "json_data": json_data,  # Include parsed JSON for convenience
         }
     
+    def _convert_overview_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert OVERVIEW records to typed, Arrow-backed columns.
+        
+        Alpha Vantage sends every value as a string (e.g. "1234567890"), with
+        "None" or "-" for missing values. NUMERIC_FIELDS are converted to
+        numbers in one pass (missing values become NA), then all columns move
+        to pyarrow dtypes so the dozens of text fields per company are stored
+        as Arrow strings rather than Python objects.
+        
+        Args:
+            df: DataFrame of OVERVIEW records
+        
+        Returns:
+            DataFrame with NUMERIC_FIELDS converted where present
+        """
+        present = [col for col in self.NUMERIC_FIELDS if col in df.columns]
+        if present:
+            df[present] = df[present].apply(pd.to_numeric, errors="coerce")
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    
     def parse_raw(self, raw_data: Dict[str, Any]) -> pd.DataFrame:
         """Parse Alpha Vantage API response."""
         # Use pre-parsed JSON if available, otherwise parse from content
@@ -603,7 +703,7 @@ class AlphaVantageScraper(BaseScraper):
         else:
             content = raw_data.get("content")
             try:
-                json_data = json.loads(content) if isinstance(content, str) else content
+                json_data = _json_loads(content) if isinstance(content, (str, bytes, bytearray)) else content
             except json.JSONDecodeError as e:
                 self.logger.error(f"Failed to parse JSON: {e}")
                 return pd.DataFrame()
@@ -629,13 +729,7 @@ class AlphaVantageScraper(BaseScraper):
             # Try to convert to DataFrame
             df = pd.DataFrame([json_data])
         
-        # Convert MarketCapitalization to numeric if present
-        if "MarketCapitalization" in df.columns:
-            # Market cap is usually a string like "1234567890"
-            df["MarketCapitalization"] = pd.to_numeric(
-                df["MarketCapitalization"], 
-                errors="coerce"
-            )
+        df = self._convert_overview_dtypes(df)
         
         # Sort by MarketCapitalization if present
         if "MarketCapitalization" in df.columns:
@@ -644,77 +738,211 @@ class AlphaVantageScraper(BaseScraper):
         self.logger.info(f"Parsed {len(df)} rows from Alpha Vantage")
         return df
     
-    def fetch_top_stocks_by_market_cap(self) -> pd.DataFrame:
+    def _fetch_overview(self, i: int, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch company overview for top 20 stocks by market cap.
+        Fetch the company overview for one symbol.
+        
+        Args:
+            i: Position of the symbol in the batch (for progress logging)
+            symbol: Stock symbol
         
         Returns:
-            DataFrame with all stocks, sorted by market cap descending
+            Overview dict, or None if the symbol failed
         """
-        if not self.api_key:
-            raise ValueError("ALPHA_VANTAGE_API_KEY is required")
-        
-        all_data = []
-        failed_symbols = []
-        
-        self.logger.info(f"Fetching company overview for {len(self.TOP_20_STOCKS)} stocks...")
-        
-        for i, symbol in enumerate(self.TOP_20_STOCKS, 1):
-            try:
-                self.logger.info(f"Fetching {i}/{len(self.TOP_20_STOCKS)}: {symbol}")
-                
-                # Build endpoint URL
-                endpoint = f"{self.API_BASE}?function=OVERVIEW&symbol={symbol}&apikey={self.api_key}"
-                
-                # Apply rate limiting
+        try:
+            self.logger.info(f"Fetching {i}/{len(self.TOP_20_STOCKS)}: {symbol}")
+            
+            # Build endpoint URL
+            endpoint = f"{self.API_BASE}?function=OVERVIEW&symbol={symbol}&apikey={self.api_key}"
+            
+            # Apply rate limiting
+            self._rate_limit()
+            
+            # Make request
+            response = self.session.get(
+                endpoint,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+            )
+            
+            response.raise_for_status()
+            json_data = _json_loads(response.content)
+            
+            # Check for errors
+            if "Error Message" in json_data:
+                error_msg = json_data["Error Message"]
+                self.logger.warning(f"Error fetching {symbol}: {error_msg}")
+                return None
+            
+            if "Note" in json_data:
+                note = json_data["Note"]
+                self.logger.warning(f"Rate limit for {symbol}: {note}")
+                # Wait for the quota window to free a slot, then retry once
+                time.sleep(self._quota_retry_delay())
                 self._rate_limit()
-                
-                # Make request
-                response = requests.get(
+                response = self.session.get(
                     endpoint,
                     headers=self._get_headers(),
                     timeout=self.timeout,
                 )
-                
                 response.raise_for_status()
-                json_data = response.json()
+                json_data = _json_loads(response.content)
+                if "Error Message" in json_data or "Note" in json_data:
+                    return None
+            
+            # Add to results
+            if "Symbol" in json_data:
+                return json_data
+            self.logger.warning(f"No data returned for {symbol}")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching {symbol}: {e}")
+            return None
+    
+    async def _fetch_overview_async(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        i: int,
+        symbol: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of _fetch_overview; rate-limit waits yield to other symbols."""
+        endpoint = f"{self.API_BASE}?function=OVERVIEW&symbol={symbol}&apikey={self.api_key}"
+        
+        async def _get() -> Dict[str, Any]:
+            async with session.get(endpoint) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        
+        try:
+            # Reserve a slot in the per-minute window before taking a connection
+            wait_time = self._reserve_request_slot()
+            if wait_time > 0:
+                self.logger.info(f"Rate limit: {symbol} waiting {wait_time:.1f} seconds...")
+                await asyncio.sleep(wait_time)
+            
+            async with semaphore:
+                self.logger.info(f"Fetching {i}/{len(self.TOP_20_STOCKS)}: {symbol}")
+                json_data = await _get()
                 
                 # Check for errors
                 if "Error Message" in json_data:
-                    error_msg = json_data["Error Message"]
-                    self.logger.warning(f"Error fetching {symbol}: {error_msg}")
-                    failed_symbols.append(symbol)
-                    continue
+                    self.logger.warning(f"Error fetching {symbol}: {json_data['Error Message']}")
+                    return None
                 
                 if "Note" in json_data:
-                    note = json_data["Note"]
-                    self.logger.warning(f"Rate limit for {symbol}: {note}")
-                    # Wait longer and retry
-                    import time
-                    time.sleep(60)  # Wait 1 minute
-                    # Retry once
-                    response = requests.get(
-                        endpoint,
-                        headers=self._get_headers(),
-                        timeout=self.timeout,
-                    )
-                    response.raise_for_status()
-                    json_data = response.json()
+                    self.logger.warning(f"Rate limit for {symbol}: {json_data['Note']}")
+                    # Wait for the quota window to free a slot, then retry once
+                    await asyncio.sleep(self._quota_retry_delay())
+                    await asyncio.sleep(self._reserve_request_slot())
+                    json_data = await _get()
                     if "Error Message" in json_data or "Note" in json_data:
-                        failed_symbols.append(symbol)
-                        continue
-                
-                # Add to results
-                if "Symbol" in json_data:
-                    all_data.append(json_data)
-                else:
-                    self.logger.warning(f"No data returned for {symbol}")
-                    failed_symbols.append(symbol)
-                
-            except Exception as e:
-                self.logger.error(f"Error fetching {symbol}: {e}")
-                failed_symbols.append(symbol)
-                continue
+                        return None
+            
+            if "Symbol" in json_data:
+                return json_data
+            self.logger.warning(f"No data returned for {symbol}")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching {symbol}: {e}")
+            return None
+    
+    async def _fetch_overviews_async(self, symbols: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch company overviews for several symbols on one aiohttp session.
+        
+        Requests still respect the 5 calls/minute quota, but each one overlaps
+        its connection setup and response read with the others instead of
+        waiting for the previous symbol to finish.
+        
+        Args:
+            symbols: Stock symbols
+        
+        Returns:
+            Overview dict (or None if it failed) per symbol, in input order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS)
+        async with aiohttp.ClientSession(
+            headers=self._get_headers(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=connector,
+        ) as session:
+            return await asyncio.gather(*(
+                self._fetch_overview_async(session, semaphore, i, symbol)
+                for i, symbol in enumerate(symbols, 1)
+            ))
+    
+    def fetch_top_stocks_quotes(self) -> pd.DataFrame:
+        """
+        Fetch latest quotes for the top 20 stocks in one REALTIME_BULK_QUOTES call.
+        
+        The bulk endpoint takes up to 100 comma-separated symbols, so this costs
+        one request against the 5 calls/minute quota instead of 20. It returns
+        prices and volume only (no MarketCapitalization, Sector or other
+        OVERVIEW fields) and requires a premium API key.
+        
+        Returns:
+            DataFrame with one quote row per symbol (empty if the call fails)
+        """
+        if not self.api_key:
+            raise ValueError("ALPHA_VANTAGE_API_KEY is required")
+        
+        self._rate_limit()
+        
+        response = self.session.get(
+            self.API_BASE,
+            params={
+                "function": "REALTIME_BULK_QUOTES",
+                "symbol": ",".join(self.TOP_20_STOCKS),
+                "apikey": self.api_key,
+            },
+            headers=self._get_headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        json_data = _json_loads(response.content)
+        
+        # Errors, rate-limit notes and premium-only messages come back without "data"
+        if not isinstance(json_data.get("data"), list):
+            message = next(
+                (json_data[key] for key in ("Error Message", "Note", "Information") if key in json_data),
+                "no data returned",
+            )
+            self.logger.warning(f"Bulk quotes unavailable: {message}")
+            return pd.DataFrame()
+        
+        df = pd.DataFrame(json_data["data"])
+        self.logger.info(f"Fetched bulk quotes for {len(df)} stocks")
+        return df
+    
+    def fetch_top_stocks_by_market_cap(self) -> pd.DataFrame:
+        """
+        Fetch company overview for top 20 stocks by market cap.
+        
+        Returns:
+            DataFrame with all stocks, sorted by market cap descending
+        """
+        if not self.api_key:
+            raise ValueError("ALPHA_VANTAGE_API_KEY is required")
+        
+        self.logger.info(f"Fetching company overview for {len(self.TOP_20_STOCKS)} stocks...")
+        
+        if AIOHTTP_AVAILABLE:
+            overviews = asyncio.run(self._fetch_overviews_async(self.TOP_20_STOCKS))
+        else:
+            overviews = [
+                self._fetch_overview(i, symbol)
+                for i, symbol in enumerate(self.TOP_20_STOCKS, 1)
+            ]
+        
+        all_data = [overview for overview in overviews if overview is not None]
+        failed_symbols = [
+            symbol for symbol, overview in zip(self.TOP_20_STOCKS, overviews)
+            if overview is None
+        ]
         
         if not all_data:
             self.logger.error("No data fetched for any stocks")
@@ -723,12 +951,8 @@ class AlphaVantageScraper(BaseScraper):
         # Create DataFrame
         df = pd.DataFrame(all_data)
         
-        # Convert MarketCapitalization to numeric
+        df = self._convert_overview_dtypes(df)
         if "MarketCapitalization" in df.columns:
-            df["MarketCapitalization"] = pd.to_numeric(
-                df["MarketCapitalization"],
-                errors="coerce"
-            )
             # Sort by market cap descending
             df = df.sort_values("MarketCapitalization", ascending=False, na_position="last")
         
@@ -802,6 +1026,9 @@ class FallbackManager:
     Tries multiple sources in order until one succeeds.
     """
     
+    # Delay before launching the next fallback while earlier ones are still running
+    FALLBACK_STAGGER_SECONDS = 2.0
+    
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -822,6 +1049,38 @@ class FallbackManager:
             ("cryptocompare_exchange_volume", CryptoCompareScraper),  # Legacy CryptoCompare
             ("coingecko_exchange_volume", CoinGeckoScraper),
         ]
+        
+        # Fallback scrapers built so far, reused (with their sessions) across calls
+        self._scrapers: Dict[Tuple[str, type], BaseScraper] = {}
+        # Latest scrape() run per cached scraper; a cancelled race can leave one running
+        self._in_flight: Dict[Tuple[str, type], Future] = {}
+    
+    def _get_scraper(self, site_id: str, scraper_class: type) -> BaseScraper:
+        """
+        Get the fallback scraper for a site, creating it on first use.
+        
+        Args:
+            site_id: Site identifier
+            scraper_class: Scraper class to instantiate
+        
+        Returns:
+            Scraper instance
+        """
+        key = (site_id, scraper_class)
+        scraper = self._scrapers.get(key)
+        if scraper is None:
+            scraper = scraper_class(config=self.config_manager.get(site_id))
+            self._scrapers[key] = scraper
+        return scraper
+    
+    def close(self) -> None:
+        """Close the cached fallback scrapers and release their HTTP sessions."""
+        # Let scrapes abandoned by an earlier race finish before closing their sessions
+        wait_futures(list(self._in_flight.values()))
+        self._in_flight.clear()
+        for scraper in self._scrapers.values():
+            scraper.close()
+        self._scrapers.clear()
     
     def scrape_with_fallbacks(
         self,
@@ -831,6 +1090,11 @@ class FallbackManager:
         """
         Try primary scraper, then fallbacks if it fails.
         
+        Fallbacks are raced via scrape_with_fallbacks_async. When called from
+        code that already runs an event loop (where asyncio.run is not allowed),
+        they are tried one at a time instead; async callers should await
+        scrape_with_fallbacks_async directly.
+        
         Args:
             primary_scraper: Primary scraper to try first
             override_robots: Override robots.txt
@@ -838,6 +1102,13 @@ class FallbackManager:
         Returns:
             ScraperResult from first successful source
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.scrape_with_fallbacks_async(primary_scraper, override_robots=override_robots)
+            )
+        
         sources_tried = []
         
         # Try primary first
@@ -855,8 +1126,10 @@ class FallbackManager:
             self.logger.info(f"Trying fallback: {site_id}")
             
             try:
-                config = self.config_manager.get(site_id)
-                scraper = scraper_class(config=config)
+                scraper = self._get_scraper(site_id, scraper_class)
+                in_flight = self._in_flight.pop((site_id, scraper_class), None)
+                if in_flight is not None:
+                    wait_futures([in_flight])
                 
                 result = scraper.scrape(override_robots=override_robots)
                 
@@ -876,6 +1149,127 @@ class FallbackManager:
             error=f"All sources failed: {sources_tried}",
             metadata={"sources_tried": sources_tried},
         )
+    
+    @staticmethod
+    def _first_success(tasks: List[asyncio.Task]) -> Optional[ScraperResult]:
+        """
+        Get the successful result of the highest-ranked finished fallback.
+        
+        Args:
+            tasks: Fallback tasks in launch (fallback_order) order
+        
+        Returns:
+            First successful result in launch order, or None
+        """
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                result = task.result()
+                if result.success:
+                    return result
+        return None
+    
+    async def scrape_with_fallbacks_async(
+        self,
+        primary_scraper: BaseScraper,
+        override_robots: bool = False,
+    ) -> ScraperResult:
+        """
+        Try primary scraper, then race the fallbacks if it fails.
+        
+        Fallbacks are launched FALLBACK_STAGGER_SECONDS apart (a hedged request),
+        so a slow or timing-out source no longer delays the next one by its full
+        timeout. The first successful result wins and the remaining attempts are
+        cancelled; attempts already inside a blocking request finish in their
+        worker thread and their results are discarded. A cached scraper is not
+        reused until its abandoned attempt has finished.
+        
+        Args:
+            primary_scraper: Primary scraper to try first
+            override_robots: Override robots.txt
+        
+        Returns:
+            ScraperResult from first successful source
+        """
+        sources_tried = []
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=len(self.fallback_order) + 1)
+        
+        def _run_scrape(scraper: BaseScraper) -> ScraperResult:
+            return scraper.scrape(override_robots=override_robots)
+        
+        async def _try_fallback(site_id: str, scraper_class: type) -> ScraperResult:
+            self.logger.info(f"Trying fallback: {site_id}")
+            key = (site_id, scraper_class)
+            try:
+                scraper = self._get_scraper(site_id, scraper_class)
+                
+                # Wait out a scrape still running on this instance from an earlier race
+                in_flight = self._in_flight.get(key)
+                if in_flight is not None and not in_flight.done():
+                    await asyncio.wait([asyncio.wrap_future(in_flight)])
+                
+                future = executor.submit(_run_scrape, scraper)
+                self._in_flight[key] = future
+                result = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Fallback {site_id} failed: {e}")
+                sources_tried.append((site_id, str(e)))
+                return ScraperResult(success=False, error=str(e))
+            
+            if not result.success:
+                sources_tried.append((site_id, result.error))
+            return result
+        
+        try:
+            # Try primary first
+            try:
+                result = await loop.run_in_executor(executor, _run_scrape, primary_scraper)
+                if result.success:
+                    return result
+                sources_tried.append((primary_scraper.site_id, result.error))
+            except Exception as e:
+                self.logger.warning(f"Primary scraper failed: {e}")
+                sources_tried.append((primary_scraper.site_id, str(e)))
+            
+            # Launch fallbacks one stagger apart, stopping early on a success
+            tasks = []
+            pending = set()
+            winner = None
+            for site_id, scraper_class in self.fallback_order:
+                task = asyncio.create_task(_try_fallback(site_id, scraper_class))
+                tasks.append(task)
+                pending.add(task)
+                _, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.FALLBACK_STAGGER_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                winner = self._first_success(tasks)
+                if winner is not None:
+                    break
+            
+            # All launched: take whichever finishes successfully first
+            while winner is None and pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = self._first_success(tasks)
+            
+            for task in pending:
+                task.cancel()
+            
+            if winner is not None:
+                winner.metadata["fallback_sources_tried"] = list(sources_tried)
+                return winner
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # All failed
+        return ScraperResult(
+            success=False,
+            error=f"All sources failed: {sources_tried}",
+            metadata={"sources_tried": sources_tried},
+        )
 
 
 def get_fallback_scraper(site_id: str) -> Optional[BaseScraper]:
@@ -5,16 +5,27 @@ Implements rate limiting (120 requests/minute) with exponential backoff.
 """
 
 import os
+import json
 import time
+import random
+import threading
 import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 
+# Try to use orjson for decoding API responses, fallback to stdlib json if not available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from .base_scraper import BaseScraper, ScraperResult
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
 from ..utils.config_manager import SiteConfig
 
 
@@ -26,7 +37,31 @@ class FredScraper(BaseScraper):
     
     API_BASE = "https://api.stlouisfed.org/fred"
     RATE_LIMIT_REQUESTS_PER_MINUTE = 120
-    RATE_LIMIT_SECONDS_BETWEEN_REQUESTS = 0.5  # 120 req/min = 0.5 sec/req
+    # Requests allowed back-to-back; the refill rate is lowered to match so any
+    # 60-second window still holds at most RATE_LIMIT_REQUESTS_PER_MINUTE
+    RATE_LIMIT_BURST = 10
+    # 429 backoff: doubles from the base each attempt, capped (before jitter)
+    RETRY_BACKOFF_BASE_SECONDS = 7.5
+    RETRY_BACKOFF_MAX_SECONDS = 30.0
+    
+    # All calls go to one HTTPS host; keep enough pooled connections for concurrent fetches
+    HTTP_POOL_MAXSIZE = 16
+    # Worker threads used by fetch_many
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Observation cache TTL (seconds) by series frequency_short, used when
+    # data_source.cache_ttl is not set; series with unknown frequency are not cached
+    CACHE_TTL_BY_FREQUENCY = {
+        "D": 3600,
+        "W": 3600,
+        "BW": 3600,
+        "M": 86400,
+        "Q": 86400,
+        "SA": 86400,
+        "A": 86400,
+    }
+    # Series metadata cache TTL (seconds) when data_source.cache_ttl is not set
+    SERIES_INFO_CACHE_TTL = 86400
     
     def __init__(
         self,
@@ -46,9 +81,17 @@ class FredScraper(BaseScraper):
         if not self.api_key:
             self.logger.warning("FRED_API_KEY not found in environment variables")
         
-        # Rate limiting: track request timestamps
-        self._request_times: deque = deque(maxlen=120)  # Track last 120 requests
-        self._last_request_time: float = 0.0
+        # Rate limiting: token bucket shared by fetch_many's worker threads
+        self._bucket = TokenBucket(
+            capacity=self.RATE_LIMIT_BURST,
+            tokens=self.RATE_LIMIT_BURST,
+            refill_rate=(self.RATE_LIMIT_REQUESTS_PER_MINUTE - self.RATE_LIMIT_BURST) / 60.0,
+            last_refill=time.monotonic(),
+        )
+        self._rate_limit_lock = threading.Lock()
+        
+        # Series frequencies (frequency_short) seen in series info, for cache TTLs
+        self._series_frequencies: Dict[str, str] = {}
         
         # Series ID from config
         self.series_id = None
@@ -70,58 +113,101 @@ class FredScraper(BaseScraper):
     def _rate_limit(self):
         """
         Implement rate limiting: 120 requests per minute.
-        Uses token bucket approach with request timestamp tracking.
+        
+        Safe to call from several threads: each caller takes a token under the
+        lock (going into debt when the bucket is empty, which books a later
+        send time) and sleeps outside it, so concurrent fetches are spaced out
+        instead of all waking up together.
         """
-        now = time.time()
-        
-        # Remove requests older than 1 minute
-        cutoff_time = now - 60.0
-        while self._request_times and self._request_times[0] < cutoff_time:
-            self._request_times.popleft()
-        
-        # If we have 120 requests in the last minute, wait
-        if len(self._request_times) >= self.RATE_LIMIT_REQUESTS_PER_MINUTE:
-            # Wait until the oldest request is more than 1 minute old
-            oldest_request = self._request_times[0]
-            wait_time = 60.0 - (now - oldest_request) + 0.1  # Add small buffer
-            if wait_time > 0:
+        with self._rate_limit_lock:
+            wait_time = self._bucket.wait_time()
+            self._bucket.tokens -= 1
+        
+        if wait_time > 0:
+            if wait_time > 1.0:
                 self.logger.info(f"Rate limit: waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                # Clean up again after waiting
-                now = time.time()
-                cutoff_time = now - 60.0
-                while self._request_times and self._request_times[0] < cutoff_time:
-                    self._request_times.popleft()
-        
-        # Ensure minimum time between requests (0.5 seconds)
-        time_since_last = now - self._last_request_time
-        if time_since_last < self.RATE_LIMIT_SECONDS_BETWEEN_REQUESTS:
-            wait_time = self.RATE_LIMIT_SECONDS_BETWEEN_REQUESTS - time_since_last
             time.sleep(wait_time)
-            now = time.time()
-        
-        # Record this request
-        self._request_times.append(now)
-        self._last_request_time = now
     
-    def _handle_429_error(self, attempt: int, max_retries: int = 3) -> float:
+    def _handle_429_error(
+        self,
+        attempt: int,
+        max_retries: int = 3,
+        response: Optional[requests.Response] = None,
+    ) -> float:
         """
         Handle 429 (Too Many Requests) error with exponential backoff.
         
+        A numeric Retry-After header on the response takes precedence. Otherwise
+        the backoff doubles each attempt up to RETRY_BACKOFF_MAX_SECONDS, with
+        +/-50% jitter so separate processes don't retry in lockstep.
+        
         Args:
             attempt: Current retry attempt number (1-indexed)
             max_retries: Maximum number of retries
+            response: The 429 response (for its Retry-After header)
         
         Returns:
             Wait time in seconds
         """
-        # Exponential backoff: 60 seconds base, doubled each attempt
-        wait_time = 60.0 * (2 ** (attempt - 1))
+        wait_time = None
+        if response is not None and response.headers.get("Retry-After"):
+            try:
+                wait_time = float(response.headers["Retry-After"])
+            except ValueError:
+                pass  # HTTP-date form; fall back to computed backoff
+        
+        if wait_time is None:
+            base = min(
+                self.RETRY_BACKOFF_MAX_SECONDS,
+                self.RETRY_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)),
+            )
+            wait_time = base * (1 + random.uniform(-0.5, 0.5))
+        
         self.logger.warning(
             f"Rate limit exceeded (429). Waiting {wait_time:.1f} seconds before retry {attempt}/{max_retries}..."
         )
         return wait_time
     
+    def _series_info_cache_ttl(self) -> int:
+        """Get the on-disk cache TTL in seconds for series metadata."""
+        if self.config and self.config.data_source:
+            if self.config.data_source.force_refresh:
+                return 0
+            if self.config.data_source.cache_ttl:
+                return self.config.data_source.cache_ttl
+        return self.SERIES_INFO_CACHE_TTL
+    
+    def _observations_cache_ttl(self, series_id: str) -> int:
+        """
+        Get the on-disk cache TTL in seconds for a series' observations.
+        
+        data_source.cache_ttl takes precedence; otherwise the TTL follows the
+        series frequency from CACHE_TTL_BY_FREQUENCY. A frequency not seen yet
+        is looked up with get_series_info (itself cached for
+        SERIES_INFO_CACHE_TTL), so direct get_observations and fetch_many calls
+        are cached too.
+        
+        Args:
+            series_id: Series ID
+        
+        Returns:
+            TTL in seconds (0 when caching is off or bypassed)
+        """
+        if self.config and self.config.data_source:
+            if self.config.data_source.force_refresh:
+                return 0
+            if self.config.data_source.cache_ttl:
+                return self.config.data_source.cache_ttl
+        
+        if series_id not in self._series_frequencies:
+            try:
+                self.get_series_info(series_id)
+            except Exception as e:
+                self.logger.warning(f"Could not look up frequency for {series_id}, not caching: {e}")
+            # Don't retry the lookup on every call for this series
+            self._series_frequencies.setdefault(series_id, "")
+        return self.CACHE_TTL_BY_FREQUENCY.get(self._series_frequencies[series_id], 0)
+    
     def _get_api_params(self, **kwargs) -> Dict[str, Any]:
         """
         Get base API parameters including API key.
@@ -156,30 +242,37 @@ class FredScraper(BaseScraper):
         if not series_id:
             raise ValueError("Series ID is required")
         
-        self._rate_limit()
-        
         url = f"{self.API_BASE}/series"
         params = self._get_api_params(series_id=series_id)
         
+        cache_ttl = self._series_info_cache_ttl()
+        response = self._fresh_cached_response(url, params, cache_ttl)
+        
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            if response is None:
+                self._rate_limit()
+                response = self._cached_get(url, cache_ttl=cache_ttl, params=params, timeout=self.timeout)
             
             # Handle rate limiting
             if response.status_code == 429:
-                wait_time = self._handle_429_error(1)
+                wait_time = self._handle_429_error(1, response=response)
                 time.sleep(wait_time)
-                response = requests.get(url, params=params, timeout=self.timeout)
+                response = self._cached_get(url, cache_ttl=cache_ttl, params=params, timeout=self.timeout)
             
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             # FRED returns series in a list
             if "seriess" in data and len(data["seriess"]) > 0:
-                return data["seriess"][0]
+                series_info = data["seriess"][0]
             elif "series" in data:
-                return data["series"]
+                series_info = data["series"]
             else:
                 raise ValueError(f"No series found for ID: {series_id}")
+            
+            if series_info.get("frequency_short"):
+                self._series_frequencies[series_id] = series_info["frequency_short"]
+            return series_info
                 
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch series info for {series_id}: {e}")
@@ -192,16 +285,21 @@ class FredScraper(BaseScraper):
         observation_start: Optional[str] = None,
         observation_end: Optional[str] = None,
         sort_order: str = "desc",
+        force_refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Get series observations (time series data).
         
+        Responses are cached on disk for _observations_cache_ttl() seconds; a
+        cache hit skips both the request and the rate limiter.
+        
         Args:
             series_id: Series ID (uses config if not provided)
             limit: Maximum number of observations to return
             observation_start: Start date (YYYY-MM-DD format)
             observation_end: End date (YYYY-MM-DD format)
             sort_order: "asc" or "desc" (default: "desc" for latest first)
+            force_refresh: Ignore cached observations and fetch from the API
         
         Returns:
             List of observation dictionaries
@@ -210,8 +308,6 @@ class FredScraper(BaseScraper):
         if not series_id:
             raise ValueError("Series ID is required")
         
-        self._rate_limit()
-        
         url = f"{self.API_BASE}/series/observations"
         params = self._get_api_params(
             series_id=series_id,
@@ -225,23 +321,31 @@ class FredScraper(BaseScraper):
         if observation_end:
             params["observation_end"] = observation_end
         
+        cache_ttl = 0 if force_refresh else self._observations_cache_ttl(series_id)
+        response = self._fresh_cached_response(url, params, cache_ttl)
+        if response is not None:
+            self.logger.info(f"Using cached observations for {series_id}")
+            return _json_loads(response.content).get("observations", [])
+        
+        self._rate_limit()
+        
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._cached_get(url, cache_ttl=cache_ttl, params=params, timeout=self.timeout)
             
             # Handle rate limiting with retries
             attempt = 1
             max_retries = 3
             while response.status_code == 429 and attempt <= max_retries:
-                wait_time = self._handle_429_error(attempt, max_retries)
+                wait_time = self._handle_429_error(attempt, max_retries, response)
                 time.sleep(wait_time)
-                response = requests.get(url, params=params, timeout=self.timeout)
+                response = self._cached_get(url, cache_ttl=cache_ttl, params=params, timeout=self.timeout)
                 attempt += 1
             
             if response.status_code == 429:
                 raise requests.HTTPError("Rate limit exceeded after retries")
             
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             if "observations" in data:
                 return data["observations"]
@@ -268,6 +372,44 @@ class FredScraper(BaseScraper):
             return observations[0]
         return None
     
+    def fetch_many(self, series_ids: List[str], **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch observations for several series concurrently.
+        
+        Requests run on a thread pool and share this scraper's rate limiter and
+        session, so network round trips overlap while the 120 requests/minute
+        limit still holds.
+        
+        Args:
+            series_ids: FRED series IDs
+            **kwargs: Passed to get_observations (limit, observation_start, ...)
+        
+        Returns:
+            Dict mapping series ID to parsed DataFrame (failed series are omitted)
+        """
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {
+                executor.submit(self.get_observations, series_id=series_id, **kwargs): series_id
+                for series_id in series_ids
+            }
+            for future in as_completed(futures):
+                series_id = futures[future]
+                try:
+                    observations = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Skipping {series_id}: {e}")
+                    continue
+                
+                results[series_id] = self.parse_raw({
+                    "type": "api_json",
+                    "content": {"observations": observations, "series_info": {}},
+                    "series_id": series_id,
+                })
+        
+        return results
+    
     def fetch_raw(self, url: str) -> Dict[str, Any]:
         """
         Fetch raw data from FRED API.
@@ -349,35 +491,25 @@ class FredScraper(BaseScraper):
                     series_name = value
                     break
         
-        # Convert observations to DataFrame
-        rows = []
-        for obs in observations:
-            # FRED uses "." to indicate missing data
-            value = obs.get("value")
-            if value == ".":
-                value = None
-            else:
-                try:
-                    value = float(value) if value else None
-                except (ValueError, TypeError):
-                    value = None
-            
-            rows.append({
-                "date": obs.get("date"),
-                "value": value,
-                "series_id": raw_data.get("series_id", ""),
-                "series_name": series_name,
-                "realtime_start": obs.get("realtime_start"),
-                "realtime_end": obs.get("realtime_end"),
-            })
-        
-        df = pd.DataFrame(rows)
+        # Convert observations to DataFrame, column by column
+        df = pd.DataFrame({
+            "date": [obs.get("date") for obs in observations],
+            "value": [obs.get("value") for obs in observations],
+            "series_id": raw_data.get("series_id", ""),
+            "series_name": series_name,
+            "realtime_start": [obs.get("realtime_start") for obs in observations],
+            "realtime_end": [obs.get("realtime_end") for obs in observations],
+        })
+        # FRED uses "." to indicate missing data
+        df["value"] = pd.to_numeric(df["value"].where(df["value"] != "."), errors="coerce").astype(float)
         
         # Convert date column to datetime
         if "date" in df.columns and not df.empty:
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-            # Sort by date descending (latest first)
-            df = df.sort_values("date", ascending=False).reset_index(drop=True)
+            df["date"] = pd.to_datetime(df["date"], errors="coerce", format="%Y-%m-%d", cache=True)
+            # Sort by date descending (latest first); skipped for the default
+            # sort_order="desc" fetch, which FRED already returns in this order
+            if not df["date"].is_monotonic_decreasing:
+                df = df.sort_values("date", ascending=False, kind="mergesort").reset_index(drop=True)
         
         # Apply field mappings if available
         if self.config and self.config.field_mappings:
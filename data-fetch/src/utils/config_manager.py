@@ -26,6 +26,11 @@ class DataSource:
     query_id: Optional[str] = None  # For Dune queries
     max_poll_attempts: int = 30  # For Dune queries
     poll_interval: int = 2  # For Dune queries
+    poll_initial_delay: Optional[float] = None  # For Dune queries: first poll wait (None = scraper default)
+    poll_backoff: Optional[float] = None  # For Dune queries: poll wait growth factor (None = scraper default)
+    max_parallel: Optional[int] = None  # For Dune queries: concurrent executions in fetch_many (None = scraper default)
+    cache_ttl: int = 0  # For Dune queries and API fallbacks: seconds to reuse cached results on disk (0 = off)
+    force_refresh: bool = False  # For Dune queries and API fallbacks: ignore cached results and execution IDs
     parameters: Dict[str, Any] = field(default_factory=dict)  # For Dune queries, FRED series_id, etc.
     series_id: Optional[str] = None  # For FRED series
 
@@ -113,6 +118,11 @@ class SiteConfig:
             query_id=data_source_dict.get("query_id"),
             max_poll_attempts=data_source_dict.get("max_poll_attempts", 30),
             poll_interval=data_source_dict.get("poll_interval", 2),
+            poll_initial_delay=data_source_dict.get("poll_initial_delay"),
+            poll_backoff=data_source_dict.get("poll_backoff"),
+            max_parallel=data_source_dict.get("max_parallel"),
+            cache_ttl=data_source_dict.get("cache_ttl", 0),
+            force_refresh=data_source_dict.get("force_refresh", False),
             parameters=data_source_dict.get("parameters", {}),
             series_id=data_source_dict.get("series_id"),
         )
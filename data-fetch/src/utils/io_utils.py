@@ -136,6 +136,8 @@ def save_raw_response(
                 content_type = "html"
             else:
                 content_type = "text"
+        elif isinstance(content, bytes) and content.lstrip()[:1] in (b"{", b"["):
+            content_type = "json"
         else:
             content_type = "binary"
     
@@ -151,9 +153,13 @@ def save_raw_response(
         if isinstance(content, dict):
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(content, f, indent=2, ensure_ascii=False, default=str)
+        elif isinstance(content, bytes):
+            # Already UTF-8 encoded JSON, write it as is
+            with open(output_path, "wb") as f:
+                f.write(content)
         else:
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content if isinstance(content, str) else content.decode("utf-8"))
+                f.write(content)
     elif content_type == "binary":
         with open(output_path, "wb") as f:
             f.write(content if isinstance(content, bytes) else content.encode("utf-8"))
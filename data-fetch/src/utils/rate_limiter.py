@@ -26,7 +26,7 @@ class TokenBucket:
     capacity: float
     tokens: float
     refill_rate: float  # tokens per second
-    last_refill: float
+    last_refill: float  # time.monotonic() timestamp
     
     def consume(self, tokens: float = 1.0) -> bool:
         """
@@ -47,7 +47,7 @@ class TokenBucket:
     
     def _refill(self):
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill
         
         # Add tokens based on refill rate
@@ -111,7 +111,7 @@ class RateLimiter:
             capacity=rps * 10,  # Allow burst of 10x rate
             tokens=rps * 10,
             refill_rate=rps,
-            last_refill=time.time(),
+            last_refill=time.monotonic(),
         )
         
         self.logger.info(f"Set rate limit for {domain}: {rps:.2f} requests/second")
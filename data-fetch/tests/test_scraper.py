@@ -439,6 +439,744 @@ class TestScraperResult:
         assert d["rows_extracted"] == 100
 
 
+class TestCoinGlassScraper:
+    """Tests for CoinGlass HTML metric extraction."""
+    
+    def test_parse_liquidations_24h_rekt_card(self):
+        """Test that the 24h Rekt card wins over the 1h card."""
+        from src.scraper.coinglass_scraper import CoinGlassScraper
+        
+        html = """
+        <html><body>
+            <div class="rekt-1h"><h3>1h Rekt</h3><div>Total Rekt: $5.1M</div></div>
+            <section class="rekt-card-24h"><h3>24h Rekt</h3><div>Total Rekt: $245.67M</div>
+            <div>Long: $150.2M</div><div>Short: $95.47M</div></section>
+        </body></html>
+        """
+        
+        scraper = CoinGlassScraper(use_stealth=False)
+        df = scraper.parse_raw({"content": html, "url": "https://www.coinglass.com/LiquidationData"})
+        
+        assert df["total_liquidations_24h"].iloc[0] == pytest.approx(245.67e6)
+        assert df["long_liquidations"].iloc[0] == pytest.approx(150.2e6)
+        assert df["short_liquidations"].iloc[0] == pytest.approx(95.47e6)
+    
+    def test_parse_liquidations_million_text(self):
+        """Test that 'comes in at $X million' is scaled to USD."""
+        from src.scraper.coinglass_scraper import CoinGlassScraper
+        
+        html = "<p>Total liquidations comes in at $12.5 million in the last day.</p>"
+        
+        scraper = CoinGlassScraper(use_stealth=False)
+        df = scraper.parse_raw({"content": html, "url": "https://www.coinglass.com/liquidations"})
+        
+        assert df["total_liquidations_24h"].iloc[0] == pytest.approx(12.5e6)
+    
+    def test_parse_btc_overview(self):
+        """Test extraction of BTC overview metrics."""
+        from src.scraper.coinglass_scraper import CoinGlassScraper
+        
+        html = """
+        <html><body>
+            <div>Futures Volume: $85.3B</div>
+            <div>Open Interest: $61.2B</div>
+            <div>Net Inflow: $120.5M</div>
+        </body></html>
+        """
+        
+        scraper = CoinGlassScraper(use_stealth=False)
+        df = scraper.parse_raw({"content": html, "url": "https://www.coinglass.com/currencies/BTC"})
+        
+        assert df["futures_volume_24h"].iloc[0] == pytest.approx(85.3e9)
+        assert df["open_interest"].iloc[0] == pytest.approx(61.2e9)
+        assert df["net_inflow_24h"].iloc[0] == pytest.approx(120.5e6)
+    
+    def test_extract_from_api_response_nested(self):
+        """Test that nested API data fills several fields in one walk."""
+        from src.scraper.coinglass_scraper import CoinGlassScraper, CoinGlassMetrics
+        
+        api_data = {
+            "data": {
+                "summary": {"openInterest": "61.2B", "price": 97000.5},
+                "rows": [{"longLiquidations": "150.2M"}],
+            }
+        }
+        
+        scraper = CoinGlassScraper(use_stealth=False)
+        metrics = scraper._extract_from_api_response(api_data, CoinGlassMetrics())
+        
+        assert metrics.open_interest == pytest.approx(61.2e9)
+        assert metrics.btc_price == pytest.approx(97000.5)
+        assert metrics.long_liquidations == pytest.approx(150.2e6)
+
+
+class TestHttpCache:
+    """Tests for BaseScraper's on-disk HTTP response cache."""
+    
+    URL = "https://api.example.com/v1/data"
+    
+    @staticmethod
+    def _response(status_code, content=b"", headers=None):
+        """Build a requests.Response for the mocked session."""
+        import requests
+        
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = TestHttpCache.URL
+        response._content = content
+        response.headers.update(headers or {})
+        return response
+    
+    @pytest.fixture
+    def scraper(self, tmp_path, monkeypatch):
+        """CoinGecko scraper with a one-hour cache TTL, a mocked session and outputs under tmp_path."""
+        from src.scraper.fallback_scrapers import CoinGeckoScraper
+        
+        monkeypatch.setattr("src.utils.io_utils.OUTPUTS_DIR", tmp_path)
+        scraper = CoinGeckoScraper()
+        scraper.config = Mock(id="cache_test", data_source=Mock(cache_ttl=3600, force_refresh=False))
+        scraper._session = Mock()
+        scraper._session.get.return_value = self._response(200, b'{"v": 1}', {"ETag": '"v1"'})
+        return scraper
+    
+    def test_fresh_hit_sends_no_request(self, scraper):
+        """Test that a response within the TTL is served from disk."""
+        scraper._cached_get(self.URL, params={"q": "1"})
+        response = scraper._cached_get(self.URL, params={"q": "1"})
+        
+        assert scraper._session.get.call_count == 1
+        assert response.content == b'{"v": 1}'
+        assert scraper._fresh_cached_response(self.URL, {"q": "1"}).content == b'{"v": 1}'
+        assert scraper._fresh_cached_response(self.URL, {"q": "2"}) is None
+    
+    def test_stale_entry_revalidates_with_304(self, scraper):
+        """Test that an expired entry sends a conditional request and reuses the body on 304."""
+        scraper._cached_get(self.URL)
+        scraper._session.get.return_value = self._response(304)
+        
+        response = scraper._cached_get(self.URL, cache_ttl=-1)
+        
+        assert scraper._session.get.call_count == 2
+        assert scraper._session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.content == b'{"v": 1}'
+    
+    def test_force_refresh_bypasses_cache(self, scraper):
+        """Test that data_source.force_refresh always goes to the network."""
+        scraper._cached_get(self.URL)
+        scraper.config.data_source.force_refresh = True
+        
+        scraper._cached_get(self.URL)
+        
+        assert scraper._session.get.call_count == 2
+        assert scraper._fresh_cached_response(self.URL) is None
+    
+    def test_discarded_error_body_is_refetched(self, scraper):
+        """Test that a discarded entry (e.g. an API error body) is not served again."""
+        scraper._session.get.return_value = self._response(200, b'{"Note": "rate limited"}')
+        scraper._cached_get(self.URL, params={"q": "1"})
+        scraper._discard_cached_response(self.URL, {"q": "1"})
+        scraper._session.get.return_value = self._response(200, b'{"v": 2}')
+        
+        response = scraper._cached_get(self.URL, params={"q": "1"})
+        
+        assert scraper._session.get.call_count == 2
+        assert response.content == b'{"v": 2}'
+    
+    def test_coingecko_cache_hit_skips_rate_limit(self, scraper):
+        """Test that a fresh cached CoinGecko response doesn't take a rate-limit token."""
+        scraper._session.get.return_value = self._response(200, b'{"prices": [[1700000000000, 1.0]]}')
+        url = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart?vs_currency=usd&days=30"
+        
+        with patch.object(scraper, "_rate_limit") as rate_limit:
+            scraper.fetch_raw(url)
+            raw_data = scraper.fetch_raw(url)
+        
+        assert rate_limit.call_count == 1
+        assert scraper._session.get.call_count == 1
+        assert raw_data["content"] == b'{"prices": [[1700000000000, 1.0]]}'
+    
+    def test_alpha_vantage_cache_hit_skips_rate_limit(self, tmp_path, monkeypatch):
+        """Test that a fresh cached Alpha Vantage response doesn't book a rate-limit slot."""
+        from src.scraper.fallback_scrapers import AlphaVantageScraper
+        
+        monkeypatch.setattr("src.utils.io_utils.OUTPUTS_DIR", tmp_path)
+        scraper = AlphaVantageScraper(api_key="test")
+        scraper.config = Mock(
+            id="cache_test",
+            data_source=Mock(cache_ttl=3600, force_refresh=False, endpoint=None),
+        )
+        scraper._session = Mock()
+        scraper._session.get.return_value = self._response(200, b'{"Symbol": "MSFT"}')
+        url = "https://www.alphavantage.co/query?function=OVERVIEW&symbol=MSFT"
+        
+        with patch.object(scraper, "_rate_limit") as rate_limit:
+            scraper.fetch_raw(url)
+            raw_data = scraper.fetch_raw(url)
+        
+        assert rate_limit.call_count == 1
+        assert scraper._session.get.call_count == 1
+        assert raw_data["json_data"] == {"Symbol": "MSFT"}
+
+
+class TestFredScraper:
+    """Tests for FRED observation fetching."""
+    
+    def test_cache_hit_skips_rate_limit(self, tmp_path, monkeypatch):
+        """Test that cached observations (TTL from the series frequency) skip the rate limiter."""
+        from src.scraper.fred_scraper import FredScraper
+        
+        monkeypatch.setattr("src.utils.io_utils.OUTPUTS_DIR", tmp_path)
+        
+        def get(url, **kwargs):
+            if url.endswith("/series"):
+                body = {"seriess": [{"id": "CPIAUCSL", "frequency_short": "M"}]}
+            else:
+                body = {"observations": [{"date": "2024-01-01", "value": "308.4"}]}
+            return TestHttpCache._response(200, json.dumps(body).encode())
+        
+        scraper = FredScraper(api_key="test")
+        scraper._session = Mock()
+        scraper._session.get.side_effect = get
+        
+        with patch.object(scraper, "_rate_limit") as rate_limit:
+            first = scraper.get_observations("CPIAUCSL")
+            second = scraper.get_observations("CPIAUCSL")
+        
+        # Series info lookup + first observations fetch; the second call is a cache hit
+        assert rate_limit.call_count == 2
+        assert scraper._session.get.call_count == 2
+        assert first == second == [{"date": "2024-01-01", "value": "308.4"}]
+
+
+class TestCoinGeckoScraper:
+    """Tests for CoinGecko parsing."""
+    
+    def test_parse_memo_reuses_market_chart(self):
+        """Test that an identical market_chart payload skips parse_raw."""
+        from src.scraper.fallback_scrapers import CoinGeckoScraper
+        
+        scraper = CoinGeckoScraper()
+        raw_data = {
+            "type": "api_json",
+            "content": b'{"prices": [[1700000000000, 37000.0], [1700086400000, 37500.0]]}',
+            "endpoint_url": "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart",
+        }
+        
+        with patch.object(scraper, "parse_raw", wraps=scraper.parse_raw) as parse_raw:
+            first = scraper._parse_memoized(raw_data)
+            second = scraper._parse_memoized(dict(raw_data))
+        
+        assert parse_raw.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+    
+    def test_parse_memo_skips_simple_price(self):
+        """Test that simple/price payloads are re-parsed so rows get a fresh timestamp."""
+        from src.scraper.fallback_scrapers import CoinGeckoScraper
+        
+        scraper = CoinGeckoScraper()
+        raw_data = {
+            "type": "api_json",
+            "content": b'{"bitcoin": {"usd": 92412}}',
+            "endpoint_url": "https://api.coingecko.com/api/v3/simple/price",
+        }
+        
+        with patch.object(scraper, "parse_raw", wraps=scraper.parse_raw) as parse_raw:
+            first = scraper._parse_memoized(raw_data)
+            second = scraper._parse_memoized(dict(raw_data))
+        
+        assert parse_raw.call_count == 2
+        assert second["date"].iloc[0] >= first["date"].iloc[0]
+        assert second["usd"].iloc[0] == 92412
+
+
+class TestFallbackManager:
+    """Tests for racing fallback sources with stub scrapers."""
+    
+    STAGGER = 0.05
+    
+    @staticmethod
+    def _stub(site_id, outcomes, delay=0.0, calls=None):
+        """
+        Build a stub scraper class.
+        
+        Args:
+            site_id: Site ID reported by the stub
+            outcomes: Success flag per scrape() call (the last one repeats)
+            delay: Seconds each scrape() blocks for
+            calls: List collecting (site_id, start, end) per scrape() call
+        
+        Returns:
+            Scraper class accepted by FallbackManager.fallback_order
+        """
+        import time
+        from src.scraper.base_scraper import ScraperResult
+        
+        calls = calls if calls is not None else []
+        
+        class StubScraper:
+            def __init__(self, config=None):
+                self.site_id = site_id
+                self.scrape_count = 0
+            
+            def scrape(self, override_robots=False):
+                success = outcomes[min(self.scrape_count, len(outcomes) - 1)]
+                self.scrape_count += 1
+                start = time.monotonic()
+                time.sleep(delay)
+                calls.append((site_id, start, time.monotonic()))
+                return ScraperResult(success=success, source=site_id, error=None if success else "stub failure")
+            
+            def close(self):
+                pass
+        
+        return StubScraper
+    
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """FallbackManager with a short stagger and no site configs."""
+        from src.scraper.fallback_scrapers import FallbackManager
+        
+        monkeypatch.setattr(FallbackManager, "FALLBACK_STAGGER_SECONDS", self.STAGGER)
+        manager = FallbackManager(config_manager=Mock(get=Mock(return_value=None)))
+        yield manager
+        manager.close()
+    
+    def test_first_success_prefers_fallback_order(self):
+        """Test that fallbacks finishing together resolve to the earliest-ranked success."""
+        import asyncio
+        from src.scraper.base_scraper import ScraperResult
+        from src.scraper.fallback_scrapers import FallbackManager
+        
+        async def run():
+            loop = asyncio.get_running_loop()
+            tasks = [loop.create_future() for _ in range(4)]
+            tasks[0].set_result(ScraperResult(success=False, source="a"))
+            tasks[2].set_result(ScraperResult(success=True, source="c"))
+            tasks[3].set_result(ScraperResult(success=True, source="d"))
+            # tasks[1] is still running
+            return FallbackManager._first_success(tasks)
+        
+        assert asyncio.run(run()).source == "c"
+    
+    def test_fallbacks_are_staggered_and_first_success_wins(self, manager):
+        """Test that a slow fallback doesn't hold up the next one past the stagger."""
+        calls = []
+        primary = self._stub("primary", [False], calls=calls)()
+        manager.fallback_order = [
+            ("slow", self._stub("slow", [True], delay=0.5, calls=calls)),
+            ("fast", self._stub("fast", [True], calls=calls)),
+        ]
+        
+        result = manager.scrape_with_fallbacks(primary)
+        
+        assert result.source == "fast"
+        assert result.metadata["fallback_sources_tried"] == [("primary", "stub failure")]
+        primary_end = calls[0][2]
+        fast_start = next(start for site_id, start, _ in calls if site_id == "fast")
+        # "fast" started one stagger after "slow", which was still running when it won
+        assert self.STAGGER * 0.8 <= fast_start - primary_end < 0.5
+        assert "slow" not in [site_id for site_id, _, _ in calls]
+    
+    def test_remaining_fallbacks_are_cancelled(self, manager):
+        """Test that fallbacks after the winner never start and the abandoned one finishes on close."""
+        calls = []
+        primary = self._stub("primary", [False], calls=calls)()
+        manager.fallback_order = [
+            ("slow", self._stub("slow", [True], delay=0.3, calls=calls)),
+            ("fast", self._stub("fast", [True], calls=calls)),
+            ("unused", self._stub("unused", [True], calls=calls)),
+        ]
+        
+        result = manager.scrape_with_fallbacks(primary)
+        
+        assert result.source == "fast"
+        manager.close()
+        assert [site_id for site_id, _, _ in calls] == ["primary", "fast", "slow"]
+    
+    def test_busy_scraper_is_not_reused(self, manager):
+        """Test that a scraper abandoned mid-scrape only runs again once that scrape ends."""
+        calls = []
+        primary = self._stub("primary", [False], calls=calls)()
+        manager.fallback_order = [
+            ("slow", self._stub("slow", [True], delay=0.3, calls=calls)),
+            ("fast", self._stub("fast", [True, False], calls=calls)),
+        ]
+        
+        assert manager.scrape_with_fallbacks(primary).source == "fast"
+        assert manager.scrape_with_fallbacks(primary).source == "slow"
+        
+        slow_runs = sorted((start, end) for site_id, start, end in calls if site_id == "slow")
+        assert len(slow_runs) == 2
+        assert slow_runs[1][0] >= slow_runs[0][1]
+    
+    def test_running_loop_tries_fallbacks_in_order(self, manager):
+        """Test that a call from inside an event loop falls back to the sequential path."""
+        import asyncio
+        
+        calls = []
+        primary = self._stub("primary", [False], calls=calls)()
+        manager.fallback_order = [
+            ("first", self._stub("first", [False], delay=0.1, calls=calls)),
+            ("second", self._stub("second", [True], calls=calls)),
+            ("third", self._stub("third", [True], calls=calls)),
+        ]
+        
+        async def run():
+            return manager.scrape_with_fallbacks(primary)
+        
+        result = asyncio.run(run())
+        
+        assert result.source == "second"
+        assert [site_id for site_id, _, _ in calls] == ["primary", "first", "second"]
+        assert result.metadata["fallback_sources_tried"] == [
+            ("primary", "stub failure"),
+            ("first", "stub failure"),
+        ]
+
+
+class TestDGECFINScraper:
+    """Tests for DG ECFIN workbook parsing."""
+    
+    def test_parse_legacy_split_dict(self):
+        """Test that an older saved header=None 'split' dict is parsed with row 0 as header."""
+        from src.scraper.dg_ecfin_scraper import DGECFINScraper
+        
+        sheet = pd.DataFrame([
+            ["Date", "EU.ESI", "EA.ESI", "EU.EEI", "EA.EEI", "EA.CONS"],
+            ["2024-01-31", 96.1, 96.2, 99.0, 98.5, -16.1],
+            ["2024-02-29", 95.5, 95.4, 98.7, 98.1, -15.5],
+        ])
+        content = json.loads(json.dumps(sheet.to_dict("split")))
+        
+        df = DGECFINScraper().parse_raw({"content": content})
+        
+        assert len(df) == 2
+        assert df["esi_eu"].tolist() == [96.1, 95.5]
+        assert df["flash_consumer_confidence_ea"].iloc[1] == pytest.approx(-15.5)
+    
+    # Workbook member placed first so it lies outside the cached tail of the ZIP
+    WORKBOOK = bytes(range(256)) * 400
+    
+    @classmethod
+    def _zip_bytes(cls):
+        """Build a stored (uncompressed) ZIP with the workbook followed by filler."""
+        import io
+        import zipfile
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_ref:
+            zip_ref.writestr("main_indicators.xlsx", cls.WORKBOOK)
+            zip_ref.writestr("readme.txt", b"-" * 200_000)
+        return buffer.getvalue()
+    
+    class FakeSession:
+        """Session serving a ZIP, optionally without range support."""
+        
+        def __init__(self, body, accept_ranges="bytes", honour_ranges=True):
+            self.body = body
+            self.accept_ranges = accept_ranges
+            self.honour_ranges = honour_ranges
+            self.ranges = []
+            self.full_downloads = 0
+        
+        def head(self, url, **kwargs):
+            headers = {"Content-Length": str(len(self.body))}
+            if self.accept_ranges:
+                headers["Accept-Ranges"] = self.accept_ranges
+            return Mock(headers=headers)
+        
+        def get(self, url, headers=None, **kwargs):
+            import io
+            
+            response = MagicMock()
+            response.__enter__.return_value = response
+            byte_range = (headers or {}).get("Range")
+            if byte_range and self.honour_ranges:
+                start, end = map(int, byte_range[len("bytes="):].split("-"))
+                self.ranges.append((start, end))
+                response.status_code = 206
+                response.content = self.body[start:end + 1]
+            else:
+                if not byte_range:
+                    self.full_downloads += 1
+                response.status_code = 200
+                response.content = self.body
+                response.raw = io.BytesIO(self.body)
+            return response
+    
+    def test_range_read_fetches_only_needed_bytes(self):
+        """Test that the Excel member is read from the remote ZIP with three range requests."""
+        from src.scraper.dg_ecfin_scraper import DGECFINScraper
+        
+        body = self._zip_bytes()
+        scraper = DGECFINScraper()
+        scraper._session = self.FakeSession(body)
+        
+        member = scraper._read_remote_excel_member()
+        
+        assert member == ("main_indicators.xlsx", self.WORKBOOK)
+        # Cached tail (end record + central directory), then the member in two reads
+        assert len(scraper._session.ranges) == 3
+        assert scraper._session.ranges[0] == (len(body) - scraper.RANGE_BUFFER_SIZE, len(body) - 1)
+        assert sum(end - start + 1 for start, end in scraper._session.ranges) < len(body)
+    
+    @pytest.mark.parametrize("accept_ranges, honour_ranges", [("bytes", False), (None, True)])
+    def test_falls_back_to_full_download(self, accept_ranges, honour_ranges):
+        """Test that fetch_raw downloads the whole ZIP when range requests aren't usable."""
+        from src.scraper.dg_ecfin_scraper import DGECFINScraper
+        
+        scraper = DGECFINScraper()
+        scraper._session = self.FakeSession(self._zip_bytes(), accept_ranges, honour_ranges)
+        
+        with patch.object(scraper, "_read_monthly_sheet", return_value=pd.DataFrame()) as read_sheet:
+            raw_data = scraper.fetch_raw(scraper.ZIP_URL)
+        
+        assert scraper._session.full_downloads == 1
+        assert scraper._session.ranges == []
+        assert raw_data["excel_member"] == "main_indicators.xlsx"
+        read_sheet.assert_called_once_with(self.WORKBOOK)
+
+
+class TestDuneScraper:
+    """Tests for Dune result parsing."""
+    
+    def test_parse_rows_with_wide_integers(self):
+        """Test that integers wider than 64 bits fall back to an object column."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        df = scraper.parse_raw({"content": {"rows": [{"total_wei": 2**70, "n": 3}]}})
+        
+        assert df["total_wei"].iloc[0] == 2**70
+        assert df["n"].iloc[0] == 3
+    
+    def test_partial_field_mapping_requires_substring(self):
+        """Test that similar-looking but different columns are never renamed."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        scraper._rename_map = {"staked": "eth_staked", "deposit_count": "deposits"}
+        df = scraper.parse_raw({"content": {"rows": [{"eth_unstaked": 1.0, "depositors": 2}]}})
+        
+        assert list(df.columns) == ["eth_unstaked", "depositors"]
+    
+    def test_partial_field_mapping_picks_closest_substring_match(self):
+        """Test that the closest of several substring matches is renamed."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        scraper._rename_map = {"staked": "eth_staked"}
+        df = scraper.parse_raw({"content": {"rows": [{"total_eth_staked_usd_value": 1.0, "eth_staked_": 2.0}]}})
+        
+        assert list(df.columns) == ["total_eth_staked_usd_value", "staked"]
+    
+    def test_result_cache_written_only_after_live_fetch(self, tmp_path, monkeypatch):
+        """Test that scrape() caches fetched results and parse_raw alone never writes the cache."""
+        from src.scraper.dune_scraper import DuneScraper
+        from src.utils.config_manager import SiteConfig
+        
+        monkeypatch.setattr("src.utils.io_utils.OUTPUTS_DIR", tmp_path)
+        config = SiteConfig.from_dict({
+            "id": "dune_cache_test", "name": "Dune cache test", "base_url": "https://dune.com",
+            "page_url": "https://dune.com/queries/123", "extraction_strategy": "api_json",
+            "data_source": {"type": "api", "query_id": "123", "cache_ttl": 3600},
+        })
+        scraper = DuneScraper(config=config, api_key="x", use_sdk=False)
+        raw_data = {"type": "api_json", "content": {"rows": [{"v": 1.5}]}, "query_id": "123"}
+        
+        # Re-parsing a saved response doesn't populate the cache
+        scraper.parse_raw(raw_data)
+        assert scraper._load_cached_result("123") is None
+        
+        with patch.object(scraper, "check_compliance"), \
+                patch.object(scraper, "_fetch_query_results", return_value=raw_data) as fetch:
+            first = scraper.scrape(save_raw=False)
+            second = scraper.scrape(save_raw=False)
+        
+        assert fetch.call_count == 1
+        assert first.success and second.success
+        pd.testing.assert_frame_equal(first.data, second.data)
+    
+    @staticmethod
+    def _combined_row(rows_2361452, rows_2361448):
+        """Run the combined ETH staking fetch over stubbed query rows."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        results = {"2361452": rows_2361452, "2361448": rows_2361448}
+        with patch.object(scraper, "_fetch_single_query", side_effect=lambda query_id: {"content": {"rows": results[query_id]}}):
+            raw_data = scraper._fetch_combined_eth_staking()
+        return raw_data["content"]["df"].iloc[0].to_dict()
+    
+    def test_combined_eth_staking_wide_integer(self):
+        """Test that a wei total wider than 64 bits (an object column) is still picked up."""
+        row = self._combined_row([{"total_eth_deposited_wei": 2**70}], [{"validators": 5}])
+        
+        assert row["total_eth_deposited"] == 2**70
+    
+    def test_combined_eth_staking_keeps_int_values(self):
+        """Test that a column upcast to float by a null still yields the row's original int."""
+        row = self._combined_row(
+            [{"misc": 3, "amount": 2**70}],
+            [{"validators": 900000, "depositors": None}, {"validators": None, "depositors": 12}],
+        )
+        
+        assert row["total_eth_deposited"] == 2**70
+        assert type(row["total_validators"]) is int and row["total_validators"] == 900000
+        assert type(row["distinct_depositor_addresses"]) is int and row["distinct_depositor_addresses"] == 12
+    
+    @staticmethod
+    def _fake_clock():
+        """Stand-in for the time module whose sleep() advances monotonic()."""
+        clock = Mock()
+        clock.now = 1000.0
+        clock.monotonic.side_effect = lambda: clock.now
+        clock.time.side_effect = lambda: clock.now
+        
+        def sleep(seconds):
+            clock.now += seconds
+        
+        clock.sleep.side_effect = sleep
+        return clock
+    
+    @staticmethod
+    def _status_response(state, headers=None):
+        """Build a mocked execution status response."""
+        return Mock(content=json.dumps({"state": state}).encode(), headers=headers or {})
+    
+    def test_poll_delay_backs_off_with_jitter(self):
+        """Test that poll delays grow by POLL_BACKOFF up to poll_interval, plus bounded jitter."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        with patch("src.scraper.dune_scraper.random.uniform", return_value=0.0):
+            delays = [scraper._poll_delay(attempt, poll_interval=2) for attempt in range(10)]
+        
+        assert delays[:3] == pytest.approx([0.1, 0.15, 0.225])
+        assert delays == sorted(delays)
+        assert delays[-1] == 2
+        
+        jittered = scraper._poll_delay(0, poll_interval=2)
+        assert 0.1 <= jittered <= 0.1 + scraper.POLL_JITTER
+    
+    def test_poll_delay_honours_retry_after(self):
+        """Test that a Retry-After header wins over the backoff and a malformed one is ignored."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        
+        assert scraper._poll_delay(0, 2, headers={"Retry-After": "7"}) == 7.0
+        assert scraper._poll_delay(0, 2, headers={"Retry-After": "soon"}) <= 0.1 + scraper.POLL_JITTER
+    
+    def test_poll_query_status_normalizes_states(self):
+        """Test that QUERY_STATE_-prefixed states are recognized and polls back off."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        scraper._session = Mock()
+        scraper._session.get.side_effect = [
+            self._status_response("QUERY_STATE_PENDING"),
+            self._status_response("QUERY_STATE_EXECUTING", {"Retry-After": "3"}),
+            self._status_response("QUERY_STATE_COMPLETED"),
+        ]
+        clock = self._fake_clock()
+        
+        with patch("src.scraper.dune_scraper.time", clock), \
+                patch("src.scraper.dune_scraper.random.uniform", return_value=0.0):
+            data = scraper.poll_query_status("123", "exec-1", max_attempts=5, poll_interval=2)
+        
+        assert data == {"state": "QUERY_STATE_COMPLETED"}
+        assert [c.args[0] for c in clock.sleep.call_args_list] == pytest.approx([0.1, 3.0])
+    
+    def test_poll_query_status_raises_on_failed_state(self):
+        """Test that a failed execution raises instead of polling on."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        scraper._session = Mock()
+        scraper._session.get.return_value = self._status_response("QUERY_STATE_FAILED")
+        
+        with patch("src.scraper.dune_scraper.time", self._fake_clock()):
+            with pytest.raises(ValueError, match="failed"):
+                scraper.poll_query_status("123", "exec-1")
+        
+        assert scraper._session.get.call_count == 1
+    
+    def test_poll_query_status_stops_at_deadline(self):
+        """Test that polling never sleeps past max_attempts * poll_interval and then times out."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        scraper._session = Mock()
+        scraper._session.get.return_value = self._status_response("QUERY_STATE_EXECUTING")
+        clock = self._fake_clock()
+        start = clock.now
+        
+        with patch("src.scraper.dune_scraper.time", clock):
+            with pytest.raises(TimeoutError):
+                scraper.poll_query_status("123", "exec-1", max_attempts=3, poll_interval=2)
+        
+        assert clock.now - start == pytest.approx(6)
+        # One final poll once the deadline is reached
+        assert scraper._session.get.call_count == clock.sleep.call_count + 1
+    
+    def test_execution_id_persisted_across_instances(self, tmp_path, monkeypatch):
+        """Test that execution IDs are reused from disk within cache_ttl only."""
+        from src.scraper.dune_scraper import DuneScraper
+        from src.utils.config_manager import SiteConfig
+        
+        monkeypatch.setattr("src.utils.io_utils.OUTPUTS_DIR", tmp_path)
+        config = SiteConfig.from_dict({
+            "id": "dune_exec_test", "name": "Dune execution test", "base_url": "https://dune.com",
+            "page_url": "https://dune.com/queries/123", "extraction_strategy": "api_json",
+            "data_source": {"type": "api", "query_id": "123", "cache_ttl": 3600},
+        })
+        clock = self._fake_clock()
+        
+        with patch("src.scraper.dune_scraper.time", clock):
+            first = DuneScraper(config=config, api_key="x", use_sdk=False)
+            key = first._cache_key("123", {"days": 30})
+            first._set_cached_execution_id(key, "exec-1")
+            
+            assert DuneScraper(config=config, api_key="x", use_sdk=False)._get_cached_execution_id(key) == "exec-1"
+            assert first._cache_key("123", {"days": 7}) != key
+            
+            clock.now += 3601
+            assert DuneScraper(config=config, api_key="x", use_sdk=False)._get_cached_execution_id(key) is None
+        
+        config.data_source.force_refresh = True
+        assert first._get_cached_execution_id(key) is None
+    
+    def test_page_query_id_miss_is_memoized(self):
+        """Test that a page without a query ID isn't refetched until QUERY_ID_MISS_TTL passes."""
+        from src.scraper.dune_scraper import DuneScraper
+        
+        scraper = DuneScraper(api_key="x", use_sdk=False)
+        page = MagicMock(status_code=200, encoding="utf-8")
+        page.__enter__.return_value = page
+        page.iter_content.side_effect = lambda chunk_size: iter([b"<html>no id here</html>"])
+        scraper._session = Mock()
+        scraper._session.get.return_value = page
+        url = "https://dune.com/someone/some-dashboard"
+        clock = self._fake_clock()
+        
+        with patch("src.scraper.dune_scraper.time", clock):
+            assert scraper._extract_query_id_from_url(url) is None
+            assert scraper._extract_query_id_from_url(url) is None
+            assert scraper._session.get.call_count == 1
+            
+            clock.now += scraper.QUERY_ID_MISS_TTL
+            page.iter_content.side_effect = lambda chunk_size: iter([b'{"query_id": 4242}'])
+            assert scraper._extract_query_id_from_url(url) == "4242"
+            
+            # A found ID is kept regardless of age
+            clock.now += 10 * scraper.QUERY_ID_MISS_TTL
+            assert scraper._extract_query_id_from_url(url) == "4242"
+        
+        assert scraper._session.get.call_count == 2
+
+
 # Integration tests (marked for separate execution)
 class TestIntegration:
     """Integration tests for full workflows."""